@@ -1,99 +1,258 @@
-import networkx as nx
-from pyvis.network import Network
-
-def algoritmo_guloso_coloracao(grafo, ordenacao=None):
-    if ordenacao is None:
-        ordenacao = sorted(grafo.keys())
-
-    cores = {}
-    for vertice in ordenacao:
-        cores_vizinhos = {cores.get(vizinho) for vizinho in grafo[vertice] if vizinho in cores}
-        cor = 1
-        while cor in cores_vizinhos:
-            cor += 1
-        cores[vertice] = cor
-    return cores
-
-def visualizar_grafo_pyvis(grafo_dict, cores=None, filename="grafo_interativo.html", titulo="Grafo Interativo"):
-    # Cria um grafo NetworkX
-    G = nx.Graph()
-    for vertice, vizinhos in grafo_dict.items():
-        for vizinho in vizinhos:
-            G.add_edge(vertice, vizinho)
-
-    # Cria um objeto Network do Pyvis
-    nt = Network(height="800px", width="100%", notebook=True, heading=titulo)
-    nt.from_nx(G)
-
-    cores_visuais = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD']
-
-    if cores:
-        # Aplica as cores aos nós se a coloração for fornecida
-        for node in nt.nodes:
-            node_id = int(node['id'])
-            cor_numerica = cores.get(node_id, 0)
-            node['color'] = cores_visuais[(cor_numerica - 1) % len(cores_visuais)]
-            node['title'] = f"Vértice {node_id}\nCor: {cor_numerica}"
-            node['label'] = str(node_id)
-    else:
-        # Colore todos os nós de cinza se nenhuma coloração for fornecida
-        for node in nt.nodes:
-            node_id = int(node['id'])
-            node['color'] = 'lightgray'
-            node['title'] = f"Vértice {node['id']}"
-            node['label'] = str(node_id)
-
-    nt.save_graph(filename)
-    print(f"Grafo interativo salvo em: '{filename}'")
-
-def imprimir_resultado_coloracao(grafo, cores, nome_estrategia=""):
-    if nome_estrategia:
-        print(f"\n{'='*50}")
-        print(f"COLORAÇÃO USANDO ORDENAÇÃO {nome_estrategia.upper()}")
-        print(f"{'='*50}")
-
-    print("\nAtribuição de cores:")
-    print("-" * 20)
-    for vertice in sorted(cores.keys()):
-        print(f"Vértice {vertice:2d} : Cor {cores[vertice]}")
-
-    num_cores = max(cores.values())
-    print(f"\nNúmero de cores necessárias: {num_cores}")
-
-    valido = all(cores[v] != cores[vizinho] for v, vizinhos in grafo.items() for vizinho in vizinhos)
-    if valido:
-        print("A coloração é VÁLIDA!")
-    else:
-        print("A coloração é INVÁLIDA!")
-
-def main():
-    grafo = {
-        8: [10, 9, 0], 10: [8, 11, 3], 9: [8, 4, 11], 11: [10, 7, 9],
-        0: [8, 1, 3, 4], 3: [10, 2, 7, 0], 4: [9, 0, 5, 7], 7: [11, 4, 6, 3],
-        1: [0, 12, 2, 5], 2: [1, 3, 14, 6], 5: [1, 4, 13, 6], 6: [7, 5, 15, 2],
-        12: [1, 13, 14], 13: [12, 15, 5], 14: [12, 2, 15], 15: [14, 13, 6]
-    }
-
-    print("=" * 60)
-    print("ANÁLISE DE COLORAÇÃO DE GRAFOS COM PYVIS")
-    print("=" * 60)
-
-    print("\n1. Gerando grafo inicial interativo...")
-    visualizar_grafo_pyvis(grafo, 
-                           filename="Q1_grafo_inicial_interativo.html", 
-                           titulo="Grafo Inicial - Sem Coloracao (Interativo)")
-
-    cores_natural = algoritmo_guloso_coloracao(grafo)
-    imprimir_resultado_coloracao(grafo, cores_natural, "natural")
-
-    print("\n2. Gerando grafo final interativo (colorido)...")
-    visualizar_grafo_pyvis(grafo, cores=cores_natural, 
-                           filename="Q1_grafo_final_colorido_interativo.html", 
-                           titulo="Grafo Final - Coloracao Aplicada (Interativo)")
-
-    print("\n" + "="*60)
-    print("Execução concluída. Abra os arquivos .html gerados em seu navegador.")
-    print("="*60)
-
-if __name__ == "__main__":
-    main()
+import os
+import sys
+from array import array
+from pyvis.network import Network
+
+# Permite importar o pacote compartilhado grafos/ ao executar o script diretamente
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from grafos import Grafo, instrumentacao
+from grafos.exportacao import LIMITE_PYVIS, exportar
+
+def colorir_csr(inicios, vizinhos, ordem):
+    # Coloração gulosa sobre arrays: cores[v] == 0 significa "sem cor". A marca
+    # de cores proibidas é reaproveitada entre vértices (carimbo = passo atual)
+    n = len(inicios) - 1
+    cores = array('q', bytes(8 * n))
+    proibida = array('q', [-1]) * (n + 2)
+
+    for passo, v in enumerate(ordem):
+        for k in range(inicios[v], inicios[v + 1]):
+            proibida[cores[vizinhos[k]]] = passo
+        cor = 1
+        while proibida[cor] == passo:
+            cor += 1
+        cores[v] = cor
+
+    # Cada vértice testou exatamente as cores 1..cores[v]
+    if instrumentacao.ligada():
+        instrumentacao.registrar('coloracao_gulosa', vertices=len(ordem),
+                                 arestas_varridas=sum(inicios[v + 1] - inicios[v] for v in ordem),
+                                 cores_testadas=sum(cores[v] for v in ordem))
+    return cores
+
+def ordem_maior_grau(inicios):
+    # Largest-first: vértices em ordem decrescente de grau
+    n = len(inicios) - 1
+    return sorted(range(n), key=lambda v: inicios[v] - inicios[v + 1])
+
+def ordem_menor_ultimo(inicios, vizinhos):
+    # Smallest-last (ordem de degeneração): remove repetidamente o vértice de
+    # menor grau restante usando baldes por grau, em O(V + E)
+    n = len(inicios) - 1
+    grau = array('q', (inicios[v + 1] - inicios[v] for v in range(n)))
+    baldes = [set() for _ in range(max(grau, default=0) + 1)]
+    for v in range(n):
+        baldes[grau[v]].add(v)
+
+    removido = bytearray(n)
+    ordem = []
+    menor = 0
+    for _ in range(n):
+        while not baldes[menor]:
+            menor += 1
+        v = baldes[menor].pop()
+        removido[v] = 1
+        ordem.append(v)
+        for k in range(inicios[v], inicios[v + 1]):
+            w = vizinhos[k]
+            if not removido[w]:
+                baldes[grau[w]].discard(w)
+                grau[w] -= 1
+                baldes[grau[w]].add(w)
+                # Com arestas paralelas o grau de w pode cair mais de 1 por remoção
+                menor = min(menor, grau[w])
+
+    instrumentacao.registrar('menor_ultimo', vertices=n, arestas_varridas=inicios[n])
+    ordem.reverse()
+    return ordem
+
+def dsatur_csr(inicios, vizinhos):
+    # DSatur: colore sempre o vértice com mais cores distintas na vizinhança.
+    # A fila de prioridade é um array de baldes indexado pela saturação, que
+    # nunca passa do grau máximo. O conjunto de cores vizinhas de um vértice
+    # só é criado quando um vizinho recebe cor, e é descartado quando o
+    # próprio vértice é colorido
+    n = len(inicios) - 1
+    grau_maximo = max((inicios[v + 1] - inicios[v] for v in range(n)), default=0)
+    cores = array('q', bytes(8 * n))
+    proibida = array('q', [-1]) * (grau_maximo + 2)
+    cores_vizinhas = [None] * n
+    baldes = [set(range(n))] + [set() for _ in range(grau_maximo)]
+    maior = 0
+    aumentos = 0
+
+    for passo in range(n):
+        while not baldes[maior]:
+            maior -= 1
+        v = baldes[maior].pop()
+        cores_vizinhas[v] = None
+
+        for k in range(inicios[v], inicios[v + 1]):
+            proibida[cores[vizinhos[k]]] = passo
+        cor = 1
+        while proibida[cor] == passo:
+            cor += 1
+        cores[v] = cor
+
+        for k in range(inicios[v], inicios[v + 1]):
+            w = vizinhos[k]
+            if cores[w]:
+                continue
+            vizinhas = cores_vizinhas[w]
+            if vizinhas is None:
+                vizinhas = cores_vizinhas[w] = set()
+            elif cor in vizinhas:
+                continue
+            saturacao = len(vizinhas)
+            baldes[saturacao].discard(w)
+            baldes[saturacao + 1].add(w)
+            vizinhas.add(cor)
+            aumentos += 1
+            maior = max(maior, saturacao + 1)
+
+    # Os vizinhos de cada vértice são percorridos duas vezes (proibir cores e saturar)
+    instrumentacao.registrar('dsatur', vertices=n, arestas_varridas=2 * inicios[n], aumentos_saturacao=aumentos)
+    return cores
+
+ESTRATEGIAS_ORDENACAO = ('natural', 'maior_grau', 'menor_ultimo', 'dsatur')
+
+def algoritmo_guloso_coloracao(grafo, ordenacao=None):
+    # grafo: dict de listas ou Grafo do núcleo compartilhado.
+    # ordenacao: lista explícita de vértices ou o nome de uma das ESTRATEGIAS_ORDENACAO
+    if ordenacao is None:
+        ordenacao = 'natural'
+
+    if isinstance(grafo, Grafo):
+        nucleo, chaves = grafo, grafo.rotulos
+    else:
+        nucleo, chaves = Grafo.de_listas(grafo), grafo.keys()
+    vertices, indice, inicios, vizinhos = nucleo.rotulos, nucleo.indice, nucleo.inicios, nucleo.destinos
+
+    if ordenacao == 'dsatur':
+        cores = dsatur_csr(inicios, vizinhos)
+        return {vertices[i]: cores[i] for i in range(len(vertices))}
+
+    if ordenacao == 'natural':
+        ordem = [indice[v] for v in sorted(chaves)]
+    elif ordenacao == 'maior_grau':
+        ordem = ordem_maior_grau(inicios)
+    elif ordenacao == 'menor_ultimo':
+        ordem = ordem_menor_ultimo(inicios, vizinhos)
+    elif isinstance(ordenacao, str):
+        raise ValueError(f"Estratégia de ordenação desconhecida: '{ordenacao}'")
+    else:
+        ordem = [indice[v] for v in ordenacao]
+
+    cores = colorir_csr(inicios, vizinhos, ordem)
+    return {vertices[i]: cores[i] for i in ordem}
+
+def _simetrizar(grafo_dict):
+    # Acrescenta o sentido inverso das arestas guardadas em um só sentido,
+    # para que Grafo.arestas() (que devolve só os pares u < v) veja todas
+    simetrico = {vertice: dict.fromkeys(vizinhos) for vertice, vizinhos in grafo_dict.items()}
+    for vertice, vizinhos in grafo_dict.items():
+        for vizinho in vizinhos:
+            simetrico.setdefault(vizinho, {})[vertice] = None
+    return {vertice: list(vizinhos) for vertice, vizinhos in simetrico.items()}
+
+def visualizar_grafo_pyvis(grafo_dict, cores=None, filename="grafo_interativo.html", titulo="Grafo Interativo"):
+    nucleo = Grafo.de_listas(_simetrizar(grafo_dict))
+    cores_visuais = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD']
+
+    def estilo(vertice):
+        if cores:
+            # Aplica as cores aos nós se a coloração for fornecida
+            cor_numerica = cores.get(vertice, 0)
+            return {'color': cores_visuais[(cor_numerica - 1) % len(cores_visuais)],
+                    'title': f"Vértice {vertice}\nCor: {cor_numerica}"}
+        # Colore todos os nós de cinza se nenhuma coloração for fornecida
+        return {'color': 'lightgray', 'title': f"Vértice {vertice}"}
+
+    if nucleo.num_vertices > LIMITE_PYVIS:
+        # Grafo grande: exporta em streaming só uma amostra dos vértices
+        exportar(nucleo, filename, titulo, atributos_no=lambda v: estilo(nucleo.rotulos[v]), max_nos=LIMITE_PYVIS)
+        print(f"Grafo interativo (amostra de {LIMITE_PYVIS} vértices) salvo em: '{filename}'")
+        return
+
+    # Cria um objeto Network do Pyvis
+    nt = Network(height="800px", width="100%", notebook=True, heading=titulo)
+    for vertice in nucleo.rotulos:
+        nt.add_node(vertice, label=str(vertice), **estilo(vertice))
+    for u, v, _ in nucleo.arestas():
+        nt.add_edge(nucleo.rotulos[u], nucleo.rotulos[v])
+
+    nt.save_graph(filename)
+    print(f"Grafo interativo salvo em: '{filename}'")
+
+def coloracao_valida(grafo, cores):
+    if isinstance(grafo, Grafo):
+        # Todos os pares guardados em cada linha, inclusive os que só existem
+        # no sentido u -> v com u > v
+        inicios, destinos = grafo.inicios, grafo.destinos
+        cor = [cores[rotulo] for rotulo in grafo.rotulos]
+        return all(cor[u] != cor[v] for u in range(grafo.num_vertices) for v in destinos[inicios[u]:inicios[u + 1]])
+    return all(cores[v] != cores[vizinho] for v, vizinhos in grafo.items() for vizinho in vizinhos)
+
+def imprimir_resultado_coloracao(grafo, cores, nome_estrategia=""):
+    if nome_estrategia:
+        print(f"\n{'='*50}")
+        print(f"COLORAÇÃO USANDO ORDENAÇÃO {nome_estrategia.upper()}")
+        print(f"{'='*50}")
+
+    print("\nAtribuição de cores:")
+    print("-" * 20)
+    for vertice in sorted(cores.keys()):
+        print(f"Vértice {vertice:2d} : Cor {cores[vertice]}")
+
+    num_cores = max(cores.values())
+    print(f"\nNúmero de cores necessárias: {num_cores}")
+
+    if coloracao_valida(grafo, cores):
+        print("A coloração é VÁLIDA!")
+    else:
+        print("A coloração é INVÁLIDA!")
+
+def main():
+    grafo = {
+        8: [10, 9, 0], 10: [8, 11, 3], 9: [8, 4, 11], 11: [10, 7, 9],
+        0: [8, 1, 3, 4], 3: [10, 2, 7, 0], 4: [9, 0, 5, 7], 7: [11, 4, 6, 3],
+        1: [0, 12, 2, 5], 2: [1, 3, 14, 6], 5: [1, 4, 13, 6], 6: [7, 5, 15, 2],
+        12: [1, 13, 14], 13: [12, 15, 5], 14: [12, 2, 15], 15: [14, 13, 6]
+    }
+
+    print("=" * 60)
+    print("ANÁLISE DE COLORAÇÃO DE GRAFOS COM PYVIS")
+    print("=" * 60)
+
+    print("\n1. Gerando grafo inicial interativo...")
+    with instrumentacao.fase('renderizacao'):
+        visualizar_grafo_pyvis(grafo,
+                               filename="Q1_grafo_inicial_interativo.html",
+                               titulo="Grafo Inicial - Sem Coloracao (Interativo)")
+
+    with instrumentacao.fase('construcao'):
+        nucleo = Grafo.de_listas(grafo)
+
+    with instrumentacao.fase('solucao'):
+        cores_natural = algoritmo_guloso_coloracao(nucleo)
+    imprimir_resultado_coloracao(grafo, cores_natural, "natural")
+
+    for estrategia in ESTRATEGIAS_ORDENACAO[1:]:
+        with instrumentacao.fase('solucao'):
+            cores = algoritmo_guloso_coloracao(nucleo, estrategia)
+        imprimir_resultado_coloracao(grafo, cores, estrategia.replace('_', ' '))
+
+    print("\n2. Gerando grafo final interativo (colorido)...")
+    with instrumentacao.fase('renderizacao'):
+        visualizar_grafo_pyvis(grafo, cores=cores_natural,
+                               filename="Q1_grafo_final_colorido_interativo.html",
+                               titulo="Grafo Final - Coloracao Aplicada (Interativo)")
+
+    print("\n" + "="*60)
+    print("Execução concluída. Abra os arquivos .html gerados em seu navegador.")
+    print("="*60)
+
+if __name__ == "__main__":
+    # python Q1.py [--profile]
+    with instrumentacao.perfilar_se_pedido():
+        main()
@@ -0,0 +1,34 @@
+import random
+import sys
+import time
+
+from Q1 import ESTRATEGIAS_ORDENACAO, algoritmo_guloso_coloracao
+
+def gerar_grafo(n, grau_medio=8, semente=0):
+    # Grafo aleatório (Erdős–Rényi com número fixo de arestas) no formato dict de listas
+    rng = random.Random(semente)
+    grafo = {v: [] for v in range(n)}
+    for _ in range(n * grau_medio // 2):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            grafo[u].append(v)
+            grafo[v].append(u)
+    return grafo
+
+def main():
+    # Uso: python benchmark_coloracao.py [maior_tamanho]
+    maior = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tamanhos = [n for n in (1_000, 10_000, 100_000, 1_000_000) if n <= maior]
+
+    print(f"{'vértices':>10} {'estratégia':>14} {'cores':>6} {'tempo':>10}")
+    for n in tamanhos:
+        grafo = gerar_grafo(n)
+        for estrategia in ESTRATEGIAS_ORDENACAO:
+            inicio = time.perf_counter()
+            cores = algoritmo_guloso_coloracao(grafo, estrategia)
+            tempo = time.perf_counter() - inicio
+            assert all(cores[v] != cores[w] for v, vizinhos in grafo.items() for w in vizinhos)
+            print(f"{n:>10} {estrategia:>14} {max(cores.values()):>6} {tempo:>9.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from Q1 import Grafo, _simetrizar, coloracao_valida
+
+# Estado de cada processo trabalhador, preenchido uma única vez pelo inicializador
+_compartilhado = {}
+
+def _criar_bloco(dados):
+    bloco = shared_memory.SharedMemory(create=True, size=max(len(dados), 1) * 8)
+    visao = bloco.buf.cast('q')
+    visao[:len(dados)] = dados
+    visao.release()
+    return bloco
+
+def _iniciar_trabalhador(nomes):
+    # Anexa a adjacência e o vetor de cores compartilhados, sem copiá-los
+    blocos = [shared_memory.SharedMemory(name=nome, track=False) for nome in nomes]
+    inicios, vizinhos, cores = (bloco.buf.cast('q') for bloco in blocos)
+    _compartilhado.update(blocos=blocos, inicios=inicios, vizinhos=vizinhos, cores=cores,
+                          proibida=array('q', [-1]) * (len(inicios) + 1), carimbo=0)
+
+def _colorir_fatia(fatia):
+    # Fase especulativa: colore a fatia lendo as cores atuais dos vizinhos,
+    # que outros processos podem estar alterando ao mesmo tempo
+    inicios, vizinhos, cores = _compartilhado['inicios'], _compartilhado['vizinhos'], _compartilhado['cores']
+    proibida = _compartilhado['proibida']
+    carimbo = _compartilhado['carimbo']
+
+    for v in fatia:
+        carimbo += 1
+        for k in range(inicios[v], inicios[v + 1]):
+            proibida[cores[vizinhos[k]]] = carimbo
+        cor = 1
+        while proibida[cor] == carimbo:
+            cor += 1
+        cores[v] = cor
+
+    _compartilhado['carimbo'] = carimbo
+
+def _detectar_conflitos(fatia):
+    # Numa aresta com as duas pontas da mesma cor, recolore a de maior índice
+    inicios, vizinhos, cores = _compartilhado['inicios'], _compartilhado['vizinhos'], _compartilhado['cores']
+    conflitos = []
+    for v in fatia:
+        cor = cores[v]
+        for k in range(inicios[v], inicios[v + 1]):
+            w = vizinhos[k]
+            if w < v and cores[w] == cor:
+                conflitos.append(v)
+                break
+    return conflitos
+
+def _fatiar(pendentes, partes):
+    tamanho = -(-len(pendentes) // partes)
+    return [pendentes[i:i + tamanho] for i in range(0, len(pendentes), tamanho)]
+
+def colorir_paralelo(grafo, trabalhadores=4):
+    # Coloração especulativa (Gebremedhin–Manne): cada rodada colore as partições
+    # em paralelo e recolore apenas os vértices que ficaram em conflito.
+    # Devolve (cores, rodadas) com cores no mesmo formato de algoritmo_guloso_coloracao
+    # Adjacência simétrica: a detecção de conflitos só olha a linha de cada
+    # vértice, então uma aresta guardada em um só sentido passaria despercebida
+    nucleo = Grafo.de_listas(_simetrizar(grafo))
+    vertices = nucleo.rotulos
+    n = len(vertices)
+    blocos = [_criar_bloco(nucleo.inicios), _criar_bloco(nucleo.destinos), _criar_bloco(array('q', bytes(8 * n)))]
+    rodadas = 0
+
+    try:
+        with ProcessPoolExecutor(trabalhadores, initializer=_iniciar_trabalhador,
+                                 initargs=([bloco.name for bloco in blocos],)) as executor:
+            pendentes = range(n)
+            while pendentes:
+                rodadas += 1
+                fatias = _fatiar(pendentes, trabalhadores)
+                list(executor.map(_colorir_fatia, fatias))
+                pendentes = sorted(v for conflitos in executor.map(_detectar_conflitos, fatias) for v in conflitos)
+
+        visao = blocos[2].buf.cast('q')
+        cores = {vertices[i]: visao[i] for i in range(n)}
+        visao.release()
+    finally:
+        for bloco in blocos:
+            bloco.close()
+            bloco.unlink()
+
+    if not coloracao_valida(grafo, cores):
+        raise RuntimeError("A coloração paralela produziu um resultado INVÁLIDO")
+    return cores, rodadas
+
+def main():
+    # Uso: python coloracao_paralela.py [num_vertices]
+    from benchmark_coloracao import gerar_grafo
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    grafo = gerar_grafo(n)
+
+    print(f"{'processos':>10} {'rodadas':>8} {'cores':>6} {'tempo':>10} {'speedup':>8}")
+    base = None
+    for trabalhadores in (1, 2, 4, 8):
+        inicio = time.perf_counter()
+        cores, rodadas = colorir_paralelo(grafo, trabalhadores)
+        tempo = time.perf_counter() - inicio
+        base = base or tempo
+        print(f"{trabalhadores:>10} {rodadas:>8} {max(cores.values()):>6} {tempo:>9.3f}s {base / tempo:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -1,128 +1,429 @@
-import csv
-import heapq
-from collections import defaultdict
-from pyvis.network import Network
-
-def ler_matriz_csv(arquivo):
-    try:
-        with open(arquivo, 'r', encoding='utf-8') as f:
-            leitor = csv.reader(f)
-            linhas = list(leitor)
-
-        if not linhas:
-            return [], None
-
-        # Detecta se a primeira linha é um cabeçalho de nomes de vértices
-        if linhas[0][0] == '':
-            nomes_vertices = linhas[0][1:]
-            matriz_dados = [linha[1:] for linha in linhas[1:]]
-        else:
-            nomes_vertices = [str(i) for i in range(len(linhas))]
-            matriz_dados = linhas
-
-        matriz = []
-        for linha in matriz_dados:
-            linha_numerica = [float(val) if val else 0 for val in linha]
-            matriz.append(linha_numerica)
-
-        return matriz, nomes_vertices
-    except FileNotFoundError:
-        print(f"Erro: O arquivo '{arquivo}' não foi encontrado.")
-        return None, None
-    except Exception as e:
-        print(f"Erro ao ler o arquivo CSV: {e}")
-        return None, None
-
-def prim(matriz):
-    if not matriz:
-        return []
-
-    n = len(matriz)
-    grafo = defaultdict(list)
-    for i in range(n):
-        for j in range(n):
-            if matriz[i][j] > 0:
-                grafo[i].append((j, matriz[i][j]))
-
-    visitado = [False] * n
-    mst = []
-    heap = [(0, 0, -1)]
-
-    while heap:
-        peso, u, pai = heapq.heappop(heap)
-        if visitado[u]:
-            continue
-
-        visitado[u] = True
-        if pai != -1:
-            mst.append((pai, u, peso))
-
-        for v, peso_aresta in grafo[u]:
-            if not visitado[v]:
-                heapq.heappush(heap, (peso_aresta, v, u))
-
-    return mst
-
-def visualizar_mst_pyvis(matriz, mst_edges, nomes_vertices, filename="mst_interativa.html"):
-    n = len(matriz)
-    nt = Network(height="800px", width="100%", notebook=True, heading="Arvore Geradora de Custo Minimo (MST)")
-
-    # Cria um conjunto de arestas da MST para busca rápida
-    mst_set = set()
-    for u, v, _ in mst_edges:
-        mst_set.add(tuple(sorted((u, v))))
-
-    # Adiciona os nós
-    for i, nome in enumerate(nomes_vertices):
-        nt.add_node(i, label=nome, title=f"Vértice {nome}")
-
-    # Adiciona todas as arestas do grafo original, diferenciando as da MST
-    for i in range(n):
-        for j in range(i + 1, n):
-            peso = matriz[i][j]
-            if peso > 0:
-                is_in_mst = tuple(sorted((i, j))) in mst_set
-
-                if is_in_mst:
-                    # Aresta pertence à MST: destaque
-                    nt.add_edge(i, j, value=peso, title=f"Peso: {peso} (MST)", color='black', label=str(peso))
-                else:
-                    # Aresta não pertence à MST: sutil
-                    nt.add_edge(i, j, value=peso, title=f"Peso: {peso}", color='white')
-
-    nt.save_graph(filename)
-    print(f"\nGrafo interativo com MST destacada salvo em: '{filename}'")
-
-def exibir_mst_console(mst, nomes_vertices):
-    print("\n" + "="*50)
-    print("ÁRVORE GERADORA DE CUSTO MÍNIMO (MST) - RESULTADOS")
-    print("="*50)
-
-    if not mst:
-        print("Nenhuma árvore geradora pôde ser encontrada (o grafo pode estar vazio ou desconectado).")
-        return
-
-    total_cost = 0
-    for u, v, peso in sorted(mst, key=lambda x: x[2]):
-        print(f"Aresta: {nomes_vertices[u]:<5} -- {nomes_vertices[v]:<5} | Custo: {peso}")
-        total_cost += peso
-
-    print(f"\nCusto Total da MST: {total_cost}")
-    print("="*50)
-
-def main():
-    csv_filename= input("Digite o caminho para o arquivo CSV: ")
-    print(f"Tentando ler o grafo do arquivo: '{csv_filename}'")
-
-    matriz, nomes_vertices = ler_matriz_csv(csv_filename)
-
-    if matriz is None:
-        print("\nExecução interrompida devido a erro na leitura do arquivo.")
-        return
-
-    mst = prim(matriz)
-    exibir_mst_console(mst, nomes_vertices)
-    visualizar_mst_pyvis(matriz, mst, nomes_vertices, filename="Q2_mst_interativa.html")
-
-if __name__ == "__main__":
-    main()
+import csv
+import itertools
+import os
+import sys
+from array import array
+from pyvis.network import Network
+
+# Permite importar o pacote compartilhado grafos/ ao executar o script diretamente
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from grafos import Grafo, HeapIndexado, instrumentacao
+from grafos.binario import carregar_binario, salvar_binario
+from grafos.exportacao import LIMITE_PYVIS, exportar
+
+def _eh_numero(valor):
+    try:
+        float(valor)
+        return True
+    except ValueError:
+        return False
+
+def _encadear(primeira, leitor):
+    yield primeira
+    yield from leitor
+
+def _ler_linhas_matriz(leitor, primeira):
+    # Lê a matriz linha a linha, guardando apenas as entradas não nulas
+    inicios, destinos, pesos = array('q', [0]), array('q'), array('d')
+    nomes_vertices = None
+    linhas = leitor
+    if primeira[0] == '':
+        nomes_vertices = primeira[1:]
+    else:
+        linhas = _encadear(primeira, leitor)
+
+    # A matriz tem de ser quadrada: sem cabeçalho, a largura da primeira
+    # linha dá o número de vértices
+    n = len(nomes_vertices) if nomes_vertices is not None else None
+    for linha in linhas:
+        if not linha:
+            continue
+        if nomes_vertices is not None:
+            linha = linha[1:]
+        if n is None:
+            n = len(linha)
+        if len(linha) != n:
+            raise ValueError(f"A matriz de adjacência não é quadrada: a linha {len(inicios)} tem "
+                             f"{len(linha)} colunas, esperadas {n}")
+        for j, val in enumerate(linha):
+            if val and float(val) > 0:
+                destinos.append(j)
+                pesos.append(float(val))
+        inicios.append(len(destinos))
+
+    if n is not None and len(inicios) - 1 != n:
+        raise ValueError(f"A matriz de adjacência não é quadrada: {len(inicios) - 1} linhas e {n} colunas")
+    if nomes_vertices is None:
+        nomes_vertices = [str(i) for i in range(len(inicios) - 1)]
+    return Grafo(nomes_vertices, inicios, destinos, pesos), nomes_vertices
+
+def _ler_linhas_arestas(leitor, primeira):
+    # Lista de arestas "u,v,peso"; os rótulos são convertidos em índices densos
+    indices = {}
+    origens, destinos, pesos = array('q'), array('q'), array('d')
+    linhas = leitor if not _eh_numero(primeira[2]) else _encadear(primeira, leitor)
+
+    for linha in linhas:
+        if not linha:
+            continue
+        u = indices.setdefault(linha[0].strip(), len(indices))
+        v = indices.setdefault(linha[1].strip(), len(indices))
+        origens.append(u)
+        destinos.append(v)
+        pesos.append(float(linha[2]))
+
+    grafo = Grafo.de_arestas(list(indices), origens, destinos, pesos)
+    return grafo, grafo.rotulos
+
+def ler_grafo_csv(arquivo, formato='auto'):
+    # formato: 'matriz' (matriz de adjacência), 'arestas' (linhas u,v,peso) ou
+    # 'auto', que trata como lista de arestas um arquivo de 3 colunas com
+    # cabeçalho ou com um número de linhas diferente de 3 (uma matriz de 3
+    # colunas teria 3 linhas). Um arquivo 3 × 3 sem cabeçalho é lido como
+    # matriz; para lê-lo como lista de arestas, use formato='arestas'
+    try:
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            leitor = csv.reader(f)
+            primeira = next(leitor, None)
+
+            if primeira is None:
+                return Grafo([], array('q', [0]), array('q'), array('d')), []
+
+            if formato == 'auto':
+                formato = 'matriz'
+                if len(primeira) == 3 and primeira[0] != '':
+                    # Uma linha de matriz só tem números; rótulos ou cabeçalho
+                    # em qualquer coluna indicam uma lista de arestas
+                    if not all(_eh_numero(campo) for campo in primeira):
+                        formato = 'arestas'
+                    else:
+                        # Tudo numérico: só as próximas 3 linhas não vazias são lidas antes de decidir
+                        seguintes = list(itertools.islice((linha for linha in leitor if linha), 3))
+                        leitor = itertools.chain(seguintes, leitor)
+                        if len(seguintes) != 2:
+                            formato = 'arestas'
+
+            if formato == 'arestas':
+                return _ler_linhas_arestas(leitor, primeira)
+            return _ler_linhas_matriz(leitor, primeira)
+    except FileNotFoundError:
+        print(f"Erro: O arquivo '{arquivo}' não foi encontrado.")
+        return None, None
+    except Exception as e:
+        print(f"Erro ao ler o arquivo CSV: {e}")
+        return None, None
+
+def converter_csv_para_binario(arquivo_csv, arquivo_binario, formato='auto'):
+    # Grava o grafo do CSV no formato binário, que depois carrega sem parsing (carregar_binario)
+    grafo, _ = ler_grafo_csv(arquivo_csv, formato)
+    if grafo is None:
+        return False
+    salvar_binario(grafo, arquivo_binario)
+    return True
+
+def ler_matriz_csv(arquivo):
+    try:
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            leitor = csv.reader(f)
+            linhas = list(leitor)
+
+        if not linhas:
+            return [], None
+
+        # Detecta se a primeira linha é um cabeçalho de nomes de vértices
+        if linhas[0][0] == '':
+            nomes_vertices = linhas[0][1:]
+            matriz_dados = [linha[1:] for linha in linhas[1:]]
+        else:
+            nomes_vertices = [str(i) for i in range(len(linhas))]
+            matriz_dados = linhas
+
+        matriz = []
+        for linha in matriz_dados:
+            linha_numerica = [float(val) if val else 0 for val in linha]
+            matriz.append(linha_numerica)
+
+        return matriz, nomes_vertices
+    except FileNotFoundError:
+        print(f"Erro: O arquivo '{arquivo}' não foi encontrado.")
+        return None, None
+    except Exception as e:
+        print(f"Erro ao ler o arquivo CSV: {e}")
+        return None, None
+
+# Acima desta fração de arestas possíveis, a varredura O(n²) vence o heap
+LIMIAR_DENSIDADE_PRIM = 0.25
+
+def _prim_heap(grafo):
+    n = grafo.num_vertices
+    inicios, destinos, pesos = grafo.inicios, grafo.destinos, grafo.pesos
+    visitado = bytearray(n)
+    pai = array('q', [-1]) * n
+    heap = HeapIndexado(n)
+    mst = []
+    componentes = relaxacoes = 0
+
+    # Reinicia a partir de cada vértice ainda não visitado, cobrindo todos os componentes
+    for raiz in range(n):
+        if visitado[raiz]:
+            continue
+        componentes += 1
+        heap.diminuir_chave(raiz, 0.0)
+
+        while heap:
+            u, peso = heap.extrair_min()
+            visitado[u] = 1
+            if pai[u] != -1:
+                mst.append((pai[u], u, peso))
+
+            for k in range(inicios[u], inicios[u + 1]):
+                v = destinos[k]
+                if not visitado[v] and heap.diminuir_chave(v, pesos[k]):
+                    pai[v] = u
+                    relaxacoes += 1
+
+    # Todo vértice entra e sai do heap uma vez; as demais relaxações são diminuições de chave
+    instrumentacao.registrar('prim_heap', extracoes_heap=n, insercoes_heap=n,
+                             diminuicoes_chave=relaxacoes + componentes - n,
+                             arestas_varridas=grafo.num_arestas, componentes=componentes)
+    return mst
+
+def _prim_denso(grafo):
+    # Variante de Prim em arrays: a cada passo escolhe o vértice de menor
+    # chave por varredura linear, sem nenhuma estrutura de fila
+    n = grafo.num_vertices
+    inicios, destinos, pesos = grafo.inicios, grafo.destinos, grafo.pesos
+    infinito = float('infinity')
+    chave = [infinito] * n
+    pai = [-1] * n
+    visitado = bytearray(n)
+    restantes = list(range(n))
+    chave[0] = 0
+    mst = []
+    relaxacoes = 0
+
+    while restantes:
+        u = min(restantes, key=chave.__getitem__)
+        restantes.remove(u)
+
+        # Um vértice sem pai (chave infinita) inicia um novo componente da floresta
+        visitado[u] = 1
+        if pai[u] != -1:
+            mst.append((pai[u], u, chave[u]))
+
+        for k in range(inicios[u], inicios[u + 1]):
+            v = destinos[k]
+            if not visitado[v] and pesos[k] < chave[v]:
+                chave[v] = pesos[k]
+                pai[v] = u
+                relaxacoes += 1
+
+    # A escolha do mínimo varre os n, n - 1, ..., 1 vértices restantes
+    instrumentacao.registrar('prim_denso', chaves_comparadas=n * (n + 1) // 2, relaxacoes=relaxacoes,
+                             arestas_varridas=grafo.num_arestas)
+    return mst
+
+def prim(matriz, estrategia='auto'):
+    # estrategia: 'heap' (heap indexado), 'denso' (varredura O(n²)) ou 'auto'
+    if not matriz:
+        return []
+
+    grafo = matriz if isinstance(matriz, Grafo) else Grafo.de_matriz(matriz)
+    n = grafo.num_vertices
+    if n == 0:
+        return []
+
+    if estrategia == 'auto':
+        densidade = grafo.num_arestas / (n * (n - 1)) if n > 1 else 0
+        estrategia = 'denso' if densidade >= LIMIAR_DENSIDADE_PRIM else 'heap'
+
+    if estrategia == 'denso':
+        return _prim_denso(grafo)
+    return _prim_heap(grafo)
+
+class UniaoBusca:
+    # Conjuntos disjuntos com compressão de caminho e união por posto
+    __slots__ = ('pai', 'posto')
+
+    def __init__(self, n):
+        self.pai = array('q', range(n))
+        self.posto = bytearray(n)
+
+    def encontrar(self, x):
+        pai = self.pai
+        raiz = x
+        while pai[raiz] != raiz:
+            raiz = pai[raiz]
+        while pai[x] != raiz:
+            pai[x], x = raiz, pai[x]
+        return raiz
+
+    def unir(self, a, b):
+        # Devolve False se a e b já estavam no mesmo conjunto
+        a, b = self.encontrar(a), self.encontrar(b)
+        if a == b:
+            return False
+        if self.posto[a] < self.posto[b]:
+            a, b = b, a
+        self.pai[b] = a
+        if self.posto[a] == self.posto[b]:
+            self.posto[a] += 1
+        return True
+
+def arestas_ordenadas(grafo):
+    # Arrays (origens, destinos, pesos) das arestas não direcionadas, em ordem crescente de peso
+    origens, destinos, pesos = array('q'), array('q'), array('d')
+    for u, v, peso in grafo.arestas():
+        origens.append(u)
+        destinos.append(v)
+        pesos.append(peso)
+    ordem = sorted(range(len(pesos)), key=pesos.__getitem__)
+    return (array('q', (origens[k] for k in ordem)),
+            array('q', (destinos[k] for k in ordem)),
+            array('d', (pesos[k] for k in ordem)))
+
+def kruskal(n, origens, destinos, pesos):
+    # Recebe as arestas já ordenadas por peso; devolve a floresta geradora mínima
+    conjuntos = UniaoBusca(n)
+    mst = []
+    examinadas = 0
+    for u, v, peso in zip(origens, destinos, pesos):
+        examinadas += 1
+        if conjuntos.unir(u, v):
+            mst.append((u, v, peso))
+            if len(mst) == n - 1:
+                break
+    instrumentacao.registrar('kruskal', arestas_ordenadas=len(pesos), arestas_examinadas=examinadas,
+                             unioes=len(mst))
+    return mst
+
+# Com grau médio até este valor, ordenar as arestas (Kruskal) sai mais barato que o heap de Prim
+LIMIAR_GRAU_KRUSKAL = 8
+
+def arvore_geradora_minima(matriz, algoritmo='auto'):
+    # algoritmo: 'prim', 'kruskal' ou 'auto' (escolhe pela densidade de arestas).
+    # Em grafos desconexos devolve a floresta geradora mínima
+    if not matriz:
+        return []
+
+    grafo = matriz if isinstance(matriz, Grafo) else Grafo.de_matriz(matriz)
+    n = grafo.num_vertices
+    if n == 0:
+        return []
+
+    if algoritmo == 'auto':
+        algoritmo = 'kruskal' if grafo.num_arestas <= LIMIAR_GRAU_KRUSKAL * n else 'prim'
+
+    if algoritmo == 'kruskal':
+        return kruskal(n, *arestas_ordenadas(grafo))
+    return prim(grafo)
+
+def custos_componentes(num_vertices, mst):
+    # Agrupa as arestas da floresta por componente: lista de (vértices, custo total)
+    conjuntos = UniaoBusca(num_vertices)
+    for u, v, _ in mst:
+        conjuntos.unir(u, v)
+
+    componentes = {}
+    for vertice in range(num_vertices):
+        componentes.setdefault(conjuntos.encontrar(vertice), [[], 0])[0].append(vertice)
+    for u, _, peso in mst:
+        componentes[conjuntos.encontrar(u)][1] += peso
+    return [tuple(componente) for componente in componentes.values()]
+
+def visualizar_mst_pyvis(matriz, mst_edges, nomes_vertices, filename="mst_interativa.html"):
+    grafo = matriz if isinstance(matriz, Grafo) else Grafo.de_matriz(matriz)
+
+    # Cria um conjunto de arestas da MST para busca rápida
+    mst_set = set()
+    for u, v, _ in mst_edges:
+        mst_set.add(tuple(sorted((u, v))))
+
+    if grafo.num_vertices > LIMITE_PYVIS:
+        # Grafo grande: exporta em streaming todas as arestas da MST e só uma
+        # amostra das demais
+        def estilo_aresta(i, j, peso):
+            if (i, j) in mst_set:
+                return {'value': peso, 'title': f"Peso: {peso} (MST)", 'color': 'black'}
+            return {'value': peso, 'title': f"Peso: {peso}", 'color': 'white'}
+
+        exportar(grafo, filename, "Arvore Geradora de Custo Minimo (MST)",
+                 atributos_no=lambda i: {'label': str(nomes_vertices[i]), 'title': f"Vértice {nomes_vertices[i]}"},
+                 atributos_aresta=estilo_aresta, arestas_destaque=mst_set, k_saltos=0, max_arestas=LIMITE_PYVIS)
+        print(f"\nGrafo com MST destacada (arestas fora da MST amostradas) salvo em: '{filename}'")
+        return
+
+    nt = Network(height="800px", width="100%", notebook=True, heading="Arvore Geradora de Custo Minimo (MST)")
+
+    # Adiciona os nós
+    for i, nome in enumerate(nomes_vertices):
+        nt.add_node(i, label=nome, title=f"Vértice {nome}")
+
+    # Adiciona todas as arestas do grafo original, diferenciando as da MST
+    for i, j, peso in grafo.arestas():
+        is_in_mst = (i, j) in mst_set
+
+        if is_in_mst:
+            # Aresta pertence à MST: destaque
+            nt.add_edge(i, j, value=peso, title=f"Peso: {peso} (MST)", color='black', label=str(peso))
+        else:
+            # Aresta não pertence à MST: sutil
+            nt.add_edge(i, j, value=peso, title=f"Peso: {peso}", color='white')
+
+    nt.save_graph(filename)
+    print(f"\nGrafo interativo com MST destacada salvo em: '{filename}'")
+
+def exibir_mst_console(mst, nomes_vertices):
+    print("\n" + "="*50)
+    print("ÁRVORE GERADORA DE CUSTO MÍNIMO (MST) - RESULTADOS")
+    print("="*50)
+
+    if not mst:
+        print("Nenhuma árvore geradora pôde ser encontrada (o grafo pode estar vazio ou desconectado).")
+        return
+
+    total_cost = 0
+    for u, v, peso in sorted(mst, key=lambda x: x[2]):
+        print(f"Aresta: {nomes_vertices[u]:<5} -- {nomes_vertices[v]:<5} | Custo: {peso}")
+        total_cost += peso
+
+    print(f"\nCusto Total da MST: {total_cost}")
+
+    componentes = custos_componentes(len(nomes_vertices), mst)
+    if len(componentes) > 1:
+        print(f"\nO grafo é desconexo: floresta geradora mínima com {len(componentes)} componentes")
+        for vertices, custo in componentes:
+            nomes = ", ".join(str(nomes_vertices[v]) for v in vertices)
+            print(f"Componente {{{nomes}}} | Custo: {custo}")
+    print("="*50)
+
+def main():
+    # python Q2.py [arquivo] [--profile]; sem arquivo, pergunta no terminal
+    argumentos = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    csv_filename = argumentos[0] if argumentos else input("Digite o caminho para o arquivo CSV (ou .grf binário): ")
+    print(f"Tentando ler o grafo do arquivo: '{csv_filename}'")
+
+    with instrumentacao.fase('carga'):
+        if csv_filename.endswith('.grf'):
+            try:
+                grafo = carregar_binario(csv_filename)
+                nomes_vertices = grafo.rotulos
+            except (OSError, ValueError) as e:
+                print(f"Erro ao ler o arquivo binário: {e}")
+                grafo = None
+        else:
+            grafo, nomes_vertices = ler_grafo_csv(csv_filename)
+
+    if grafo is None:
+        print("\nExecução interrompida devido a erro na leitura do arquivo.")
+        return
+
+    with instrumentacao.fase('solucao'):
+        mst = arvore_geradora_minima(grafo)
+    exibir_mst_console(mst, nomes_vertices)
+    with instrumentacao.fase('renderizacao'):
+        visualizar_mst_pyvis(grafo, mst, nomes_vertices, filename="Q2_mst_interativa.html")
+
+if __name__ == "__main__":
+    with instrumentacao.perfilar_se_pedido():
+        main()
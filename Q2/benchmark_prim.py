@@ -0,0 +1,86 @@
+import heapq
+import random
+import time
+from collections import defaultdict
+
+from Q2 import Grafo, arvore_geradora_minima, prim
+
+def adjacencia_original(matriz):
+    # Lista de adjacência da implementação anterior (defaultdict de (vizinho, peso))
+    n = len(matriz)
+    grafo = defaultdict(list)
+    for i in range(n):
+        for j in range(n):
+            if matriz[i][j] > 0:
+                grafo[i].append((j, matriz[i][j]))
+    return grafo
+
+def prim_original(grafo, n):
+    # Implementação anterior (heapq preguiçoso sobre defaultdict), mantida como referência
+    visitado = [False] * n
+    mst = []
+    heap = [(0, 0, -1)]
+
+    while heap:
+        peso, u, pai = heapq.heappop(heap)
+        if visitado[u]:
+            continue
+
+        visitado[u] = True
+        if pai != -1:
+            mst.append((pai, u, peso))
+
+        for v, peso_aresta in grafo[u]:
+            if not visitado[v]:
+                heapq.heappush(heap, (peso_aresta, v, u))
+
+    return mst
+
+def gerar_matriz(n, densidade, semente=0):
+    rng = random.Random(semente)
+    matriz = [[0.0] * n for _ in range(n)]
+    # Caminho aleatório garante um grafo conexo
+    ordem = list(range(n))
+    rng.shuffle(ordem)
+    for a, b in zip(ordem, ordem[1:]):
+        matriz[a][b] = matriz[b][a] = float(rng.randint(1, 1000))
+    for i in range(n):
+        for j in range(i + 1, n):
+            if rng.random() < densidade:
+                matriz[i][j] = matriz[j][i] = float(rng.randint(1, 1000))
+    return matriz
+
+def cronometrar(funcao, *args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return resultado, time.perf_counter() - inicio
+
+def custo(mst):
+    return sum(peso for _, _, peso in mst)
+
+def main():
+    # A construção do grafo a partir da matriz (O(n²) nos dois casos) é medida
+    # à parte, e cada algoritmo recebe o seu grafo já pronto
+    print(f"{'n':>6} {'dens.':>6} {'constr. dict':>13} {'constr. CSR':>12} {'original':>10} "
+          f"{'heap':>10} {'denso':>10} {'auto':>10} {'kruskal':>10}")
+    for n, densidade in [(500, 0.01), (500, 0.2), (500, 1.0), (2000, 0.005), (2000, 0.1), (2000, 1.0)]:
+        matriz = gerar_matriz(n, densidade)
+        adjacencia, t_adjacencia = cronometrar(adjacencia_original, matriz)
+        grafo, t_csr = cronometrar(Grafo.de_matriz, matriz)
+
+        referencia, t_original = cronometrar(prim_original, adjacencia, n)
+        tempos = []
+        for estrategia in ('heap', 'denso', 'auto'):
+            mst, t = cronometrar(prim, grafo, estrategia)
+            assert len(mst) == len(referencia) and custo(mst) == custo(referencia)
+            tempos.append(t)
+
+        mst, t = cronometrar(arvore_geradora_minima, grafo, 'kruskal')
+        assert len(mst) == len(referencia) and custo(mst) == custo(referencia)
+        tempos.append(t)
+
+        print(f"{n:>6} {densidade:>6} {t_adjacencia:>12.3f}s {t_csr:>11.3f}s {t_original:>9.3f}s "
+              + " ".join(f"{t:>9.3f}s" for t in tempos))
+
+if __name__ == "__main__":
+    main()
@@ -1,129 +1,392 @@
-from pyvis.network import Network
-
-def dfs_path(grafo, inicio, fim):
-    stack = [(inicio, [inicio])]  # A pilha armazena (nó_atual, caminho_até_aqui)
-    visitado = set()
-
-    while stack:
-        (vertice, caminho) = stack.pop()
-        
-        if vertice not in visitado:
-            if vertice == fim:
-                return caminho
-            
-            visitado.add(vertice)
-            
-            for vizinho in grafo.get(vertice, []):
-                if vizinho not in visitado:
-                    stack.append((vizinho, caminho + [vizinho]))
-    
-    return None # Nenhum caminho encontrado
-
-def visualizar_labirinto_pyvis(grafo, caminho=None, filename="labirinto.html", titulo="Labirinto"):
-    nt = Network(height="800px", width="100%", notebook=True, heading=titulo, directed=False)
-
-    # Conjuntos para busca rápida de nós e arestas do caminho
-    nos_caminho = set(caminho) if caminho else set()
-    arestas_caminho = set()
-    if caminho and len(caminho) > 1:
-        for i in range(len(caminho) - 1):
-            aresta = tuple(sorted((caminho[i], caminho[i+1])))
-            arestas_caminho.add(aresta)
-
-    # Adiciona todos os nós ao grafo
-    for no in grafo:
-        cor_no = '#cccccc'
-        tamanho_no = 15
-        
-        if no in nos_caminho:
-            cor_no = '#e63946'  # Vermelho para nós no caminho
-            tamanho_no = 25
-        
-        # Destaques especiais para início e fim
-        if caminho and no == caminho[0]:
-            cor_no = '#52b788' # Verde para o início
-            nt.add_node(no, label=no, color=cor_no, size=30, title=f"INÍCIO: {no}")
-        elif caminho and no == caminho[-1]:
-            cor_no = '#9b5de5' # Roxo para o fim
-            nt.add_node(no, label=no, color=cor_no, size=30, title=f"FIM: {no}")
-        else:
-            nt.add_node(no, label=no, color=cor_no, size=tamanho_no, title=f"Ponto: {no}")
-
-    # Adiciona todas as arestas
-    arestas_adicionadas = set()
-    for no, vizinhos in grafo.items():
-        for vizinho in vizinhos:
-            aresta = tuple(sorted((no, vizinho)))
-            if aresta not in arestas_adicionadas:
-                cor_aresta = '#cccccc'
-                largura_aresta = 2
-
-                if aresta in arestas_caminho:
-                    cor_aresta = '#e63946' # Vermelho para arestas do caminho
-                    largura_aresta = 5
-                
-                nt.add_edge(aresta[0], aresta[1], color=cor_aresta, width=largura_aresta)
-                arestas_adicionadas.add(aresta)
-
-    nt.save_graph(filename)
-    print(f"Grafo interativo salvo em: '{filename}'")
-
-def main():
-    
-    labirinto = {
-        'A': ['1', '4'], '1': ['A', '6'], '2': ['3', '7'], '3': ['2'], '4': ['A', '5', '9'],
-        '5': ['4', '19'], '6': ['1', '7'], '7': ['2', '6', '8'], '8': ['7', '15'],
-        '9': ['4', '10', '29'], '10': ['9', '16'], '11': ['12'], '12': ['11', '13', '17'],
-        '13': ['12'], '14': ['15'], '15': ['8', '14', '21'], '16': ['10', '17'],
-        '17': ['12', '16'], '18': ['19', '24'], '19': ['5', '18', '20'], '20': ['19', '27'],
-        '21': ['15'], '22': ['23'], '23': ['22', '32'], '24': ['18', '25'], '25': ['24', '34'],
-        '26': ['27', '40'], '27': ['20', '26', '28'], '28': ['27', '46'], '29': ['9', '30'],
-        '30': ['29', '51'], '31': ['32', '47'], '32': ['23', '31'], '33': ['34', '38'],
-        '34': ['25', '33'], '35': ['45'], '36': ['57'], '37': ['38', '41'], '38': ['33', '37'],
-        '39': ['40', '43'], '40': ['26', '39'], '41': ['37', '42'], '42': ['41'],
-        '43': ['39', '44'], '44': ['43', '49'], '45': ['35', '46'], '46': ['28', '45'],
-        '47': ['31', '48', '52'], '48': ['47', '54'], '49': ['44', '50'], '50': ['49', 'B'],
-        '51': ['30', '52', '58'], '52': ['47', '51', '59'], '53': ['54', '60'],
-        '54': ['48', '53'], '55': ['56', '61'], '56': ['55'], 'B': ['50', '63'],
-        '57': ['36', '58'], '58': ['51', '57'], '59': ['52'], '60': ['53', '61'],
-        '61': ['55', '60'], '62': ['63'], '63': ['B', '62']
-    }
-    
-    no_inicio = 'A'
-    no_fim = 'B'
-
-    print("=" * 60)
-    print("RESOLVENDO O LABIRINTO (Q3) COM DFS E PYVIS")
-    print("=" * 60)
-
-    print(f"\n1. Gerando visualização do labirinto completo...")
-    visualizar_labirinto_pyvis(
-        labirinto, 
-        caminho=None, 
-        filename="Q3_labirinto_completo.html", 
-        titulo="Labirinto Completo (Antes da Solucao)"
-    )
-
-    print(f"\n2. Procurando caminho de '{no_inicio}' para '{no_fim}' usando DFS...")
-    caminho_solucao = dfs_path(labirinto, no_inicio, no_fim)
-
-    if caminho_solucao:
-        print(f"Caminho encontrado!")
-        print("   Rota: " + " -> ".join(caminho_solucao))
-        
-        print(f"\n3. Gerando visualização do labirinto com a solução destacada...")
-        visualizar_labirinto_pyvis(
-            labirinto, 
-            caminho=caminho_solucao, 
-            filename="Q3_labirinto_solucao.html", 
-            titulo="Solucao do Labirinto (DFS)"
-        )
-    else:
-        print(f"Não foi possível encontrar um caminho de '{no_inicio}' para '{no_fim}'.")
-
-    print("\n" + "=" * 60)
-    print("Execução concluída. Abra os arquivos .html gerados no seu navegador.")
-    print("=" * 60)
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+import os
+import sys
+from array import array
+from collections import deque
+from pyvis.network import Network
+from labirinto_grade import gerar_labirinto, para_dict, resolver_labirinto
+
+# Permite importar o pacote compartilhado grafos/ ao executar o script diretamente
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from grafos import Grafo, instrumentacao
+from grafos.exportacao import LIMITE_PYVIS, exportar_caminho
+from componentes import IndiceAlcance, articulacoes_e_pontes
+
+def _reconstruir_caminho(pai, fim):
+    # Percorre os predecessores do fim até a origem (cujo pai é None)
+    caminho = []
+    no_atual = fim
+    while no_atual is not None:
+        caminho.append(no_atual)
+        no_atual = pai[no_atual]
+    caminho.reverse()
+    return caminho
+
+def dfs_path(grafo, inicio, fim, alcance=None):
+    # Com um IndiceAlcance, um fim inalcançável é descartado sem explorar
+    # todo o componente de inicio
+    if alcance is not None and not alcance.alcanca(inicio, fim):
+        return None
+    if isinstance(grafo, Grafo):
+        return many_paths(grafo, [(inicio, fim)], 'dfs')[0]
+
+    stack = [(inicio, None)]  # A pilha armazena (nó_atual, nó_de_onde_veio)
+    pai = {}  # Também funciona como conjunto de visitados
+    caminho = None # Nenhum caminho encontrado
+    obsoletos = 0
+
+    while stack:
+        (vertice, anterior) = stack.pop()
+
+        if vertice not in pai:
+            pai[vertice] = anterior
+            if vertice == fim:
+                caminho = _reconstruir_caminho(pai, fim)
+                break
+
+            for vizinho in grafo.get(vertice, []):
+                if vizinho not in pai:
+                    stack.append((vizinho, vertice))
+        else:
+            obsoletos += 1
+
+    instrumentacao.registrar('dfs', visitados=len(pai), empilhados=len(pai) + obsoletos + len(stack),
+                             extracoes_obsoletas=obsoletos)
+    return caminho
+
+def bfs_path(grafo, inicio, fim, alcance=None):
+    # Caminho com o menor número de passagens
+    if alcance is not None and not alcance.alcanca(inicio, fim):
+        return None
+    if isinstance(grafo, Grafo):
+        return many_paths(grafo, [(inicio, fim)], 'bfs')[0]
+
+    pai = {inicio: None}
+    fila = deque([inicio])
+    caminho = None
+
+    while fila:
+        vertice = fila.popleft()
+        if vertice == fim:
+            caminho = _reconstruir_caminho(pai, fim)
+            break
+
+        for vizinho in grafo.get(vertice, []):
+            if vizinho not in pai:
+                pai[vizinho] = vertice
+                fila.append(vizinho)
+
+    instrumentacao.registrar('bfs', visitados=len(pai) - len(fila), enfileirados=len(pai))
+    return caminho
+
+def bidirectional_bfs_path(grafo, inicio, fim, alcance=None):
+    # BFS simultânea a partir das duas pontas (o labirinto é não direcionado).
+    # Cada passo expande um nível inteiro da fronteira menor, então o primeiro
+    # encontro entre as duas buscas já dá o menor caminho
+    if alcance is not None and not alcance.alcanca(inicio, fim):
+        return None
+    if isinstance(grafo, Grafo):
+        return many_paths(grafo, [(inicio, fim)], 'bidirecional')[0]
+
+    if inicio == fim:
+        return [inicio]
+
+    pai_ida, pai_volta = {inicio: None}, {fim: None}
+    fronteira_ida, fronteira_volta = [inicio], [fim]
+    niveis = 0
+
+    while fronteira_ida and fronteira_volta:
+        niveis += 1
+        invertido = len(fronteira_ida) > len(fronteira_volta)
+        if invertido:
+            fronteira_ida, fronteira_volta = fronteira_volta, fronteira_ida
+            pai_ida, pai_volta = pai_volta, pai_ida
+
+        proxima = []
+        for vertice in fronteira_ida:
+            for vizinho in grafo.get(vertice, []):
+                if vizinho in pai_volta:
+                    instrumentacao.registrar('bfs_bidirecional', niveis=niveis,
+                                             descobertos=len(pai_ida) + len(pai_volta))
+                    caminho = _reconstruir_caminho(pai_ida, vertice) + _reconstruir_caminho(pai_volta, vizinho)[::-1]
+                    return caminho if caminho[0] == inicio else caminho[::-1]
+                if vizinho not in pai_ida:
+                    pai_ida[vizinho] = vertice
+                    proxima.append(vizinho)
+        fronteira_ida = proxima
+
+        if invertido:
+            fronteira_ida, fronteira_volta = fronteira_volta, fronteira_ida
+            pai_ida, pai_volta = pai_volta, pai_ida
+
+    instrumentacao.registrar('bfs_bidirecional', niveis=niveis, descobertos=len(pai_ida) + len(pai_volta))
+    return None
+
+class MotorCaminhos:
+    # Busca de caminhos sobre índices inteiros (CSR) com buffers reaproveitados:
+    # marca[v] == consulta indica que v já foi visitado na consulta atual, então
+    # nenhum array precisa ser limpo entre consultas. Os vizinhos são lidos
+    # pela fatia da linha CSR, bem mais rápido que indexar destinos[k] em Python
+    __slots__ = ('grafo', 'marca', 'pai', 'consulta')
+
+    def __init__(self, grafo):
+        self.grafo = grafo if isinstance(grafo, Grafo) else Grafo.de_listas(grafo)
+        n = self.grafo.num_vertices
+
+        # O sinal do carimbo diferencia os dois lados da BFS bidirecional
+        self.marca = array('q', bytes(8 * n))
+        self.pai = array('q', bytes(8 * n))
+        self.consulta = 0
+
+    def _caminho(self, v):
+        caminho = [v]
+        while self.pai[v] != v:
+            v = self.pai[v]
+            caminho.append(v)
+        caminho.reverse()
+        return caminho
+
+    def dfs(self, s, t):
+        self.consulta += 1
+        marca, pai, inicios, vizinhos, c = self.marca, self.pai, self.grafo.inicios, self.grafo.destinos, self.consulta
+        pilha = [(s, s)]
+        caminho = None
+        visitados = obsoletos = 0
+        while pilha:
+            v, anterior = pilha.pop()
+            if marca[v] == c:
+                obsoletos += 1
+                continue
+            marca[v] = c
+            pai[v] = anterior
+            visitados += 1
+            if v == t:
+                caminho = self._caminho(t)
+                break
+            for w in vizinhos[inicios[v]:inicios[v + 1]]:
+                if marca[w] != c:
+                    pilha.append((w, v))
+        instrumentacao.registrar('dfs', visitados=visitados, empilhados=visitados + obsoletos + len(pilha),
+                                 extracoes_obsoletas=obsoletos)
+        return caminho
+
+    def bfs(self, s, t):
+        self.consulta += 1
+        marca, pai, inicios, vizinhos, c = self.marca, self.pai, self.grafo.inicios, self.grafo.destinos, self.consulta
+        marca[s], pai[s] = c, s
+        fila = deque([s])
+        caminho = None
+        visitados = 0
+        while fila:
+            v = fila.popleft()
+            visitados += 1
+            if v == t:
+                caminho = self._caminho(t)
+                break
+            for w in vizinhos[inicios[v]:inicios[v + 1]]:
+                if marca[w] != c:
+                    marca[w], pai[w] = c, v
+                    fila.append(w)
+        instrumentacao.registrar('bfs', visitados=visitados, enfileirados=visitados + len(fila))
+        return caminho
+
+    def caminhos_de(self, s, destinos):
+        # Uma única BFS completa a partir de s responde a todos os destinos
+        # (o alvo -1 nunca é encontrado, então a busca cobre o componente)
+        self.bfs(s, -1)
+        marca, c = self.marca, self.consulta
+        return [self._caminho(t) if marca[t] == c else None for t in destinos]
+
+    def bidirecional(self, s, t):
+        if s == t:
+            return [s]
+        self.consulta += 1
+        marca, pai, inicios, vizinhos, c = self.marca, self.pai, self.grafo.inicios, self.grafo.destinos, self.consulta
+        # Lado da origem carimbado com +c e lado do destino com -c; as duas
+        # buscas expandem um nível completo por vez, então o primeiro encontro
+        # no nível mais raso dá o menor caminho
+        marca[s], pai[s] = c, s
+        marca[t], pai[t] = -c, t
+        fronteiras = {c: [s], -c: [t]}
+        niveis, descobertos = 0, 2
+
+        while fronteiras[c] and fronteiras[-c]:
+            niveis += 1
+            lado = c if len(fronteiras[c]) <= len(fronteiras[-c]) else -c
+            proxima = []
+            for v in fronteiras[lado]:
+                for w in vizinhos[inicios[v]:inicios[v + 1]]:
+                    if marca[w] == -lado:
+                        instrumentacao.registrar('bfs_bidirecional', niveis=niveis,
+                                                 descobertos=descobertos + len(proxima))
+                        ida, volta = (v, w) if lado == c else (w, v)
+                        return self._caminho(ida) + self._caminho(volta)[::-1]
+                    if marca[w] != lado:
+                        marca[w], pai[w] = lado, v
+                        proxima.append(w)
+            descobertos += len(proxima)
+            fronteiras[lado] = proxima
+        instrumentacao.registrar('bfs_bidirecional', niveis=niveis, descobertos=descobertos)
+        return None
+
+MODOS_BUSCA = {'dfs': dfs_path, 'bfs': bfs_path, 'bidirecional': bidirectional_bfs_path}
+
+def many_paths(grafo, pares, modo='bfs', alcance=None):
+    # Resolve várias consultas (inicio, fim) convertendo o grafo uma única vez.
+    # Com um IndiceAlcance, os pares em componentes diferentes nem são buscados
+    if modo not in MODOS_BUSCA:
+        raise ValueError(f"Modo de busca desconhecido: '{modo}'")
+
+    motor = MotorCaminhos(grafo)
+    buscar = getattr(motor, modo)
+    indice, rotulos = motor.grafo.indice, motor.grafo.rotulos
+    caminhos = []
+    for inicio, fim in pares:
+        fora = alcance is not None and not alcance.alcanca(inicio, fim)
+        if fora or inicio not in indice or fim not in indice:
+            caminhos.append(None)
+            continue
+        caminho = buscar(indice[inicio], indice[fim])
+        caminhos.append([rotulos[v] for v in caminho] if caminho is not None else None)
+    return caminhos
+
+def visualizar_labirinto_pyvis(grafo, caminho=None, filename="labirinto.html", titulo="Labirinto"):
+    if len(grafo) > LIMITE_PYVIS:
+        # Grafo grande: exporta em streaming só o caminho e sua vizinhança
+        exportar_caminho(Grafo.de_listas(grafo), caminho, filename, titulo)
+        print(f"Grafo interativo (caminho e vizinhança) salvo em: '{filename}'")
+        return
+
+    nt = Network(height="800px", width="100%", notebook=True, heading=titulo, directed=False)
+
+    # Conjuntos para busca rápida de nós e arestas do caminho
+    nos_caminho = set(caminho) if caminho else set()
+    arestas_caminho = set()
+    if caminho and len(caminho) > 1:
+        for i in range(len(caminho) - 1):
+            aresta = tuple(sorted((caminho[i], caminho[i+1])))
+            arestas_caminho.add(aresta)
+
+    # Adiciona todos os nós ao grafo
+    for no in grafo:
+        cor_no = '#cccccc'
+        tamanho_no = 15
+        
+        if no in nos_caminho:
+            cor_no = '#e63946'  # Vermelho para nós no caminho
+            tamanho_no = 25
+        
+        # Destaques especiais para início e fim
+        if caminho and no == caminho[0]:
+            cor_no = '#52b788' # Verde para o início
+            nt.add_node(no, label=no, color=cor_no, size=30, title=f"INÍCIO: {no}")
+        elif caminho and no == caminho[-1]:
+            cor_no = '#9b5de5' # Roxo para o fim
+            nt.add_node(no, label=no, color=cor_no, size=30, title=f"FIM: {no}")
+        else:
+            nt.add_node(no, label=no, color=cor_no, size=tamanho_no, title=f"Ponto: {no}")
+
+    # Adiciona todas as arestas
+    arestas_adicionadas = set()
+    for no, vizinhos in grafo.items():
+        for vizinho in vizinhos:
+            aresta = tuple(sorted((no, vizinho)))
+            if aresta not in arestas_adicionadas:
+                cor_aresta = '#cccccc'
+                largura_aresta = 2
+
+                if aresta in arestas_caminho:
+                    cor_aresta = '#e63946' # Vermelho para arestas do caminho
+                    largura_aresta = 5
+                
+                nt.add_edge(aresta[0], aresta[1], color=cor_aresta, width=largura_aresta)
+                arestas_adicionadas.add(aresta)
+
+    nt.save_graph(filename)
+    print(f"Grafo interativo salvo em: '{filename}'")
+
+def main():
+    
+    labirinto = {
+        'A': ['1', '4'], '1': ['A', '6'], '2': ['3', '7'], '3': ['2'], '4': ['A', '5', '9'],
+        '5': ['4', '19'], '6': ['1', '7'], '7': ['2', '6', '8'], '8': ['7', '15'],
+        '9': ['4', '10', '29'], '10': ['9', '16'], '11': ['12'], '12': ['11', '13', '17'],
+        '13': ['12'], '14': ['15'], '15': ['8', '14', '21'], '16': ['10', '17'],
+        '17': ['12', '16'], '18': ['19', '24'], '19': ['5', '18', '20'], '20': ['19', '27'],
+        '21': ['15'], '22': ['23'], '23': ['22', '32'], '24': ['18', '25'], '25': ['24', '34'],
+        '26': ['27', '40'], '27': ['20', '26', '28'], '28': ['27', '46'], '29': ['9', '30'],
+        '30': ['29', '51'], '31': ['32', '47'], '32': ['23', '31'], '33': ['34', '38'],
+        '34': ['25', '33'], '35': ['45'], '36': ['57'], '37': ['38', '41'], '38': ['33', '37'],
+        '39': ['40', '43'], '40': ['26', '39'], '41': ['37', '42'], '42': ['41'],
+        '43': ['39', '44'], '44': ['43', '49'], '45': ['35', '46'], '46': ['28', '45'],
+        '47': ['31', '48', '52'], '48': ['47', '54'], '49': ['44', '50'], '50': ['49', 'B'],
+        '51': ['30', '52', '58'], '52': ['47', '51', '59'], '53': ['54', '60'],
+        '54': ['48', '53'], '55': ['56', '61'], '56': ['55'], 'B': ['50', '63'],
+        '57': ['36', '58'], '58': ['51', '57'], '59': ['52'], '60': ['53', '61'],
+        '61': ['55', '60'], '62': ['63'], '63': ['B', '62']
+    }
+    
+    no_inicio = 'A'
+    no_fim = 'B'
+
+    print("=" * 60)
+    print("RESOLVENDO O LABIRINTO (Q3) COM DFS E PYVIS")
+    print("=" * 60)
+
+    print("\n1. Gerando visualização do labirinto completo...")
+    with instrumentacao.fase('renderizacao'):
+        visualizar_labirinto_pyvis(
+            labirinto, 
+            caminho=None, 
+            filename="Q3_labirinto_completo.html", 
+            titulo="Labirinto Completo (Antes da Solucao)"
+        )
+
+    print(f"\n2. Procurando caminho de '{no_inicio}' para '{no_fim}' usando DFS...")
+    with instrumentacao.fase('solucao'):
+        caminho_solucao = dfs_path(labirinto, no_inicio, no_fim)
+
+    if caminho_solucao:
+        print("Caminho encontrado!")
+        print("   Rota: " + " -> ".join(caminho_solucao))
+        
+        print("\n3. Gerando visualização do labirinto com a solução destacada...")
+        with instrumentacao.fase('renderizacao'):
+            visualizar_labirinto_pyvis(
+                labirinto, 
+                caminho=caminho_solucao, 
+                filename="Q3_labirinto_solucao.html", 
+                titulo="Solucao do Labirinto (DFS)"
+            )
+    else:
+        print(f"Não foi possível encontrar um caminho de '{no_inicio}' para '{no_fim}'.")
+
+    print("\n4. Gerando e resolvendo um labirinto em grade 10x10...")
+    with instrumentacao.fase('construcao'):
+        grade = gerar_labirinto(10, 10, semente=42)
+    with instrumentacao.fase('solucao'):
+        caminho_grade = resolver_labirinto(grade)
+    print(f"Caminho com {len(caminho_grade)} células da entrada (0) à saída ({grade.num_celulas - 1}).")
+    with instrumentacao.fase('renderizacao'):
+        visualizar_labirinto_pyvis(
+            para_dict(grade),
+            caminho=[str(c) for c in caminho_grade],
+            filename="Q3_labirinto_grade.html",
+            titulo="Labirinto em Grade 10x10 (BFS)"
+        )
+
+    print("\n5. Indexando componentes e gargalos do labirinto...")
+    with instrumentacao.fase('construcao'):
+        alcance = IndiceAlcance(labirinto)
+        articulacoes, pontes = articulacoes_e_pontes(labirinto)
+    print(f"   {alcance.num_componentes} componente(s); '{no_inicio}' alcança '{no_fim}': "
+          f"{alcance.alcanca(no_inicio, no_fim)}")
+    print(f"   {len(articulacoes)} células de articulação e {len(pontes)} passagens sem alternativa (pontes)")
+
+    print("\n" + "=" * 60)
+    print("Execução concluída. Abra os arquivos .html gerados no seu navegador.")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    # python Q3.py [--profile]
+    with instrumentacao.perfilar_se_pedido():
+        main()
\ No newline at end of file
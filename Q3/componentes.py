@@ -0,0 +1,160 @@
+from array import array
+
+from grafos import Grafo
+from labirinto_grade import LabirintoGrade
+
+# Índices de estrutura para labirintos não direcionados: componentes conexos
+# (quem alcança quem) e pontos de articulação/pontes (células e passagens
+# sem alternativa, os gargalos do labirinto)
+
+def _adjacencia(estrutura):
+    # CSR (inicios, destinos) e o Grafo dos rótulos; para um LabirintoGrade
+    # os vértices são as próprias células e o Grafo é None
+    if isinstance(estrutura, LabirintoGrade):
+        inicios, destinos = array('q', [0]), array('q')
+        for c in range(estrutura.num_celulas):
+            destinos.extend(v for _, v in estrutura.vizinhos(c))
+            inicios.append(len(destinos))
+        return inicios, destinos, None
+    grafo = estrutura if isinstance(estrutura, Grafo) else Grafo.de_listas(estrutura)
+    return grafo.inicios, grafo.destinos, grafo
+
+def rotular_componentes(inicios, destinos):
+    # Uma passada O(V + E): componente[v] é o ID (0, 1, ...) do componente de v
+    n = len(inicios) - 1
+    componente = array('q', [-1]) * n
+    num = 0
+    for s in range(n):
+        if componente[s] != -1:
+            continue
+        componente[s] = num
+        pilha = [s]
+        while pilha:
+            v = pilha.pop()
+            for k in range(inicios[v], inicios[v + 1]):
+                w = destinos[k]
+                if componente[w] == -1:
+                    componente[w] = num
+                    pilha.append(w)
+        num += 1
+    return componente, num
+
+class IndiceAlcance:
+    # Responde "a alcança b?" comparando IDs de componente, sem busca. As
+    # passagens abertas depois da rotulação unem componentes em um
+    # union-find sobre os IDs (união por tamanho, compressão de caminho);
+    # cada consulta grava a raiz encontrada em componente[v], então enquanto
+    # nada é aberto a resposta é O(1)
+    __slots__ = ('indice', 'labirinto', 'componente', 'pai', 'tamanho', 'num_componentes')
+
+    def __init__(self, estrutura):
+        self.labirinto = estrutura if isinstance(estrutura, LabirintoGrade) else None
+        inicios, destinos, grafo = _adjacencia(estrutura)
+        self.indice = grafo.indice if grafo is not None else None
+        self.componente, self.num_componentes = rotular_componentes(inicios, destinos)
+        self.pai = array('q', range(self.num_componentes))
+        self.tamanho = array('q', bytes(8 * self.num_componentes))
+        for c in self.componente:
+            self.tamanho[c] += 1
+
+    def _indice(self, v):
+        if self.indice is None:
+            return v if isinstance(v, int) and 0 <= v < len(self.componente) else None
+        return self.indice.get(v)
+
+    def _raiz(self, c):
+        pai = self.pai
+        while pai[c] != c:
+            pai[c] = pai[pai[c]]
+            c = pai[c]
+        return c
+
+    def componente_de(self, v):
+        i = self._indice(v)
+        if i is None:
+            raise ValueError(f"Vértice '{v}' não existe no labirinto")
+        raiz = self._raiz(self.componente[i])
+        self.componente[i] = raiz
+        return raiz
+
+    def alcanca(self, a, b):
+        if self._indice(a) is None or self._indice(b) is None:
+            return False
+        return self.componente_de(a) == self.componente_de(b)
+
+    def tamanho_componente(self, v):
+        return self.tamanho[self.componente_de(v)]
+
+    def abrir(self, a, b):
+        # Registra a passagem nova a–b (abrindo-a também no LabirintoGrade,
+        # se o índice for de um). Devolve True se dois componentes se uniram
+        if self.labirinto is not None:
+            self.labirinto.abrir(a, b)
+        raiz_a, raiz_b = self.componente_de(a), self.componente_de(b)
+        if raiz_a == raiz_b:
+            return False
+        tamanho = self.tamanho
+        if tamanho[raiz_a] < tamanho[raiz_b]:
+            raiz_a, raiz_b = raiz_b, raiz_a
+        self.pai[raiz_b] = raiz_a
+        tamanho[raiz_a] += tamanho[raiz_b]
+        self.num_componentes -= 1
+        return True
+
+def articulacoes_e_pontes(estrutura):
+    # Tarjan iterativo, O(V + E). Devolve (vértices de articulação, pontes):
+    # removê-los desconecta o componente. Arestas paralelas entre os mesmos
+    # vértices não são pontes, por isso só a primeira volta ao pai é ignorada
+    inicios, destinos, grafo = _adjacencia(estrutura)
+    n = len(inicios) - 1
+    descoberta = array('q', [-1]) * n
+    baixo = array('q', bytes(8 * n))
+    cursor = array('q', inicios)
+    ignorou_pai = bytearray(n)
+    articulacao = bytearray(n)
+    pontes = []
+    tempo = 0
+
+    for raiz in range(n):
+        if descoberta[raiz] != -1:
+            continue
+        descoberta[raiz] = baixo[raiz] = tempo
+        tempo += 1
+        filhos_raiz = 0
+        pilha = [(raiz, -1)]
+        while pilha:
+            v, p = pilha[-1]
+            k = cursor[v]
+            if k < inicios[v + 1]:
+                cursor[v] = k + 1
+                w = destinos[k]
+                if descoberta[w] == -1:
+                    descoberta[w] = baixo[w] = tempo
+                    tempo += 1
+                    pilha.append((w, v))
+                elif w == p and not ignorou_pai[v]:
+                    ignorou_pai[v] = 1
+                elif descoberta[w] < baixo[v]:
+                    baixo[v] = descoberta[w]
+                continue
+
+            # v terminou: o pai herda o menor tempo alcançável a partir de v
+            pilha.pop()
+            if p == -1:
+                continue
+            if baixo[v] < baixo[p]:
+                baixo[p] = baixo[v]
+            if p == raiz:
+                filhos_raiz += 1
+            elif baixo[v] >= descoberta[p]:
+                articulacao[p] = 1
+            if baixo[v] > descoberta[p]:
+                pontes.append((p, v))
+        if filhos_raiz > 1:
+            articulacao[raiz] = 1
+
+    vertices = [v for v in range(n) if articulacao[v]]
+    if grafo is None:
+        return vertices, pontes
+    rotulos = grafo.rotulos
+    return [rotulos[v] for v in vertices], [(rotulos[u], rotulos[v]) for u, v in pontes]
@@ -0,0 +1,220 @@
+import random
+from array import array
+from collections import deque
+
+# Direções usadas nos arrays de chegada/retrocesso (0 = nenhuma)
+NORTE, SUL, LESTE, OESTE = 1, 2, 3, 4
+OPOSTA = (0, SUL, NORTE, OESTE, LESTE)
+
+class LabirintoGrade:
+    # Labirinto em grade largura × altura. Cada célula guarda só 2 bits
+    # (passagem para leste e para sul), empacotados em um bytearray; as
+    # passagens para norte/oeste são lidas nas células vizinhas. As células
+    # são numeradas por linha: c = linha * largura + coluna
+    __slots__ = ('largura', 'altura', 'bits')
+
+    def __init__(self, largura, altura):
+        self.largura = largura
+        self.altura = altura
+        self.bits = bytearray((2 * largura * altura + 7) // 8)
+
+    @property
+    def num_celulas(self):
+        return self.largura * self.altura
+
+    def deslocamentos(self):
+        # Variação do índice da célula para cada direção
+        return (0, -self.largura, self.largura, 1, -1)
+
+    def _bit(self, a, b):
+        # Posição do bit que representa a parede entre as células adjacentes a e b
+        if b == a + 1 and b % self.largura:
+            return 2 * a
+        if b == a - 1 and a % self.largura:
+            return 2 * b
+        if b == a + self.largura:
+            return 2 * a + 1
+        if b == a - self.largura:
+            return 2 * b + 1
+        raise ValueError(f"As células {a} e {b} não são adjacentes")
+
+    def abrir(self, a, b):
+        i = self._bit(a, b)
+        self.bits[i >> 3] |= 1 << (i & 7)
+
+    def aberta(self, a, b):
+        i = self._bit(a, b)
+        return self.bits[i >> 3] >> (i & 7) & 1
+
+    def adjacentes(self, c):
+        # Todas as células vizinhas na grade, com ou sem parede: (direção, célula)
+        largura = self.largura
+        linha, coluna = divmod(c, largura)
+        if linha > 0:
+            yield NORTE, c - largura
+        if linha < self.altura - 1:
+            yield SUL, c + largura
+        if coluna < largura - 1:
+            yield LESTE, c + 1
+        if coluna > 0:
+            yield OESTE, c - 1
+
+    def vizinhos(self, c):
+        # Células alcançáveis a partir de c (sem parede entre elas): (direção, célula)
+        bits, largura = self.bits, self.largura
+        linha, coluna = divmod(c, largura)
+        if linha > 0:
+            i = 2 * (c - largura) + 1
+            if bits[i >> 3] >> (i & 7) & 1:
+                yield NORTE, c - largura
+        if linha < self.altura - 1:
+            i = 2 * c + 1
+            if bits[i >> 3] >> (i & 7) & 1:
+                yield SUL, c + largura
+        if coluna < largura - 1:
+            i = 2 * c
+            if bits[i >> 3] >> (i & 7) & 1:
+                yield LESTE, c + 1
+        if coluna > 0:
+            i = 2 * (c - 1)
+            if bits[i >> 3] >> (i & 7) & 1:
+                yield OESTE, c - 1
+
+def _gerar_backtracker(lab, rng):
+    # Backtracker recursivo iterativo. A pilha guarda só a direção de cada passo
+    # (1 byte), e o retrocesso anda na direção oposta
+    visitado = bytearray(lab.num_celulas)
+    deslocamento = lab.deslocamentos()
+    pilha = bytearray()
+    c = rng.randrange(lab.num_celulas)
+    visitado[c] = 1
+
+    while True:
+        opcoes = [(d, v) for d, v in lab.adjacentes(c) if not visitado[v]]
+        if opcoes:
+            d, v = rng.choice(opcoes)
+            lab.abrir(c, v)
+            visitado[v] = 1
+            pilha.append(d)
+            c = v
+        elif pilha:
+            c -= deslocamento[pilha.pop()]
+        else:
+            break
+
+def _gerar_kruskal(lab, rng):
+    # Kruskal aleatório: derruba as paredes em ordem aleatória sempre que elas
+    # separam dois conjuntos diferentes
+    largura, n = lab.largura, lab.num_celulas
+    paredes = array('q')
+    for c in range(n):
+        if (c + 1) % largura:
+            paredes.append(2 * c)
+        if c + largura < n:
+            paredes.append(2 * c + 1)
+    rng.shuffle(paredes)
+
+    pai = array('q', range(n))
+
+    def encontrar(x):
+        while pai[x] != x:
+            pai[x] = pai[pai[x]]
+            x = pai[x]
+        return x
+
+    abertas = 0
+    for parede in paredes:
+        a = parede >> 1
+        b = a + largura if parede & 1 else a + 1
+        raiz_a, raiz_b = encontrar(a), encontrar(b)
+        if raiz_a != raiz_b:
+            pai[raiz_a] = raiz_b
+            lab.abrir(a, b)
+            abertas += 1
+            if abertas == n - 1:
+                break
+
+def _gerar_wilson(lab, rng):
+    # Wilson: passeios aleatórios com remoção de laços até tocar a árvore;
+    # gera uma árvore geradora uniforme. proximo[c] guarda a última direção
+    # tomada em c, o que apaga os laços automaticamente
+    n = lab.num_celulas
+    deslocamento = lab.deslocamentos()
+    na_arvore = bytearray(n)
+    proximo = bytearray(n)
+    na_arvore[rng.randrange(n)] = 1
+
+    for inicio in range(n):
+        c = inicio
+        while not na_arvore[c]:
+            d, c = rng.choice(list(lab.adjacentes(c)))
+            proximo[c - deslocamento[d]] = d
+        c = inicio
+        while not na_arvore[c]:
+            na_arvore[c] = 1
+            v = c + deslocamento[proximo[c]]
+            lab.abrir(c, v)
+            c = v
+
+GERADORES = {'backtracker': _gerar_backtracker, 'kruskal': _gerar_kruskal, 'wilson': _gerar_wilson}
+
+def gerar_labirinto(largura, altura, algoritmo='backtracker', fracao_extra=0.0, semente=None):
+    # Gera um labirinto perfeito (uma única rota entre quaisquer duas células).
+    # Com fracao_extra > 0, abre paredes aleatórias adicionais e o labirinto
+    # passa a ter ciclos (imperfeito)
+    if algoritmo not in GERADORES:
+        raise ValueError(f"Algoritmo de geração desconhecido: '{algoritmo}'")
+
+    rng = random.Random(semente)
+    lab = LabirintoGrade(largura, altura)
+    if lab.num_celulas:
+        GERADORES[algoritmo](lab, rng)
+
+    for _ in range(int(fracao_extra * lab.num_celulas)):
+        c = rng.randrange(lab.num_celulas)
+        _, v = rng.choice(list(lab.adjacentes(c)))
+        lab.abrir(c, v)
+    return lab
+
+def resolver_labirinto(lab, inicio=0, fim=None, modo='bfs'):
+    # Busca direto sobre os bits do labirinto. chegada[c] guarda a direção pela
+    # qual c foi alcançada, suficiente para reconstruir o caminho no final
+    if fim is None:
+        fim = lab.num_celulas - 1
+    if modo not in ('bfs', 'dfs'):
+        raise ValueError(f"Modo de busca desconhecido: '{modo}'")
+
+    deslocamento = lab.deslocamentos()
+    chegada = bytearray(lab.num_celulas)
+    chegada[inicio] = 255
+    fronteira = deque([inicio])
+    proximo = fronteira.popleft if modo == 'bfs' else fronteira.pop
+
+    while fronteira:
+        c = proximo()
+        if c == fim:
+            caminho = [c]
+            while c != inicio:
+                c -= deslocamento[chegada[c]]
+                caminho.append(c)
+            caminho.reverse()
+            return caminho
+
+        for d, v in lab.vizinhos(c):
+            if not chegada[v]:
+                chegada[v] = d
+                fronteira.append(v)
+
+    return None
+
+def para_dict(lab):
+    # Formato usado por dfs_path e visualizar_labirinto_pyvis (rótulos = índices em texto)
+    return {str(c): [str(v) for _, v in lab.vizinhos(c)] for c in range(lab.num_celulas)}
+
+def de_dict(grafo, largura, altura):
+    # Inverso de para_dict: os rótulos devem ser os índices das células na grade
+    lab = LabirintoGrade(largura, altura)
+    for no, vizinhos in grafo.items():
+        for vizinho in vizinhos:
+            lab.abrir(int(no), int(vizinho))
+    return lab
@@ -1,180 +1,460 @@
-import heapq
-from pyvis.network import Network
-
-def construir_grafo(cidades, matriz_distancias):
-    grafo = {}
-    num_cidades = len(cidades)
-    for i in range(num_cidades):
-        cidade_origem = cidades[i]
-        grafo[cidade_origem] = {}
-        for j in range(num_cidades):
-            if i != j:
-                cidade_destino = cidades[j]
-                distancia = matriz_distancias[i][j]
-                if distancia > 0:
-                    grafo[cidade_origem][cidade_destino] = distancia
-    return grafo
-
-def dijkstra(grafo, inicio):
-    distancias_minimas = {no: float('infinity') for no in grafo}
-    distancias_minimas[inicio] = 0
-    predecessores = {no: None for no in grafo}
-    fila_prioridade = [(0, inicio)]
-    
-    while fila_prioridade:
-        distancia_atual, no_atual = heapq.heappop(fila_prioridade)
-        
-        if distancia_atual > distancias_minimas[no_atual]:
-            continue
-            
-        for vizinho, peso in grafo[no_atual].items():
-            distancia = distancia_atual + peso
-            
-            if distancia < distancias_minimas[vizinho]:
-                distancias_minimas[vizinho] = distancia
-                predecessores[vizinho] = no_atual
-                heapq.heappush(fila_prioridade, (distancia, vizinho))
-                
-    return distancias_minimas, predecessores
-
-def visualizar_mapa_pyvis(grafo, caminho=None, filename="mapa.html", titulo="Mapa de Cidades"):
-    nt = Network(height="800px", width="100%", notebook=True, heading=titulo)
-
-    nos_caminho = set(caminho) if caminho else set()
-    arestas_caminho = set()
-    if caminho and len(caminho) > 1:
-        for i in range(len(caminho) - 1):
-            aresta = tuple(sorted((caminho[i], caminho[i+1])))
-            arestas_caminho.add(aresta)
-
-    for cidade in grafo:
-        cor_no, tamanho_no = ('#1f78b4', 15)
-        if cidade in nos_caminho:
-            cor_no, tamanho_no = ('#e63946', 25)
-        
-        if caminho and cidade == caminho[0]:
-            cor_no, tamanho_no = ('#52b788', 30)
-            nt.add_node(cidade, label=cidade, color=cor_no, size=tamanho_no, title=f"INÍCIO: {cidade}")
-        elif caminho and cidade == caminho[-1]:
-            cor_no, tamanho_no = ('#9b5de5', 30)
-            nt.add_node(cidade, label=cidade, color=cor_no, size=tamanho_no, title=f"FIM: {cidade}")
-        else:
-            nt.add_node(cidade, label=cidade, color=cor_no, size=tamanho_no)
-
-    arestas_adicionadas = set()
-    for cidade_origem, vizinhos in grafo.items():
-        for cidade_destino, distancia in vizinhos.items():
-            aresta = tuple(sorted((cidade_origem, cidade_destino)))
-            if aresta not in arestas_adicionadas:
-                cor_aresta, largura_aresta = ('lightgray', 2)
-                if aresta in arestas_caminho:
-                    cor_aresta, largura_aresta = ('#e63946', 5)
-                nt.add_edge(aresta[0], aresta[1], label=str(distancia), title=f"Distância: {distancia} km", color=cor_aresta, width=largura_aresta)
-                arestas_adicionadas.add(aresta)
-
-    options = """
-    var options = {
-      "configure": {
-        "enabled": true,
-        "filter": "physics"
-      },
-      "physics": {
-        "stabilization": {
-          "enabled": true,
-          "iterations": 1000,
-          "fit": true
-        },
-        "barnesHut": {
-          "gravitationalConstant": -80000,
-          "centralGravity": 0.3,
-          "springLength": 250,
-          "springConstant": 0.04,
-          "damping": 0.09,
-          "avoidOverlap": 0.5
-        }
-      }
-    }
-    """
-    nt.set_options(options)
-    
-    nt.save_graph(filename)
-    print(f"Mapa interativo e estabilizado salvo em: '{filename}'")
-
-def main():
-    
-    cidades = [
-        "Caminha", "V. Castelo", "Leixões", "Aveiro", "F. da Foz", "Nazaré",
-        "Peniche", "Cascais", "Lisboa", "Sesimbra", "Setúbal", "Sines",
-        "Baleeira", "Lagos", "Portimão", "Vilamoura", "C. Sta. Maria", 
-        "Tavira", "VRS. António"
-    ]
-
-    matriz_distancias = [
-        [0, 12, 43, 75, 105, 138, 156, 201, 206, 221, 223, 249, 302, 315, 322, 342, 356, 373, 384],
-        [12, 0, 31, 63, 93, 126, 144, 189, 194, 209, 221, 237, 290, 303, 310, 330, 344, 361, 372],
-        [43, 31, 0, 32, 63, 96, 116, 160, 172, 181, 193, 209, 262, 275, 282, 302, 316, 333, 344],
-        [75, 63, 32, 0, 31, 64, 85, 129, 141, 150, 162, 178, 231, 244, 251, 271, 285, 302, 313],
-        [105, 93, 63, 31, 0, 34, 56, 100, 112, 121, 133, 149, 202, 215, 222, 242, 256, 273, 284],
-        [138, 126, 96, 64, 34, 0, 23, 65, 79, 88, 100, 116, 169, 181, 189, 209, 223, 240, 251],
-        [156, 144, 116, 85, 56, 23, 0, 45, 57, 66, 78, 94, 147, 160, 167, 187, 201, 218, 229],
-        [201, 189, 160, 129, 100, 65, 45, 0, 5, 26, 35, 49, 112, 123, 133, 154, 166, 174, 191],
-        [206, 194, 172, 141, 112, 79, 57, 5, 0, 23, 32, 47, 111, 122, 132, 153, 165, 173, 190],
-        [221, 209, 181, 150, 121, 88, 66, 26, 23, 0, 10, 32, 92, 107, 112, 130, 142, 158, 170],
-        [223, 221, 193, 162, 133, 100, 78, 35, 32, 10, 0, 33, 95, 109, 115, 133, 145, 161, 172],
-        [249, 237, 209, 178, 149, 116, 94, 49, 47, 32, 33, 0, 63, 77, 83, 101, 113, 129, 141],
-        [302, 290, 262, 231, 202, 169, 147, 112, 111, 92, 95, 63, 0, 14, 20, 39, 50, 66, 76],
-        [315, 303, 275, 244, 215, 181, 160, 123, 122, 107, 109, 77, 14, 0, 7, 26, 40, 56, 66],
-        [322, 310, 282, 251, 222, 189, 167, 133, 132, 112, 115, 83, 20, 7, 0, 20, 33, 49, 59],
-        [342, 330, 302, 271, 242, 209, 187, 154, 153, 130, 133, 101, 39, 26, 20, 0, 15, 31, 41],
-        [356, 344, 316, 285, 256, 223, 201, 166, 165, 142, 145, 113, 50, 40, 33, 15, 0, 16, 26],
-        [373, 361, 333, 302, 273, 240, 218, 174, 173, 158, 161, 129, 66, 56, 49, 31, 16, 0, 11],
-        [384, 372, 344, 313, 284, 251, 229, 191, 190, 170, 172, 141, 76, 66, 59, 41, 26, 11, 0]
-    ]
-    
-    grafo = construir_grafo(cidades, matriz_distancias)
-    cidade_inicio = 'Leixões'
-    cidade_fim = 'Tavira'
-
-    print("=" * 60)
-    print("ENCONTRANDO A MELHOR ROTA (Q4) COM DIJKSTRA E PYVIS")
-    print("=" * 60)
-
-    print("\n1. Gerando visualização do mapa completo de Portugal...")
-    visualizar_mapa_pyvis(
-        grafo, 
-        caminho=None, 
-        filename="Q4_mapa_completo.html", 
-        titulo="Mapa de Estradas de Portugal (Antes da Rota)"
-    )
-
-    print(f"\n2. Calculando a melhor rota de '{cidade_inicio}' para '{cidade_fim}'...")
-    distancias_minimas, predecessores = dijkstra(grafo, cidade_inicio)
-    
-    caminho = []
-    no_atual = cidade_fim
-    if predecessores.get(no_atual) is None and no_atual != cidade_inicio:
-        print(f"Não foi possível encontrar uma rota de '{cidade_inicio}' para '{cidade_fim}'.")
-    else:
-        while no_atual is not None:
-            caminho.append(no_atual)
-            no_atual = predecessores[no_atual]
-        caminho.reverse()
-
-        print("Rota encontrada!")
-        print(f"   Distância total: {distancias_minimas[cidade_fim]} km")
-        print("   Caminho: " + " -> ".join(caminho))
-        
-        print("\n3. Gerando visualização do mapa com a rota destacada...")
-        visualizar_mapa_pyvis(
-            grafo, 
-            caminho=caminho, 
-            filename="Q4_rota_solucao.html", 
-            titulo=f"Melhor Rota: {cidade_inicio} para {cidade_fim}"
-        )
-
-    print("\n" + "=" * 60)
-    print("Execução concluída. Abra os arquivos .html gerados no seu navegador.")
-    print("=" * 60)
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+import heapq
+import math
+import os
+import sys
+from array import array
+from bisect import bisect_right
+from pyvis.network import Network
+
+# Permite importar o pacote compartilhado grafos/ ao executar o script diretamente
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from grafos import Grafo, instrumentacao
+from grafos.exportacao import LIMITE_PYVIS, exportar_caminho
+
+# Cidades mais próximas de cada origem testadas como intermediárias na poda
+CANDIDATOS_PODA = 32
+
+def arestas_nao_dominadas(matriz_distancias, candidatos=CANDIDATOS_PODA, vizinhos_proximos=None):
+    # Para cada cidade i, os destinos j (em ordem crescente de distância) cuja
+    # aresta sobrevive à poda. A aresta i -> j é dominada se existe k com
+    # w(i, k) + w(k, j) <= w(i, j); com pesos positivos as duas arestas de k
+    # são mais curtas que a de j, então remover todas as dominadas não altera
+    # nenhuma distância mínima. Só as `candidatos` cidades mais próximas de i
+    # servem de k (None = todas): deixar de achar uma testemunha só mantém
+    # uma aresta a mais, nunca remove uma necessária.
+    # Cada linha é filtrada em bloco: a cada k, todos os destinos ainda
+    # pendentes são testados de uma vez e os já decididos saem do bloco.
+    # vizinhos_proximos=k mantém só as k arestas mais curtas restantes de cada
+    # cidade; essa opção é aproximada e pode alongar algumas rotas
+    infinito = float('infinity')
+    n = len(matriz_distancias)
+    for i in range(n):
+        linha = matriz_distancias[i]
+        ordem = sorted((j for j in range(n) if j != i and linha[j] > 0), key=linha.__getitem__)
+        mantidas = []
+        pendentes = ordem
+        for k in (ordem if candidatos is None else ordem[:candidatos]):
+            peso_ik = linha[k]
+            # Destinos não mais distantes que k não podem ser dominados por k
+            # nem pelos candidatos seguintes: ficam definitivamente
+            corte = bisect_right(pendentes, peso_ik, key=linha.__getitem__)
+            mantidas.extend(pendentes[:corte])
+            linha_k = matriz_distancias[k]
+            # Zero fora da diagonal significa "sem estrada" de k até j
+            pendentes = [j for j in pendentes[corte:] if peso_ik + (linha_k[j] or infinito) > linha[j]]
+            if not pendentes:
+                break
+        mantidas.extend(pendentes)
+        yield mantidas if vizinhos_proximos is None else mantidas[:vizinhos_proximos]
+
+def podar_matriz(cidades, matriz_distancias, candidatos=CANDIDATOS_PODA, vizinhos_proximos=None):
+    # Grafo (CSR) só com as arestas não dominadas, sem montar o grafo completo
+    inicios, destinos, pesos = array('q', [0]), array('q'), array('d')
+    for i, mantidas in enumerate(arestas_nao_dominadas(matriz_distancias, candidatos, vizinhos_proximos)):
+        linha = matriz_distancias[i]
+        destinos.extend(mantidas)
+        pesos.extend(linha[j] for j in mantidas)
+        inicios.append(len(destinos))
+    return Grafo(cidades, inicios, destinos, pesos)
+
+def construir_grafo(cidades, matriz_distancias, podar=False, vizinhos_proximos=None):
+    # podar=True remove as arestas dominadas (distâncias idênticas);
+    # vizinhos_proximos também limita o grau de cada cidade (aproximado)
+    if podar or vizinhos_proximos is not None:
+        return podar_matriz(cidades, matriz_distancias, vizinhos_proximos=vizinhos_proximos).para_dicts()
+
+    grafo = {}
+    num_cidades = len(cidades)
+    for i in range(num_cidades):
+        cidade_origem = cidades[i]
+        grafo[cidade_origem] = {}
+        for j in range(num_cidades):
+            if i != j:
+                cidade_destino = cidades[j]
+                distancia = matriz_distancias[i][j]
+                if distancia > 0:
+                    grafo[cidade_origem][cidade_destino] = distancia
+    return grafo
+
+def dijkstra_indices(grafo, inicio):
+    # Dijkstra sobre o Grafo do núcleo: recebe e devolve IDs inteiros.
+    # predecessores[v] == -1 para a origem e para nós inalcançáveis. Em Python
+    # puro, heapq com remoção preguiçosa (entradas obsoletas descartadas na
+    # extração) é mais rápido que um heap indexado com decrease-key, e as
+    # fatias da linha CSR evitam indexar destinos/pesos aresta por aresta
+    n = grafo.num_vertices
+    inicios, destinos, pesos = grafo.inicios, grafo.destinos, grafo.pesos
+    distancias = [float('infinity')] * n
+    predecessores = [-1] * n
+    distancias[inicio] = 0.0
+    fila = [(0.0, inicio)]
+    heappush, heappop = heapq.heappush, heapq.heappop
+    relaxacoes = obsoletas = 0
+
+    while fila:
+        distancia_atual, u = heappop(fila)
+        if distancia_atual > distancias[u]:
+            obsoletas += 1
+            continue
+        a, b = inicios[u], inicios[u + 1]
+        for v, peso in zip(destinos[a:b], pesos[a:b]):
+            distancia = distancia_atual + peso
+            if distancia < distancias[v]:
+                distancias[v] = distancia
+                predecessores[v] = u
+                heappush(fila, (distancia, v))
+                relaxacoes += 1
+
+    # Mesmos contadores da versão sobre dicts
+    if instrumentacao.ligada():
+        infinito = float('infinity')
+        instrumentacao.registrar('dijkstra', assentados=relaxacoes + 1 - obsoletas, insercoes_heap=relaxacoes + 1,
+                                 extracoes_heap=relaxacoes + 1, extracoes_obsoletas=obsoletas,
+                                 relaxacoes=relaxacoes,
+                                 arestas_varridas=sum(inicios[u + 1] - inicios[u] for u in range(n)
+                                                      if distancias[u] != infinito))
+    return distancias, predecessores
+
+def dijkstra(grafo, inicio):
+    if isinstance(grafo, Grafo):
+        distancias, predecessores = dijkstra_indices(grafo, grafo.indice[inicio])
+        rotulos = grafo.rotulos
+        return ({rotulos[v]: distancias[v] for v in range(grafo.num_vertices)},
+                {rotulos[v]: rotulos[p] if p != -1 else None for v, p in enumerate(predecessores)})
+
+    distancias_minimas = {no: float('infinity') for no in grafo}
+    distancias_minimas[inicio] = 0
+    predecessores = {no: None for no in grafo}
+    fila_prioridade = [(0, inicio)]
+    relaxacoes = obsoletas = 0
+    
+    while fila_prioridade:
+        distancia_atual, no_atual = heapq.heappop(fila_prioridade)
+        
+        if distancia_atual > distancias_minimas[no_atual]:
+            obsoletas += 1
+            continue
+            
+        for vizinho, peso in grafo[no_atual].items():
+            distancia = distancia_atual + peso
+            
+            if distancia < distancias_minimas[vizinho]:
+                distancias_minimas[vizinho] = distancia
+                predecessores[vizinho] = no_atual
+                heapq.heappush(fila_prioridade, (distancia, vizinho))
+                relaxacoes += 1
+
+    # A fila é esvaziada: cada inserção (a origem + uma por relaxação) vira uma extração
+    if instrumentacao.ligada():
+        assentados = relaxacoes + 1 - obsoletas
+        instrumentacao.registrar('dijkstra', assentados=assentados, insercoes_heap=relaxacoes + 1,
+                                 extracoes_heap=relaxacoes + 1, extracoes_obsoletas=obsoletas,
+                                 relaxacoes=relaxacoes,
+                                 arestas_varridas=sum(len(grafo[no]) for no, d in distancias_minimas.items()
+                                                      if d != float('infinity')))
+    return distancias_minimas, predecessores
+
+def reconstruir_caminho(predecessores, fim):
+    caminho = []
+    no_atual = fim
+    while no_atual is not None:
+        caminho.append(no_atual)
+        no_atual = predecessores[no_atual]
+    caminho.reverse()
+    return caminho
+
+def _dijkstra_ponto_a_ponto(grafo, inicio, fim, heuristica=None):
+    # Dijkstra que para assim que o destino é assentado. Com uma heurística
+    # admissível, vira A* (prioridade = distância + estimativa até o destino)
+    distancias = {inicio: 0}
+    predecessores = {inicio: None}
+    fila_prioridade = [(heuristica(inicio, fim) if heuristica else 0, 0, inicio)]
+    assentados = relaxacoes = obsoletas = 0
+    resultado = float('infinity'), None
+
+    while fila_prioridade:
+        _, distancia_atual, no_atual = heapq.heappop(fila_prioridade)
+        if distancia_atual > distancias[no_atual]:
+            obsoletas += 1
+            continue
+
+        assentados += 1
+        if no_atual == fim:
+            resultado = distancia_atual, reconstruir_caminho(predecessores, fim)
+            break
+
+        for vizinho, peso in grafo[no_atual].items():
+            distancia = distancia_atual + peso
+            if distancia < distancias.get(vizinho, float('infinity')):
+                distancias[vizinho] = distancia
+                predecessores[vizinho] = no_atual
+                prioridade = distancia + (heuristica(vizinho, fim) if heuristica else 0)
+                heapq.heappush(fila_prioridade, (prioridade, distancia, vizinho))
+                relaxacoes += 1
+
+    instrumentacao.registrar('astar' if heuristica else 'dijkstra_ponto_a_ponto', assentados=assentados,
+                             insercoes_heap=relaxacoes + 1,
+                             extracoes_heap=relaxacoes + 1 - len(fila_prioridade),
+                             extracoes_obsoletas=obsoletas, relaxacoes=relaxacoes)
+    return (*resultado, assentados)
+
+def _dijkstra_bidirecional(grafo, inicio, fim, grafo_reverso):
+    # Duas buscas de Dijkstra (a partir da origem em grafo e do destino em
+    # grafo_reverso) que param quando a soma dos topos das filas alcança a
+    # melhor rota já vista por uma aresta que liga as duas buscas
+    if inicio == fim:
+        return 0, [inicio], 1
+
+    distancias = ({inicio: 0}, {fim: 0})
+    predecessores = ({inicio: None}, {fim: None})
+    filas = ([(0, inicio)], [(0, fim)])
+    grafos = (grafo, grafo_reverso)
+    assentados = [set(), set()]
+    melhor, encontro = float('infinity'), None
+    extracoes = obsoletas = 0
+
+    while filas[0] and filas[1]:
+        if filas[0][0][0] + filas[1][0][0] >= melhor:
+            break
+
+        lado = 0 if filas[0][0][0] <= filas[1][0][0] else 1
+        distancia_atual, no_atual = heapq.heappop(filas[lado])
+        extracoes += 1
+        if distancia_atual > distancias[lado][no_atual]:
+            obsoletas += 1
+            continue
+        assentados[lado].add(no_atual)
+
+        outro = distancias[1 - lado]
+        for vizinho, peso in grafos[lado][no_atual].items():
+            distancia = distancia_atual + peso
+            if distancia < distancias[lado].get(vizinho, float('infinity')):
+                distancias[lado][vizinho] = distancia
+                predecessores[lado][vizinho] = no_atual
+                heapq.heappush(filas[lado], (distancia, vizinho))
+            if vizinho in outro and distancia + outro[vizinho] < melhor:
+                melhor = distancia + outro[vizinho]
+                encontro = (no_atual, vizinho) if lado == 0 else (vizinho, no_atual)
+
+    total_assentados = len(assentados[0]) + len(assentados[1])
+    instrumentacao.registrar('dijkstra_bidirecional', assentados=total_assentados,
+                             insercoes_heap=extracoes + len(filas[0]) + len(filas[1]),
+                             extracoes_heap=extracoes, extracoes_obsoletas=obsoletas)
+    if encontro is None:
+        return float('infinity'), None, total_assentados
+
+    ida = reconstruir_caminho(predecessores[0], encontro[0])
+    volta = reconstruir_caminho(predecessores[1], encontro[1])
+    return melhor, ida + volta[::-1], total_assentados
+
+def rota_mais_curta(grafo, inicio, fim, metodo='dijkstra', heuristica=None, grafo_reverso=None):
+    # Consulta ponto a ponto. metodo: 'dijkstra' (com parada antecipada),
+    # 'bidirecional' ou 'astar' (exige heuristica(no, destino) admissível).
+    # grafo_reverso só é necessário no modo bidirecional de um grafo direcionado.
+    # Devolve (distância, caminho, nós assentados); caminho None se não há rota
+    if metodo == 'dijkstra':
+        return _dijkstra_ponto_a_ponto(grafo, inicio, fim)
+    if metodo == 'astar':
+        if heuristica is None:
+            raise ValueError("O método 'astar' exige uma heurística")
+        return _dijkstra_ponto_a_ponto(grafo, inicio, fim, heuristica)
+    if metodo == 'bidirecional':
+        return _dijkstra_bidirecional(grafo, inicio, fim, grafo_reverso or grafo)
+    raise ValueError(f"Método de roteamento desconhecido: '{metodo}'")
+
+def heuristica_grande_circulo(coordenadas, raio_km=6371.0):
+    # Distância em linha reta (haversine) entre cidades com coordenadas
+    # (latitude, longitude) em graus; admissível quando os pesos são
+    # distâncias rodoviárias em km
+    radianos = {cidade: (math.radians(lat), math.radians(lon)) for cidade, (lat, lon) in coordenadas.items()}
+
+    def heuristica(no, destino):
+        lat1, lon1 = radianos[no]
+        lat2, lon2 = radianos[destino]
+        a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+        return 2 * raio_km * math.asin(math.sqrt(a))
+
+    return heuristica
+
+def visualizar_mapa_pyvis(grafo, caminho=None, filename="mapa.html", titulo="Mapa de Cidades"):
+    if len(grafo) > LIMITE_PYVIS:
+        # Grafo grande: exporta em streaming só o caminho e sua vizinhança
+        exportar_caminho(Grafo.de_dicts(grafo), caminho, filename, titulo)
+        print(f"Grafo interativo (caminho e vizinhança) salvo em: '{filename}'")
+        return
+
+    nt = Network(height="800px", width="100%", notebook=True, heading=titulo)
+
+    nos_caminho = set(caminho) if caminho else set()
+    arestas_caminho = set()
+    if caminho and len(caminho) > 1:
+        for i in range(len(caminho) - 1):
+            aresta = tuple(sorted((caminho[i], caminho[i+1])))
+            arestas_caminho.add(aresta)
+
+    for cidade in grafo:
+        cor_no, tamanho_no = ('#1f78b4', 15)
+        if cidade in nos_caminho:
+            cor_no, tamanho_no = ('#e63946', 25)
+        
+        if caminho and cidade == caminho[0]:
+            cor_no, tamanho_no = ('#52b788', 30)
+            nt.add_node(cidade, label=cidade, color=cor_no, size=tamanho_no, title=f"INÍCIO: {cidade}")
+        elif caminho and cidade == caminho[-1]:
+            cor_no, tamanho_no = ('#9b5de5', 30)
+            nt.add_node(cidade, label=cidade, color=cor_no, size=tamanho_no, title=f"FIM: {cidade}")
+        else:
+            nt.add_node(cidade, label=cidade, color=cor_no, size=tamanho_no)
+
+    arestas_adicionadas = set()
+    for cidade_origem, vizinhos in grafo.items():
+        for cidade_destino, distancia in vizinhos.items():
+            aresta = tuple(sorted((cidade_origem, cidade_destino)))
+            if aresta not in arestas_adicionadas:
+                cor_aresta, largura_aresta = ('lightgray', 2)
+                if aresta in arestas_caminho:
+                    cor_aresta, largura_aresta = ('#e63946', 5)
+                nt.add_edge(aresta[0], aresta[1], label=str(distancia), title=f"Distância: {distancia} km", color=cor_aresta, width=largura_aresta)
+                arestas_adicionadas.add(aresta)
+
+    options = """
+    var options = {
+      "configure": {
+        "enabled": true,
+        "filter": "physics"
+      },
+      "physics": {
+        "stabilization": {
+          "enabled": true,
+          "iterations": 1000,
+          "fit": true
+        },
+        "barnesHut": {
+          "gravitationalConstant": -80000,
+          "centralGravity": 0.3,
+          "springLength": 250,
+          "springConstant": 0.04,
+          "damping": 0.09,
+          "avoidOverlap": 0.5
+        }
+      }
+    }
+    """
+    nt.set_options(options)
+    
+    nt.save_graph(filename)
+    print(f"Mapa interativo e estabilizado salvo em: '{filename}'")
+
+def main():
+    
+    cidades = [
+        "Caminha", "V. Castelo", "Leixões", "Aveiro", "F. da Foz", "Nazaré",
+        "Peniche", "Cascais", "Lisboa", "Sesimbra", "Setúbal", "Sines",
+        "Baleeira", "Lagos", "Portimão", "Vilamoura", "C. Sta. Maria", 
+        "Tavira", "VRS. António"
+    ]
+
+    # (latitude, longitude) aproximadas, para a heurística do A*
+    coordenadas = {
+        "Caminha": (41.875, -8.838), "V. Castelo": (41.693, -8.832), "Leixões": (41.183, -8.703),
+        "Aveiro": (40.641, -8.654), "F. da Foz": (40.150, -8.862), "Nazaré": (39.602, -9.071),
+        "Peniche": (39.356, -9.381), "Cascais": (38.697, -9.421), "Lisboa": (38.722, -9.139),
+        "Sesimbra": (38.444, -9.101), "Setúbal": (38.524, -8.888), "Sines": (37.956, -8.869),
+        "Baleeira": (37.008, -8.936), "Lagos": (37.102, -8.673), "Portimão": (37.136, -8.537),
+        "Vilamoura": (37.077, -8.118), "C. Sta. Maria": (36.960, -7.888), "Tavira": (37.127, -7.650),
+        "VRS. António": (37.194, -7.416)
+    }
+
+    matriz_distancias = [
+        [0, 12, 43, 75, 105, 138, 156, 201, 206, 221, 223, 249, 302, 315, 322, 342, 356, 373, 384],
+        [12, 0, 31, 63, 93, 126, 144, 189, 194, 209, 221, 237, 290, 303, 310, 330, 344, 361, 372],
+        [43, 31, 0, 32, 63, 96, 116, 160, 172, 181, 193, 209, 262, 275, 282, 302, 316, 333, 344],
+        [75, 63, 32, 0, 31, 64, 85, 129, 141, 150, 162, 178, 231, 244, 251, 271, 285, 302, 313],
+        [105, 93, 63, 31, 0, 34, 56, 100, 112, 121, 133, 149, 202, 215, 222, 242, 256, 273, 284],
+        [138, 126, 96, 64, 34, 0, 23, 65, 79, 88, 100, 116, 169, 181, 189, 209, 223, 240, 251],
+        [156, 144, 116, 85, 56, 23, 0, 45, 57, 66, 78, 94, 147, 160, 167, 187, 201, 218, 229],
+        [201, 189, 160, 129, 100, 65, 45, 0, 5, 26, 35, 49, 112, 123, 133, 154, 166, 174, 191],
+        [206, 194, 172, 141, 112, 79, 57, 5, 0, 23, 32, 47, 111, 122, 132, 153, 165, 173, 190],
+        [221, 209, 181, 150, 121, 88, 66, 26, 23, 0, 10, 32, 92, 107, 112, 130, 142, 158, 170],
+        [223, 221, 193, 162, 133, 100, 78, 35, 32, 10, 0, 33, 95, 109, 115, 133, 145, 161, 172],
+        [249, 237, 209, 178, 149, 116, 94, 49, 47, 32, 33, 0, 63, 77, 83, 101, 113, 129, 141],
+        [302, 290, 262, 231, 202, 169, 147, 112, 111, 92, 95, 63, 0, 14, 20, 39, 50, 66, 76],
+        [315, 303, 275, 244, 215, 181, 160, 123, 122, 107, 109, 77, 14, 0, 7, 26, 40, 56, 66],
+        [322, 310, 282, 251, 222, 189, 167, 133, 132, 112, 115, 83, 20, 7, 0, 20, 33, 49, 59],
+        [342, 330, 302, 271, 242, 209, 187, 154, 153, 130, 133, 101, 39, 26, 20, 0, 15, 31, 41],
+        [356, 344, 316, 285, 256, 223, 201, 166, 165, 142, 145, 113, 50, 40, 33, 15, 0, 16, 26],
+        [373, 361, 333, 302, 273, 240, 218, 174, 173, 158, 161, 129, 66, 56, 49, 31, 16, 0, 11],
+        [384, 372, 344, 313, 284, 251, 229, 191, 190, 170, 172, 141, 76, 66, 59, 41, 26, 11, 0]
+    ]
+    
+    with instrumentacao.fase('construcao'):
+        grafo = construir_grafo(cidades, matriz_distancias)
+    cidade_inicio = 'Leixões'
+    cidade_fim = 'Tavira'
+
+    print("=" * 60)
+    print("ENCONTRANDO A MELHOR ROTA (Q4) COM DIJKSTRA E PYVIS")
+    print("=" * 60)
+
+    print("\n1. Gerando visualização do mapa completo de Portugal...")
+    with instrumentacao.fase('renderizacao'):
+        visualizar_mapa_pyvis(
+            grafo, 
+            caminho=None, 
+            filename="Q4_mapa_completo.html", 
+            titulo="Mapa de Estradas de Portugal (Antes da Rota)"
+        )
+
+    print(f"\n2. Calculando a melhor rota de '{cidade_inicio}' para '{cidade_fim}'...")
+    with instrumentacao.fase('solucao'):
+        distancia, caminho, assentados = rota_mais_curta(grafo, cidade_inicio, cidade_fim)
+
+    if caminho is None:
+        print(f"Não foi possível encontrar uma rota de '{cidade_inicio}' para '{cidade_fim}'.")
+    else:
+        print("Rota encontrada!")
+        print(f"   Distância total: {distancia} km")
+        print("   Caminho: " + " -> ".join(caminho))
+
+        # Perfil próprio só para ler quantos nós o Dijkstra completo assentou
+        with instrumentacao.perfilar() as perfil:
+            dijkstra(grafo, cidade_inicio)
+        assentados_completo = perfil.contadores['dijkstra']['assentados']
+
+        # As distâncias da matriz não estão em km e algumas ficam abaixo da
+        # linha reta; o raio é o maior que ainda mantém a heurística admissível
+        unitaria = heuristica_grande_circulo(coordenadas, raio_km=1.0)
+        raio = min(peso / unitaria(origem, destino) for origem, vizinhos in grafo.items()
+                   for destino, peso in vizinhos.items())
+        heuristica = heuristica_grande_circulo(coordenadas, raio_km=raio)
+        distancia_astar, _, assentados_astar = rota_mais_curta(grafo, cidade_inicio, cidade_fim, 'astar', heuristica)
+
+        print("   Nós assentados por consulta:")
+        print(f"      Dijkstra completo: {assentados_completo}")
+        print(f"      Dijkstra com parada antecipada: {assentados}")
+        print(f"      Dijkstra bidirecional: {rota_mais_curta(grafo, cidade_inicio, cidade_fim, 'bidirecional')[2]}")
+        print(f"      A* (grande círculo): {assentados_astar} (mesma distância: {distancia_astar == distancia})")
+
+        with instrumentacao.fase('construcao'):
+            podado = construir_grafo(cidades, matriz_distancias, podar=True)
+        distancia_podado = rota_mais_curta(podado, cidade_inicio, cidade_fim)[0]
+        print(f"   Arestas: {sum(map(len, grafo.values()))} no grafo completo, "
+              f"{sum(map(len, podado.values()))} sem as dominadas (mesma distância: {distancia_podado == distancia})")
+        
+        print("\n3. Gerando visualização do mapa com a rota destacada...")
+        with instrumentacao.fase('renderizacao'):
+            visualizar_mapa_pyvis(
+                grafo, 
+                caminho=caminho, 
+                filename="Q4_rota_solucao.html", 
+                titulo=f"Melhor Rota: {cidade_inicio} para {cidade_fim}"
+            )
+
+    print("\n" + "=" * 60)
+    print("Execução concluída. Abra os arquivos .html gerados no seu navegador.")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    # python Q4.py [--profile]
+    with instrumentacao.perfilar_se_pedido():
+        main()
\ No newline at end of file
@@ -0,0 +1,54 @@
+import math
+import random
+import sys
+import time
+
+from Q4 import construir_grafo, dijkstra
+
+def gerar_matriz(n, semente=0):
+    # Matriz completa de distâncias rodoviárias sintéticas: linha reta entre
+    # pontos aleatórios (escala de 500 km) vezes um fator de sinuosidade
+    rng = random.Random(semente)
+    pontos = [(rng.random(), rng.random()) for _ in range(n)]
+    matriz = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            distancia = 500 * math.dist(pontos[i], pontos[j]) * rng.uniform(1.0, 1.4)
+            matriz[i][j] = matriz[j][i] = max(1, round(distancia))
+    return matriz
+
+def main():
+    # Uso: python benchmark_poda.py [num_cidades] [vizinhos_proximos]
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    matriz = gerar_matriz(n)
+    cidades = list(range(n))
+    origens = random.Random(1).sample(cidades, min(n, 5))
+
+    variantes = [('completo', {}), ('podado', {'podar': True}), (f'{k} vizinhos', {'vizinhos_proximos': k})]
+    referencia = None
+    print(f"{'grafo':>12} {'arestas':>10} {'construção':>11} {'dijkstra':>10} {'rotas alteradas':>16} {'maior desvio':>13}")
+    for nome, opcoes in variantes:
+        inicio = time.perf_counter()
+        grafo = construir_grafo(cidades, matriz, **opcoes)
+        tempo_construcao = time.perf_counter() - inicio
+        arestas = sum(len(vizinhos) for vizinhos in grafo.values())
+
+        inicio = time.perf_counter()
+        distancias = [dijkstra(grafo, origem)[0] for origem in origens]
+        tempo_dijkstra = (time.perf_counter() - inicio) / len(origens)
+
+        if referencia is None:
+            referencia = distancias
+        alteradas, desvio = 0, 1.0
+        for exatas, obtidas in zip(referencia, distancias):
+            for destino, distancia in exatas.items():
+                if obtidas[destino] != distancia:
+                    alteradas += 1
+                    if distancia:
+                        desvio = max(desvio, obtidas[destino] / distancia)
+        print(f"{nome:>12} {arestas:>10} {tempo_construcao:>10.3f}s {tempo_dijkstra * 1e3:>8.1f}ms "
+              f"{alteradas:>16} {desvio:>12.3f}x")
+
+if __name__ == "__main__":
+    main()
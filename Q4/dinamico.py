@@ -0,0 +1,173 @@
+import heapq
+import random
+import sys
+import time
+
+from Q4 import dijkstra, reconstruir_caminho
+from hierarquia import gerar_rede
+
+class RedeDinamica:
+    # Rede rodoviária mutável (arestas direcionadas). As árvores de caminhos
+    # mínimos já calculadas por origem são reparadas a cada alteração, no
+    # estilo de Ramalingam–Reps, em vez de recalculadas do zero
+    __slots__ = ('grafo', 'reverso', 'arvores')
+
+    def __init__(self, grafo=None):
+        self.grafo = {}
+        self.reverso = {}
+        self.arvores = {}
+        for origem, vizinhos in (grafo or {}).items():
+            self._garantir_no(origem)
+            for destino, peso in vizinhos.items():
+                self._garantir_no(destino)
+                self.grafo[origem][destino] = peso
+                self.reverso[destino][origem] = peso
+
+    def _garantir_no(self, no):
+        if no not in self.grafo:
+            self.grafo[no] = {}
+            self.reverso[no] = {}
+            for distancias, predecessores in self.arvores.values():
+                distancias[no] = float('infinity')
+                predecessores[no] = None
+
+    def arvore(self, origem):
+        # (distâncias, predecessores) a partir de origem, mantidos atualizados
+        if origem not in self.arvores:
+            self.arvores[origem] = dijkstra(self.grafo, origem)
+        return self.arvores[origem]
+
+    def rota(self, origem, destino):
+        distancias, predecessores = self.arvore(origem)
+        if distancias[destino] == float('infinity'):
+            return distancias[destino], None
+        return distancias[destino], reconstruir_caminho(predecessores, destino)
+
+    def esquecer(self, origem):
+        self.arvores.pop(origem, None)
+
+    def inserir_aresta(self, u, v, peso):
+        # Também serve para alterar o peso de uma aresta existente
+        self._garantir_no(u)
+        self._garantir_no(v)
+        antigo = self.grafo[u].get(v)
+        self.grafo[u][v] = peso
+        self.reverso[v][u] = peso
+
+        for arvore in self.arvores.values():
+            if antigo is not None and peso > antigo:
+                self._reparar_aumento(arvore, u, v)
+            else:
+                self._reparar_reducao(arvore, u, v, peso)
+
+    alterar_peso = inserir_aresta
+
+    def remover_aresta(self, u, v):
+        del self.grafo[u][v]
+        del self.reverso[v][u]
+        for arvore in self.arvores.values():
+            self._reparar_aumento(arvore, u, v)
+
+    def _propagar(self, arvore, fila):
+        # Dijkstra a partir dos nós da fila, que já têm distâncias provisórias
+        distancias, predecessores = arvore
+        while fila:
+            distancia_atual, no_atual = heapq.heappop(fila)
+            if distancia_atual > distancias[no_atual]:
+                continue
+            for vizinho, peso in self.grafo[no_atual].items():
+                distancia = distancia_atual + peso
+                if distancia < distancias[vizinho]:
+                    distancias[vizinho] = distancia
+                    predecessores[vizinho] = no_atual
+                    heapq.heappush(fila, (distancia, vizinho))
+
+    def _reparar_reducao(self, arvore, u, v, peso):
+        # Uma aresta mais barata só afeta a árvore se melhorar a distância de v
+        distancias, predecessores = arvore
+        distancia = distancias[u] + peso
+        if distancia < distancias[v]:
+            distancias[v] = distancia
+            predecessores[v] = u
+            self._propagar(arvore, [(distancia, v)])
+
+    def _reparar_aumento(self, arvore, u, v):
+        # Só a subárvore pendurada em u -> v pode piorar. Esses nós são
+        # invalidados e recebem a melhor distância vinda de fora da subárvore
+        distancias, predecessores = arvore
+        if predecessores[v] != u:
+            return
+
+        afetados = [v]
+        pilha = [v]
+        while pilha:
+            x = pilha.pop()
+            for y in self.grafo[x]:
+                if predecessores[y] == x:
+                    afetados.append(y)
+                    pilha.append(y)
+        for x in afetados:
+            distancias[x] = float('infinity')
+            predecessores[x] = None
+
+        fila = []
+        for x in afetados:
+            for anterior, peso in self.reverso[x].items():
+                distancia = distancias[anterior] + peso
+                if distancia < distancias[x]:
+                    distancias[x] = distancia
+                    predecessores[x] = anterior
+            if distancias[x] < float('infinity'):
+                fila.append((distancias[x], x))
+        heapq.heapify(fila)
+        self._propagar(arvore, fila)
+
+def main():
+    # Uso: python dinamico.py [num_nos]
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 40_000
+    rede = RedeDinamica(gerar_rede(n))
+    arestas = [(u, v) for u, vizinhos in rede.grafo.items() for v in vizinhos]
+    print(f"Rede com {n} nós e {len(arestas)} arestas")
+
+    rng = random.Random(0)
+    origens = [rng.randrange(n) for _ in range(4)]
+    for origem in origens:
+        rede.arvore(origem)
+
+    # 10% de interdições e o restante de mudanças de peso (trânsito)
+    atualizacoes = []
+    removidas = set()
+    for _ in range(200):
+        u, v = rng.choice(arestas)
+        if (u, v) in removidas:
+            continue
+        if rng.random() < 0.1:
+            removidas.add((u, v))
+            atualizacoes.append(('remover', u, v, None))
+        else:
+            atualizacoes.append(('peso', u, v, max(1, int(rede.grafo[u][v] * rng.uniform(0.5, 2.0)))))
+
+    inicio = time.perf_counter()
+    for tipo, u, v, peso in atualizacoes:
+        if tipo == 'remover':
+            rede.remover_aresta(u, v)
+        else:
+            rede.alterar_peso(u, v, peso)
+        for origem in origens:
+            rede.rota(origem, v)
+    tempo_incremental = (time.perf_counter() - inicio) / len(atualizacoes)
+
+    amostra = atualizacoes[:5]
+    inicio = time.perf_counter()
+    for _ in amostra:
+        for origem in origens:
+            dijkstra(rede.grafo, origem)
+    tempo_completo = (time.perf_counter() - inicio) / len(amostra)
+
+    corretas = all(rede.arvore(origem)[0] == dijkstra(rede.grafo, origem)[0] for origem in origens)
+    print(f"Atualização + consulta ({len(origens)} árvores): {tempo_incremental * 1e3:.2f} ms incremental, "
+          f"{tempo_completo * 1e3:.2f} ms recalculando")
+    print("Distâncias idênticas ao dijkstra:", corretas)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+import heapq
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from array import array
+
+from Q4 import dijkstra
+
+MAGIA = b'CHQ4'
+# Buscas de testemunha param após assentar este número de nós; no pior caso
+# sobra um atalho desnecessário, o que não afeta a exatidão das consultas
+LIMITE_TESTEMUNHA = 500
+
+class HierarquiaContracao:
+    # Índice de roteamento por contraction hierarchies. "subida" guarda, para
+    # cada nó, as arestas (originais ou atalhos) para nós de posto maior;
+    # "descida" guarda as arestas que chegam ao nó vindas de nós de posto maior.
+    # Ambas em CSR: (inicios, destinos, pesos, meios), com meio == -1 para
+    # arestas originais e o nó contraído no caso de atalhos
+    __slots__ = ('rotulos', 'indice', 'posto', 'subida', 'descida')
+
+    def __init__(self, rotulos, posto, subida, descida):
+        self.rotulos = rotulos
+        self.indice = {rotulo: i for i, rotulo in enumerate(rotulos)}
+        self.posto = posto
+        self.subida = subida
+        self.descida = descida
+
+    def _busca(self, s, t):
+        # Dijkstra bidirecional que só sobe na hierarquia nos dois sentidos
+        distancias = ({s: 0.0}, {t: 0.0})
+        pais = ({s: -1}, {t: -1})
+        filas = ([(0.0, s)], [(0.0, t)])
+        grafos = (self.subida, self.descida)
+        melhor, encontro = float('infinity'), -1
+
+        while filas[0] or filas[1]:
+            if not filas[1] or (filas[0] and filas[0][0][0] <= filas[1][0][0]):
+                lado = 0
+            else:
+                lado = 1
+            distancia, x = heapq.heappop(filas[lado])
+            if distancia > distancias[lado][x]:
+                continue
+            if distancia >= melhor:
+                filas[lado].clear()
+                continue
+
+            outro = distancias[1 - lado].get(x)
+            if outro is not None and distancia + outro < melhor:
+                melhor, encontro = distancia + outro, x
+
+            inicios, destinos, pesos, _ = grafos[lado]
+            dist_lado, pai_lado = distancias[lado], pais[lado]
+            for k in range(inicios[x], inicios[x + 1]):
+                y = destinos[k]
+                nova = distancia + pesos[k]
+                if nova < dist_lado.get(y, float('infinity')):
+                    dist_lado[y] = nova
+                    pai_lado[y] = x
+                    heapq.heappush(filas[lado], (nova, y))
+
+        return melhor, encontro, pais
+
+    def distancia(self, origem, destino):
+        return self._busca(self.indice[origem], self.indice[destino])[0]
+
+    def rota(self, origem, destino):
+        # Devolve (distância, caminho) com os atalhos já desempacotados;
+        # caminho é None quando não há rota
+        s, t = self.indice[origem], self.indice[destino]
+        melhor, encontro, pais = self._busca(s, t)
+        if encontro == -1:
+            return melhor, None
+
+        nos = []
+        x = encontro
+        while x != -1:
+            nos.append(x)
+            x = pais[0][x]
+        nos.reverse()
+        x = pais[1][encontro]
+        while x != -1:
+            nos.append(x)
+            x = pais[1][x]
+
+        caminho = [nos[0]]
+        for a, b in zip(nos, nos[1:]):
+            caminho.extend(self._desempacotar(a, b))
+        return melhor, [self.rotulos[v] for v in caminho]
+
+    def _meio(self, a, b):
+        # Nó intermediário da aresta a -> b da hierarquia (-1 se for original)
+        if self.posto[a] < self.posto[b]:
+            (inicios, destinos, _, meios), dono, alvo = self.subida, a, b
+        else:
+            (inicios, destinos, _, meios), dono, alvo = self.descida, b, a
+        for k in range(inicios[dono], inicios[dono + 1]):
+            if destinos[k] == alvo:
+                return meios[k]
+        raise KeyError((a, b))
+
+    def _desempacotar(self, a, b):
+        # Nós do caminho original de a até b (sem incluir a)
+        resultado = []
+        pilha = [(a, b)]
+        while pilha:
+            x, y = pilha.pop()
+            meio = self._meio(x, y)
+            if meio == -1:
+                resultado.append(y)
+            else:
+                pilha.append((meio, y))
+                pilha.append((x, meio))
+        return resultado
+
+    def salvar(self, arquivo):
+        # Cabeçalho JSON (rótulos e tamanhos) seguido dos arrays binários
+        cabecalho = json.dumps({
+            'rotulos': self.rotulos,
+            'arestas_subida': len(self.subida[1]),
+            'arestas_descida': len(self.descida[1]),
+        }).encode('utf-8')
+        with open(arquivo, 'wb') as f:
+            f.write(MAGIA)
+            f.write(len(cabecalho).to_bytes(8, 'little'))
+            f.write(cabecalho)
+            self.posto.tofile(f)
+            for csr in (self.subida, self.descida):
+                for dados in csr:
+                    dados.tofile(f)
+
+    @classmethod
+    def carregar(cls, arquivo):
+        with open(arquivo, 'rb') as f:
+            if f.read(4) != MAGIA:
+                raise ValueError(f"'{arquivo}' não é um índice de hierarquia de contração")
+            tamanho = int.from_bytes(f.read(8), 'little')
+            cabecalho = json.loads(f.read(tamanho).decode('utf-8'))
+            n = len(cabecalho['rotulos'])
+
+            def ler(tipo, quantidade):
+                dados = array(tipo)
+                dados.fromfile(f, quantidade)
+                return dados
+
+            posto = ler('q', n)
+            csrs = []
+            for m in (cabecalho['arestas_subida'], cabecalho['arestas_descida']):
+                csrs.append((ler('q', n + 1), ler('q', m), ler('d', m), ler('q', m)))
+        return cls(cabecalho['rotulos'], posto, *csrs)
+
+def _buscar_testemunhas(saida, origem, ignorado, limite_distancia):
+    # Dijkstra local a partir de origem sem passar por ignorado
+    distancias = {origem: 0}
+    fila = [(0, origem)]
+    assentados = 0
+    while fila:
+        distancia, x = heapq.heappop(fila)
+        if distancia > distancias[x]:
+            continue
+        if distancia > limite_distancia or assentados >= LIMITE_TESTEMUNHA:
+            break
+        assentados += 1
+        for y, (peso, _) in saida[x].items():
+            if y == ignorado:
+                continue
+            nova = distancia + peso
+            if nova < distancias.get(y, float('infinity')):
+                distancias[y] = nova
+                heapq.heappush(fila, (nova, y))
+    return distancias
+
+def _atalhos_necessarios(saida, entrada, v):
+    # Atalhos u -> w exigidos ao contrair v: só quando não há caminho
+    # alternativo (testemunha) tão curto quanto u -> v -> w
+    atalhos = []
+    for u, (peso_uv, _) in entrada[v].items():
+        limite = peso_uv + max((peso for peso, _ in saida[v].values()), default=0)
+        testemunhas = _buscar_testemunhas(saida, u, v, limite)
+        for w, (peso_vw, _) in saida[v].items():
+            if w != u and testemunhas.get(w, float('infinity')) > peso_uv + peso_vw:
+                atalhos.append((u, w, peso_uv + peso_vw))
+    return atalhos
+
+def _montar_csr(listas):
+    inicios, destinos, pesos, meios = array('q', [0]), array('q'), array('d'), array('q')
+    for arestas in listas:
+        for destino, peso, meio in arestas:
+            destinos.append(destino)
+            pesos.append(peso)
+            meios.append(meio)
+        inicios.append(len(destinos))
+    return inicios, destinos, pesos, meios
+
+def construir_hierarquia(grafo):
+    # Pré-processamento: contrai os nós em ordem de "diferença de arestas"
+    # (atalhos criados - arestas removidas + vizinhos já contraídos), com
+    # atualização preguiçosa das prioridades
+    rotulos = list(grafo)
+    indice = {rotulo: i for i, rotulo in enumerate(rotulos)}
+    for vizinhos in grafo.values():
+        for destino in vizinhos:
+            if destino not in indice:
+                indice[destino] = len(rotulos)
+                rotulos.append(destino)
+
+    n = len(rotulos)
+    saida = [{} for _ in range(n)]
+    entrada = [{} for _ in range(n)]
+    for origem, vizinhos in grafo.items():
+        u = indice[origem]
+        for destino, peso in vizinhos.items():
+            w = indice[destino]
+            if u != w and peso < saida[u].get(w, (float('infinity'),))[0]:
+                saida[u][w] = entrada[w][u] = (peso, -1)
+
+    contraidos_vizinhos = [0] * n
+
+    def prioridade(v):
+        # Devolve também os atalhos, reaproveitados se v for contraído em seguida
+        atalhos = _atalhos_necessarios(saida, entrada, v)
+        removidas = len(saida[v]) + len(entrada[v])
+        return len(atalhos) - removidas + contraidos_vizinhos[v], atalhos
+
+    fila = [(prioridade(v)[0], v) for v in range(n)]
+    heapq.heapify(fila)
+    posto = array('q', [0]) * n
+    subida = [[] for _ in range(n)]
+    descida = [[] for _ in range(n)]
+    proximo_posto = 0
+
+    while fila:
+        _, v = heapq.heappop(fila)
+        atual, atalhos = prioridade(v)
+        if fila and atual > fila[0][0]:
+            heapq.heappush(fila, (atual, v))
+            continue
+
+        posto[v] = proximo_posto
+        proximo_posto += 1
+
+        # As arestas que restam em v levam a nós ainda não contraídos, ou seja, de posto maior
+        for w, (peso, meio) in saida[v].items():
+            subida[v].append((w, peso, meio))
+            del entrada[w][v]
+            contraidos_vizinhos[w] += 1
+        for u, (peso, meio) in entrada[v].items():
+            descida[v].append((u, peso, meio))
+            del saida[u][v]
+            contraidos_vizinhos[u] += 1
+        saida[v].clear()
+        entrada[v].clear()
+
+        for u, w, peso in atalhos:
+            if peso < saida[u].get(w, (float('infinity'),))[0]:
+                saida[u][w] = entrada[w][u] = (peso, v)
+
+    return HierarquiaContracao(rotulos, posto, _montar_csr(subida), _montar_csr(descida))
+
+def verificar_hierarquia(grafo, hierarquia, consultas=200, semente=0):
+    # Compara distâncias e caminhos da hierarquia com dijkstra em pares aleatórios;
+    # com pesos float a soma dos atalhos pode diferir nos últimos bits
+    rng = random.Random(semente)
+    nos = list(grafo)
+    for _ in range(consultas):
+        origem, destino = rng.choice(nos), rng.choice(nos)
+        esperado = dijkstra(grafo, origem)[0][destino]
+        distancia, caminho = hierarquia.rota(origem, destino)
+        if not math.isclose(distancia, esperado, rel_tol=1e-9):
+            return False
+        if caminho is not None:
+            custo = sum(grafo[a][b] for a, b in zip(caminho, caminho[1:]))
+            if caminho[0] != origem or caminho[-1] != destino or not math.isclose(custo, esperado, rel_tol=1e-9):
+                return False
+    return True
+
+def gerar_rede(n, grau_medio=4, semente=0):
+    # Rede rodoviária sintética: pontos aleatórios no plano ligados aos mais
+    # próximos, com distâncias inteiras e estradas de mão dupla
+    rng = random.Random(semente)
+    pontos = [(rng.random(), rng.random()) for _ in range(n)]
+    grafo = {i: {} for i in range(n)}
+    ordem = sorted(range(n), key=lambda i: pontos[i])
+    for a, i in enumerate(ordem):
+        candidatos = ordem[a + 1:a + 1 + 4 * grau_medio]
+        candidatos.sort(key=lambda j: (pontos[i][0] - pontos[j][0]) ** 2 + (pontos[i][1] - pontos[j][1]) ** 2)
+        for j in candidatos[:grau_medio // 2 + 1]:
+            peso = 1 + int(1000 * ((pontos[i][0] - pontos[j][0]) ** 2 + (pontos[i][1] - pontos[j][1]) ** 2) ** 0.5)
+            grafo[i][j] = grafo[j][i] = peso
+    return grafo
+
+def main():
+    # Uso: python hierarquia.py [num_nos]
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    grafo = gerar_rede(n)
+
+    inicio = time.perf_counter()
+    hierarquia = construir_hierarquia(grafo)
+    print(f"Pré-processamento de {n} nós: {time.perf_counter() - inicio:.2f}s")
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = os.path.join(pasta, 'indice.chq4')
+        hierarquia.salvar(arquivo)
+        print(f"Índice salvo: {os.path.getsize(arquivo) / 1024:.0f} KiB")
+        hierarquia = HierarquiaContracao.carregar(arquivo)
+
+    rng = random.Random(1)
+    pares = [(rng.randrange(n), rng.randrange(n)) for _ in range(200)]
+    inicio = time.perf_counter()
+    for origem, destino in pares:
+        hierarquia.rota(origem, destino)
+    tempo_ch = (time.perf_counter() - inicio) / len(pares)
+    inicio = time.perf_counter()
+    for origem, _ in pares[:20]:
+        dijkstra(grafo, origem)
+    tempo_dijkstra = (time.perf_counter() - inicio) / 20
+
+    print(f"Consulta média: {tempo_ch * 1e6:.0f} µs (dijkstra: {tempo_dijkstra * 1e6:.0f} µs)")
+
+if __name__ == "__main__":
+    main()
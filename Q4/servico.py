@@ -0,0 +1,149 @@
+import json
+import mmap
+import sys
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from Q4 import dijkstra, reconstruir_caminho
+
+MAGIA = b'APQ4'
+
+class MatrizDistancias:
+    # Matriz n × n de distâncias em float32, lida diretamente de um buffer
+    # (bytearray ou arquivo mapeado em memória). Distâncias acima de 2**24
+    # perdem a exatidão em float32
+    __slots__ = ('nos', 'indice', 'valores', '_mapa')
+
+    def __init__(self, nos, buffer, deslocamento=0, mapa=None):
+        n = len(nos)
+        self.nos = nos
+        self.indice = {no: i for i, no in enumerate(nos)}
+        # Visão plana: o elemento (i, j) fica na posição i * n + j
+        self.valores = memoryview(buffer)[deslocamento:deslocamento + 4 * n * n].cast('f')
+        self._mapa = mapa
+
+    def distancia(self, origem, destino):
+        return self.valores[self.indice[origem] * len(self.nos) + self.indice[destino]]
+
+    def linha(self, origem):
+        n = len(self.nos)
+        i = self.indice[origem]
+        return array('f', self.valores[n * i:n * (i + 1)])
+
+    def fechar(self):
+        self.valores.release()
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+
+    @classmethod
+    def carregar(cls, arquivo):
+        # Mapeia o arquivo em memória sem ler a matriz; as páginas são
+        # carregadas pelo sistema operacional sob demanda
+        with open(arquivo, 'rb') as f:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if mapa[:4] != MAGIA:
+            mapa.close()
+            raise ValueError(f"'{arquivo}' não é uma matriz de distâncias")
+        tamanho = int.from_bytes(mapa[4:12], 'little')
+        nos = json.loads(mapa[12:12 + tamanho].decode('utf-8'))
+        return cls(nos, mapa, _inicio_dados(tamanho), mapa)
+
+def _inicio_dados(tamanho_cabecalho):
+    # Os dados começam alinhados em 4 bytes, logo após o cabeçalho
+    return (12 + tamanho_cabecalho + 3) // 4 * 4
+
+_grafo_trabalhador = {}
+
+def _iniciar_trabalhador(grafo, nos):
+    _grafo_trabalhador.update(grafo=grafo, nos=nos)
+
+def _linhas(indices):
+    grafo, nos = _grafo_trabalhador['grafo'], _grafo_trabalhador['nos']
+    resultado = []
+    for i in indices:
+        distancias, _ = dijkstra(grafo, nos[i])
+        resultado.append((i, array('f', (distancias.get(no, float('infinity')) for no in nos)).tobytes()))
+    return resultado
+
+class ServicoRotas:
+    # Serviço de rotas sobre um grafo fixo: guarda as árvores de caminhos
+    # mínimos (distâncias, predecessores) por origem em um cache LRU limitado
+    # pelo uso estimado de memória
+    __slots__ = ('grafo', 'limite_bytes', 'arvores', 'bytes_em_uso', 'acertos', 'falhas')
+
+    def __init__(self, grafo, limite_bytes=64 * 1024 * 1024):
+        self.grafo = grafo
+        self.limite_bytes = limite_bytes
+        self.arvores = OrderedDict()
+        self.bytes_em_uso = 0
+        self.acertos = 0
+        self.falhas = 0
+
+    @staticmethod
+    def _tamanho(arvore):
+        distancias, predecessores = arvore
+        # Dicts mais os floats das distâncias (os rótulos são compartilhados com o grafo)
+        return sys.getsizeof(distancias) + sys.getsizeof(predecessores) + 24 * len(distancias)
+
+    def arvore(self, origem):
+        arvore = self.arvores.get(origem)
+        if arvore is not None:
+            self.acertos += 1
+            self.arvores.move_to_end(origem)
+            return arvore
+
+        self.falhas += 1
+        arvore = dijkstra(self.grafo, origem)
+        self.arvores[origem] = arvore
+        self.bytes_em_uso += self._tamanho(arvore)
+        # Descarta as árvores usadas há mais tempo, mantendo sempre a mais recente
+        while self.bytes_em_uso > self.limite_bytes and len(self.arvores) > 1:
+            _, antiga = self.arvores.popitem(last=False)
+            self.bytes_em_uso -= self._tamanho(antiga)
+        return arvore
+
+    def rota(self, origem, destino):
+        # Devolve (distância, caminho); caminho é None quando não há rota
+        distancias, predecessores = self.arvore(origem)
+        if distancias[destino] == float('infinity'):
+            return distancias[destino], None
+        return distancias[destino], reconstruir_caminho(predecessores, destino)
+
+    def limpar_cache(self):
+        self.arvores.clear()
+        self.bytes_em_uso = 0
+
+    def all_pairs(self, arquivo=None, trabalhadores=None, tamanho_lote=64):
+        # Matriz completa de distâncias, com um dijkstra por origem distribuído
+        # entre processos. Com arquivo, a matriz é gravada em disco e devolvida
+        # mapeada em memória (pode ser reaberta com MatrizDistancias.carregar)
+        nos = list(self.grafo)
+        n = len(nos)
+        cabecalho = json.dumps(nos).encode('utf-8')
+        inicio = _inicio_dados(len(cabecalho))
+
+        if arquivo is None:
+            buffer = bytearray(4 * n * n)
+            inicio = 0
+        else:
+            with open(arquivo, 'wb') as f:
+                f.write(MAGIA)
+                f.write(len(cabecalho).to_bytes(8, 'little'))
+                f.write(cabecalho)
+                f.truncate(inicio + 4 * n * n)
+            with open(arquivo, 'r+b') as f:
+                buffer = mmap.mmap(f.fileno(), 0)
+
+        lotes = [range(i, min(i + tamanho_lote, n)) for i in range(0, n, tamanho_lote)]
+        with ProcessPoolExecutor(trabalhadores, initializer=_iniciar_trabalhador,
+                                 initargs=(self.grafo, nos)) as executor:
+            for linhas in executor.map(_linhas, lotes):
+                for i, dados in linhas:
+                    buffer[inicio + 4 * n * i:inicio + 4 * n * (i + 1)] = dados
+
+        if arquivo is None:
+            return MatrizDistancias(nos, buffer)
+        buffer.flush()
+        return MatrizDistancias(nos, buffer, inicio, buffer)
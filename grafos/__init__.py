@@ -0,0 +1,4 @@
+from grafos.heap import HeapIndexado
+from grafos.nucleo import Grafo
+
+__all__ = ['Grafo', 'HeapIndexado']
@@ -0,0 +1,170 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+
+from grafos import instrumentacao
+from grafos.cli import Q1, Q2, Q3, Q4
+from grafos.geradores import GERADORES, gerar_grafo
+
+# Raiz do checkout, para identificar a versão do código nos resultados
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TAMANHOS = (10**3, 10**4, 10**5, 10**6, 10**7)
+
+BACKENDS = {
+    'coloracao': Q1.ESTRATEGIAS_ORDENACAO,
+    'mst': ('prim', 'kruskal'),
+    'caminho': ('dfs', 'bfs', 'bidirecional', 'dfs_dict'),
+    'rota': ('csr', 'dict'),
+}
+
+# Backends sobre dicts (formato original dos scripts) só até este número de
+# arestas: acima disso a conversão sozinha ocupa vários GB
+LIMITE_DICT = 10**6
+
+def _preparar(algoritmo, backend, grafo):
+    # Devolve a função medida; conversões de formato ficam fora da medição
+    ultimo = grafo.num_vertices - 1
+    if algoritmo == 'coloracao':
+        return lambda: Q1.algoritmo_guloso_coloracao(grafo, backend)
+    if algoritmo == 'mst':
+        return lambda: Q2.arvore_geradora_minima(grafo, backend)
+    if algoritmo == 'caminho':
+        if backend == 'dfs_dict':
+            listas = grafo.para_listas()
+            return lambda: Q3.dfs_path(listas, 0, ultimo)
+        return lambda: Q3.many_paths(grafo, [(0, ultimo)], backend)
+    if backend == 'dict':
+        dicts = grafo.para_dicts()
+        return lambda: Q4.dijkstra(dicts, 0)
+    return lambda: Q4.dijkstra_indices(grafo, 0)
+
+def medir_tempo(funcao, repeticoes=1):
+    # Menor tempo entre as repetições, com o coletor de lixo desligado
+    melhor = float('infinity')
+    for _ in range(repeticoes):
+        gc.collect()
+        gc.disable()
+        try:
+            inicio = time.perf_counter()
+            funcao()
+            melhor = min(melhor, time.perf_counter() - inicio)
+        finally:
+            gc.enable()
+    return melhor
+
+def medir_memoria(funcao):
+    # Pico de memória alocada durante a execução (o grafo de entrada já
+    # existia antes e não entra na conta). Rodada separada da medição de
+    # tempo, porque o tracemalloc deixa o código bem mais lento
+    gc.collect()
+    tracemalloc.start()
+    try:
+        funcao()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def versao_codigo():
+    # Commit atual, para comparar resultados entre versões
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def executar(geradores, tamanhos, algoritmos, repeticoes=1, memoria=True, semente=0, perfil=False):
+    resultados = []
+    print(f"{'gerador':>13} {'arestas':>9} {'algoritmo':>10} {'backend':>13} {'tempo':>10} "
+          f"{'pico':>10} {'arestas/s':>12}")
+    for tipo in geradores:
+        for tamanho in tamanhos:
+            inicio = time.perf_counter()
+            grafo = gerar_grafo(tipo, tamanho, semente)
+            geracao = time.perf_counter() - inicio
+            m = grafo.num_arestas // 2
+
+            for algoritmo in algoritmos:
+                for backend in BACKENDS[algoritmo]:
+                    if backend.endswith('dict') and m > LIMITE_DICT:
+                        continue
+                    funcao = _preparar(algoritmo, backend, grafo)
+                    tempo = medir_tempo(funcao, repeticoes)
+                    pico = medir_memoria(funcao) if memoria else None
+                    resultado = {
+                        'gerador': tipo, 'arestas_alvo': tamanho, 'vertices': grafo.num_vertices,
+                        'arestas': m, 'geracao_s': geracao, 'algoritmo': algoritmo, 'backend': backend,
+                        'tempo_s': tempo, 'pico_bytes': pico, 'arestas_por_s': m / tempo if tempo else None,
+                    }
+                    texto_pico = f"{pico / 2**20:>8.1f}MB" if pico is not None else f"{'-':>10}"
+                    print(f"{tipo:>13} {m:>9} {algoritmo:>10} {backend:>13} {tempo:>9.4f}s "
+                          f"{texto_pico} {m / tempo if tempo else 0:>12.0f}")
+
+                    # Contadores em uma rodada à parte, fora das medições
+                    if perfil:
+                        with instrumentacao.perfilar() as p:
+                            funcao()
+                        resultado['contadores'] = p.para_dict()['contadores']
+                        for nome, totais in resultado['contadores'].items():
+                            print(f"{'':>14}{nome}: " + ", ".join(f"{k}={v}" for k, v in totais.items()))
+                    resultados.append(resultado)
+            del grafo
+    return resultados
+
+def comparar(resultados, anterior):
+    # Razão entre o tempo atual e o de um arquivo de resultados anterior
+    def chave(r):
+        return r['gerador'], r['arestas_alvo'], r['algoritmo'], r['backend']
+
+    base = {chave(r): r for r in anterior['resultados']}
+    print(f"\nComparação com {anterior.get('commit') or 'arquivo anterior'}:")
+    for r in resultados:
+        antigo = base.get(chave(r))
+        if antigo is None or not antigo['tempo_s']:
+            continue
+        razao = r['tempo_s'] / antigo['tempo_s']
+        marca = '  <- mais lento' if razao > 1.1 else ''
+        print(f"{r['gerador']:>13} {r['arestas']:>9} {r['algoritmo']:>10} {r['backend']:>13} {razao:>7.2f}x{marca}")
+
+def main():
+    # Uso: python -m grafos.benchmark [--max-arestas N] [--saida resultados.json] ...
+    parser = argparse.ArgumentParser(description="Benchmark dos algoritmos de Q1–Q4 em grafos sintéticos")
+    parser.add_argument('--geradores', nargs='+', choices=tuple(GERADORES), default=tuple(GERADORES))
+    parser.add_argument('--algoritmos', nargs='+', choices=tuple(BACKENDS), default=tuple(BACKENDS))
+    parser.add_argument('--max-arestas', type=int, default=10**5,
+                        help="maior tamanho (arestas) dentre 10³ … 10⁷")
+    parser.add_argument('--repeticoes', type=int, default=1)
+    parser.add_argument('--sem-memoria', action='store_true', help="não mede o pico de memória")
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--saida', help="arquivo JSON com os resultados")
+    parser.add_argument('--comparar', help="arquivo JSON de uma execução anterior")
+    parser.add_argument('--profile', action='store_true', help="registra os contadores de cada algoritmo")
+    args = parser.parse_args()
+
+    tamanhos = [t for t in TAMANHOS if t <= args.max_arestas]
+    resultados = executar(args.geradores, tamanhos, args.algoritmos, args.repeticoes,
+                          not args.sem_memoria, args.semente, args.profile)
+
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as f:
+            comparar(resultados, json.load(f))
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump({
+                'commit': versao_codigo(),
+                'python': platform.python_version(),
+                'plataforma': platform.platform(),
+                'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'semente': args.semente,
+                'resultados': resultados,
+            }, f, ensure_ascii=False, indent=1)
+        print(f"\nResultados salvos em: '{args.saida}'")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from collections.abc import Sequence
+
+from grafos.nucleo import Grafo
+
+# Cabeçalho: magia, versão, n, m, tipo dos rótulos, ponderado, tamanho do texto dos rótulos.
+# A versão é gravada na ordem de bytes nativa, então um arquivo de outra
+# arquitetura é recusado em vez de lido errado
+CABECALHO = struct.Struct('=4sIQQIIQ')
+MAGIA = b'GRFB'
+VERSAO = 1
+
+# Tipos de tabela de rótulos
+ROTULOS_IMPLICITOS = 0  # rótulo == ID
+ROTULOS_TEXTO = 1       # deslocamentos (int64) + texto UTF-8 concatenado
+ROTULOS_INTEIROS = 2    # um int64 por vértice
+
+class TabelaRotulos(Sequence):
+    # Rótulos de texto decodificados sob demanda direto do buffer mapeado
+    __slots__ = ('deslocamentos', 'texto')
+
+    def __init__(self, deslocamentos, texto):
+        self.deslocamentos = deslocamentos
+        self.texto = texto
+
+    def __len__(self):
+        return len(self.deslocamentos) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return str(self.texto[self.deslocamentos[i]:self.deslocamentos[i + 1]], 'utf-8')
+
+def _tipo_rotulos(rotulos):
+    if isinstance(rotulos, range) and rotulos.start == 0 and rotulos.step == 1:
+        return ROTULOS_IMPLICITOS
+    if all(isinstance(rotulo, int) for rotulo in rotulos):
+        return ROTULOS_IMPLICITOS if all(rotulo == i for i, rotulo in enumerate(rotulos)) else ROTULOS_INTEIROS
+    return ROTULOS_TEXTO
+
+def salvar_binario(grafo, arquivo):
+    n, m = grafo.num_vertices, grafo.num_arestas
+    tipo = _tipo_rotulos(grafo.rotulos)
+    texto = b''
+    deslocamentos = array('q', [0])
+    if tipo == ROTULOS_TEXTO:
+        partes = [str(rotulo).encode('utf-8') for rotulo in grafo.rotulos]
+        for parte in partes:
+            deslocamentos.append(deslocamentos[-1] + len(parte))
+        texto = b''.join(partes)
+
+    with open(arquivo, 'wb') as f:
+        f.write(CABECALHO.pack(MAGIA, VERSAO, n, m, tipo, grafo.pesos is not None, len(texto)))
+        # Todas as seções têm tamanho múltiplo de 8, então ficam alinhadas
+        f.write(memoryview(grafo.inicios).cast('B'))
+        f.write(memoryview(grafo.destinos).cast('B'))
+        if grafo.pesos is not None:
+            f.write(memoryview(grafo.pesos).cast('B'))
+        if tipo == ROTULOS_TEXTO:
+            f.write(memoryview(deslocamentos).cast('B'))
+            f.write(texto)
+        elif tipo == ROTULOS_INTEIROS:
+            f.write(memoryview(array('q', grafo.rotulos)).cast('B'))
+
+def carregar_binario(arquivo):
+    # Mapeia o arquivo em memória e devolve um Grafo cujos arrays são visões
+    # diretas sobre o mapeamento: nada é lido nem copiado até ser usado
+    with open(arquivo, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < CABECALHO.size:
+            raise ValueError(f"'{arquivo}' não é um grafo binário")
+        mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magia, versao, n, m, tipo, ponderado, tamanho_texto = CABECALHO.unpack_from(mapa)
+    if magia != MAGIA:
+        raise ValueError(f"'{arquivo}' não é um grafo binário")
+    if versao != VERSAO:
+        raise ValueError(f"Versão ou ordem de bytes não suportada em '{arquivo}'")
+
+    visao = memoryview(mapa)
+    posicao = CABECALHO.size
+
+    def secao(tamanho, formato):
+        nonlocal posicao
+        dados = visao[posicao:posicao + 8 * tamanho].cast(formato)
+        posicao += 8 * tamanho
+        return dados
+
+    inicios = secao(n + 1, 'q')
+    destinos = secao(m, 'q')
+    pesos = secao(m, 'd') if ponderado else None
+    if tipo == ROTULOS_TEXTO:
+        deslocamentos = secao(n + 1, 'q')
+        rotulos = TabelaRotulos(deslocamentos, visao[posicao:posicao + tamanho_texto])
+    elif tipo == ROTULOS_INTEIROS:
+        rotulos = secao(n, 'q')
+    else:
+        rotulos = range(n)
+    return Grafo(rotulos, inicios, destinos, pesos)
+
+def main():
+    # Uso: python -m grafos.binario [num_arestas]. Mede a carga de um grafo aleatório
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    grau = 10
+    n = m // grau
+    rng = random.Random(0)
+    grafo = Grafo(range(n), array('q', range(0, n * grau + 1, grau)),
+                  array('q', (rng.randrange(n) for _ in range(n * grau))),
+                  array('d', (rng.random() for _ in range(n * grau))))
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = os.path.join(pasta, 'grafo.grf')
+        salvar_binario(grafo, arquivo)
+
+        inicio = time.perf_counter()
+        carregado = carregar_binario(arquivo)
+        tempo = time.perf_counter() - inicio
+
+        print(f"{carregado.num_arestas} arestas ({os.path.getsize(arquivo) / 2**20:.0f} MiB) "
+              f"carregadas em {tempo * 1e3:.2f} ms")
+        del carregado
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+
+from grafos.binario import salvar_binario
+from grafos.cli import carregar_grafo
+from grafos.geradores import GERADORES, gerar_grafo
+from grafos.servidor import TIPOS, ServidorConsultas
+
+async def _cliente(host, porta, consultas, latencias, erros):
+    # Cliente em malha fechada: envia a próxima consulta só depois da resposta
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    try:
+        for consulta in consultas:
+            inicio = time.perf_counter()
+            escritor.write(json.dumps(consulta).encode('utf-8') + b'\n')
+            await escritor.drain()
+            resposta = json.loads(await leitor.readline())
+            latencias.append(time.perf_counter() - inicio)
+            if 'erro' in resposta:
+                erros.append(resposta['erro'])
+    finally:
+        escritor.close()
+        await escritor.wait_closed()
+
+async def disparar(host, porta, consultas, conexoes):
+    # Divide as consultas entre as conexões; devolve (latências, erros, segundos)
+    latencias, erros = [], []
+    fatias = [consultas[i::conexoes] for i in range(conexoes)]
+    inicio = time.perf_counter()
+    await asyncio.gather(*(_cliente(host, porta, fatia, latencias, erros) for fatia in fatias if fatia))
+    return latencias, erros, time.perf_counter() - inicio
+
+def percentil(ordenados, p):
+    return ordenados[min(len(ordenados) - 1, int(p / 100 * len(ordenados)))]
+
+def gerar_consultas(grafo, quantidade, tipo='rota', origens=20, semente=0):
+    # Poucas origens "quentes" e destinos aleatórios, como em um serviço real
+    rng = random.Random(semente)
+    rotulos = grafo.rotulos
+    quentes = [rng.randrange(grafo.num_vertices) for _ in range(origens)]
+    return [{'id': i, 'tipo': tipo, 'origem': rotulos[rng.choice(quentes)],
+             'destino': rotulos[rng.randrange(grafo.num_vertices)]} for i in range(quantidade)]
+
+async def medir(arquivo, consultas, conexoes, janela, tamanho_lote, trabalhadores):
+    servidor = ServidorConsultas(arquivo, janela, tamanho_lote, trabalhadores)
+    tcp = await servidor.iniciar('127.0.0.1', 0)
+    porta = tcp.sockets[0].getsockname()[1]
+    try:
+        # iniciar só volta com os processos do pool criados e com o grafo carregado
+        latencias, erros, segundos = await disparar('127.0.0.1', porta, consultas, conexoes)
+    finally:
+        tcp.close()
+        await tcp.wait_closed()
+        servidor.fechar()
+    latencias.sort()
+    return {'consultas': len(latencias), 'erros': len(erros), 'segundos': segundos,
+            'qps': len(latencias) / segundos, 'p50_ms': percentil(latencias, 50) * 1e3,
+            'p99_ms': percentil(latencias, 99) * 1e3, 'lotes': servidor.lotes,
+            'consultas_por_grupo': servidor.consultas / servidor.grupos if servidor.grupos else 0}
+
+def main():
+    # Uso: python -m grafos.carga [--arquivo grafo.grf] [--consultas 2000] [--conexoes 64] ...
+    parser = argparse.ArgumentParser(description="Teste de carga do servidor de consultas (p50/p99 e QPS)")
+    parser.add_argument('--arquivo', help="grafo a servir (padrão: gera um grafo sintético)")
+    parser.add_argument('--gerador', choices=tuple(GERADORES), default='geometrico')
+    parser.add_argument('--arestas', type=int, default=100_000)
+    parser.add_argument('--tipo', choices=TIPOS, default='rota')
+    parser.add_argument('--consultas', type=int, default=2000)
+    parser.add_argument('--conexoes', type=int, default=64)
+    parser.add_argument('--origens', type=int, default=20, help="número de origens distintas nas consultas")
+    parser.add_argument('--janela-ms', type=float, default=2.0)
+    parser.add_argument('-j', '--trabalhadores', type=int, default=None)
+    parser.add_argument('--saida', help="arquivo JSON com os resultados")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = args.arquivo
+        if arquivo is None:
+            arquivo = os.path.join(pasta, 'carga.grf')
+            salvar_binario(gerar_grafo(args.gerador, args.arestas), arquivo)
+        grafo = carregar_grafo(arquivo)
+        consultas = gerar_consultas(grafo, args.consultas, args.tipo, args.origens)
+        print(f"{grafo.num_vertices} vértices, {args.consultas} consultas '{args.tipo}' de {args.origens} origens "
+              f"em {args.conexoes} conexões")
+
+        # Referência sem micro-lotes: cada consulta vira uma tarefa no pool
+        variantes = [('sem lotes', 0.0, 1), (f'janela {args.janela_ms:g} ms', args.janela_ms / 1000, 1024)]
+        resultados = {}
+        print(f"{'variante':>16} {'QPS':>9} {'p50':>10} {'p99':>10} {'lotes':>7} {'consultas/grupo':>16} {'erros':>6}")
+        for nome, janela, tamanho_lote in variantes:
+            r = asyncio.run(medir(arquivo, consultas, args.conexoes, janela, tamanho_lote, args.trabalhadores))
+            resultados[nome] = r
+            print(f"{nome:>16} {r['qps']:>9.0f} {r['p50_ms']:>8.1f}ms {r['p99_ms']:>8.1f}ms {r['lotes']:>7} "
+                  f"{r['consultas_por_grupo']:>16.1f} {r['erros']:>6}")
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump(resultados, f, ensure_ascii=False, indent=1)
+
+if __name__ == "__main__":
+    main()
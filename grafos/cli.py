@@ -0,0 +1,228 @@
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from grafos import Grafo, instrumentacao
+from grafos.binario import carregar_binario
+
+# Os scripts Q1–Q4 não são pacotes: cada pasta entra no caminho de importação.
+# Num checkout as pastas ficam na raiz do repositório; na wheel instalada, em
+# grafos/_questoes (ver [tool.hatch.build.targets.wheel.force-include])
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_questoes')
+if not os.path.isdir(RAIZ):
+    RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for pasta in ('Q1', 'Q2', 'Q3', 'Q4'):
+    sys.path.insert(0, os.path.join(RAIZ, pasta))
+
+import Q1
+import Q2
+import Q3
+import Q4
+
+ALGORITMOS = ('coloracao', 'mst', 'caminho', 'rota')
+EXTENSOES = ('.csv', '.grf', '.json')
+
+def expandir_entradas(entradas):
+    # Arquivos, diretórios (percorridos recursivamente) ou padrões glob, sem repetições
+    arquivos = {}
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            for pasta, _, nomes in sorted(os.walk(entrada)):
+                for nome in sorted(nomes):
+                    if nome.endswith(EXTENSOES):
+                        arquivos.setdefault(os.path.join(pasta, nome), None)
+        elif glob.has_magic(entrada):
+            for caminho in sorted(glob.glob(entrada, recursive=True)):
+                if os.path.isfile(caminho):
+                    arquivos.setdefault(caminho, None)
+        else:
+            arquivos.setdefault(entrada, None)
+    return list(arquivos)
+
+def _normalizar_chaves(dados):
+    # Chaves de objetos JSON são sempre texto. Se as listas de vizinhos têm
+    # inteiros (um grafo de Q1 salvo com json.dump), as chaves numéricas
+    # voltam a ser inteiras; senão "0" e 0 seriam vértices distintos
+    inteiros = any(isinstance(vizinho, int) for vizinhos in dados.values() if isinstance(vizinhos, list)
+                   for vizinho in vizinhos)
+    if not inteiros:
+        return dados
+    return {int(chave) if chave.lstrip('-').isdigit() else chave: vizinhos for chave, vizinhos in dados.items()}
+
+def carregar_grafo(arquivo):
+    # .grf (binário), .json ({v: [vizinhos]} ou {v: {vizinho: peso}}) ou CSV
+    # (matriz ou lista de arestas, como em Q2)
+    if arquivo.endswith('.grf'):
+        return carregar_binario(arquivo)
+    if arquivo.endswith('.json'):
+        with open(arquivo, encoding='utf-8') as f:
+            dados = json.load(f)
+        if any(isinstance(vizinhos, dict) for vizinhos in dados.values()):
+            return Grafo.de_dicts(dados)
+        return Grafo.de_listas(_normalizar_chaves(dados))
+
+    # ler_grafo_csv informa os erros com print; a mensagem vira o erro do arquivo
+    mensagens = io.StringIO()
+    with contextlib.redirect_stdout(mensagens):
+        grafo, _ = Q2.ler_grafo_csv(arquivo)
+    if grafo is None:
+        raise ValueError(mensagens.getvalue().strip())
+    return grafo
+
+def _vertice(grafo, nome, padrao):
+    # Rótulos vindos da linha de comando são texto: compara pela forma textual
+    if nome is None:
+        return grafo.rotulos[padrao]
+    for rotulo in grafo.rotulos:
+        if str(rotulo) == nome:
+            return rotulo
+    raise ValueError(f"Vértice '{nome}' não existe no grafo")
+
+def _resolver(grafo, opcoes, arquivo_html):
+    algoritmo = opcoes['algoritmo']
+    rotulos = grafo.rotulos
+    if algoritmo in ('mst', 'rota') and grafo.pesos is None:
+        raise ValueError("O grafo não tem pesos nas arestas")
+
+    if algoritmo == 'coloracao':
+        cores = Q1.algoritmo_guloso_coloracao(grafo, opcoes['ordenacao'])
+        resultado = {'num_cores': max(cores.values(), default=0), 'valida': Q1.coloracao_valida(grafo, cores)}
+        if not opcoes['resumo']:
+            resultado['cores'] = {str(v): cor for v, cor in cores.items()}
+        if arquivo_html:
+            Q1.visualizar_grafo_pyvis(grafo.para_listas(), cores, arquivo_html)
+        return resultado
+
+    if algoritmo == 'mst':
+        mst = Q2.arvore_geradora_minima(grafo)
+        resultado = {'custo': sum(peso for _, _, peso in mst), 'num_arestas': len(mst),
+                     'componentes': grafo.num_vertices - len(mst)}
+        if not opcoes['resumo']:
+            resultado['arestas'] = [[str(rotulos[u]), str(rotulos[v]), peso] for u, v, peso in mst]
+        if arquivo_html:
+            Q2.visualizar_mst_pyvis(grafo, mst, [str(r) for r in rotulos], arquivo_html)
+        return resultado
+
+    inicio = _vertice(grafo, opcoes['origem'], 0)
+    fim = _vertice(grafo, opcoes['destino'], grafo.num_vertices - 1)
+    if algoritmo == 'caminho':
+        caminho = Q3.many_paths(grafo, [(inicio, fim)], opcoes['modo'])[0]
+        resultado = {'origem': str(inicio), 'destino': str(fim), 'comprimento': len(caminho) - 1 if caminho else None}
+        if arquivo_html:
+            Q3.visualizar_labirinto_pyvis(grafo.para_listas(), caminho, arquivo_html)
+    else:
+        distancias, predecessores = Q4.dijkstra(grafo, inicio)
+        caminho = None
+        if distancias[fim] != float('infinity'):
+            caminho = Q4.reconstruir_caminho(predecessores, fim)
+        resultado = {'origem': str(inicio), 'destino': str(fim),
+                     'distancia': distancias[fim] if caminho else None}
+        if arquivo_html:
+            Q4.visualizar_mapa_pyvis(grafo.para_dicts(), caminho, arquivo_html)
+    if not opcoes['resumo']:
+        resultado['caminho'] = [str(v) for v in caminho] if caminho else None
+    return resultado
+
+def processar(arquivo, opcoes):
+    # Trabalho de um arquivo; devolve o registro que vira uma linha JSON.
+    # Os prints dos scripts vão para stderr para não misturar com a saída
+    registro = {'arquivo': arquivo, 'algoritmo': opcoes['algoritmo']}
+    arquivo_html = None
+    if opcoes['html']:
+        nome = os.path.splitext(os.path.basename(arquivo))[0]
+        arquivo_html = os.path.join(opcoes['html'], f"{nome}_{opcoes['algoritmo']}.html")
+
+    perfil = instrumentacao.perfilar() if opcoes['profile'] else contextlib.nullcontext()
+    inicio = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(sys.stderr), perfil as p:
+            with instrumentacao.fase('carga'):
+                grafo = carregar_grafo(arquivo)
+            registro.update(vertices=grafo.num_vertices, arestas_armazenadas=grafo.num_arestas)
+            with instrumentacao.fase('solucao'):
+                registro['resultado'] = _resolver(grafo, opcoes, arquivo_html)
+    except Exception as e:
+        # Um arquivo com problema não interrompe o lote
+        registro['erro'] = f"{e.__class__.__name__}: {e}"
+    registro['tempo_s'] = time.perf_counter() - inicio
+    if arquivo_html and 'erro' not in registro:
+        registro['html'] = arquivo_html
+    if opcoes['profile']:
+        registro['perfil'] = p.para_dict()
+    return registro
+
+def executar(arquivos, opcoes, trabalhadores=None, saida=None, tarefas_por_processo=None):
+    # Escreve uma linha JSON por arquivo, na ordem em que terminam. Só há até
+    # dois arquivos em andamento por processo, então poucos grafos ficam em
+    # memória ao mesmo tempo; com tarefas_por_processo, cada processo é
+    # recriado depois desse número de arquivos. Devolve o número de erros
+    saida = saida or sys.stdout
+    erros = 0
+
+    def emitir(registro):
+        nonlocal erros
+        erros += 'erro' in registro
+        saida.write(json.dumps(registro, ensure_ascii=False) + '\n')
+        saida.flush()
+
+    if trabalhadores == 1:
+        for arquivo in arquivos:
+            emitir(processar(arquivo, opcoes))
+        return erros
+
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+    with ProcessPoolExecutor(trabalhadores, max_tasks_per_child=tarefas_por_processo) as executor:
+        limite = 2 * trabalhadores
+        pendentes = set()
+        for arquivo in arquivos:
+            if len(pendentes) >= limite:
+                prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    emitir(futuro.result())
+            pendentes.add(executor.submit(processar, arquivo, opcoes))
+        for futuro in wait(pendentes).done:
+            emitir(futuro.result())
+    return erros
+
+def main(argv=None):
+    # Uso: grafos {coloracao,mst,caminho,rota} ENTRADA... [opções]
+    parser = argparse.ArgumentParser(prog='grafos',
+                                     description="Processa vários arquivos de grafo e escreve os resultados em JSON lines")
+    parser.add_argument('algoritmo', choices=ALGORITMOS)
+    parser.add_argument('entradas', nargs='+', help="arquivos .csv/.grf/.json, diretórios ou padrões glob")
+    parser.add_argument('-j', '--trabalhadores', type=int, default=None,
+                        help="processos em paralelo (padrão: número de CPUs; 1 roda sem pool)")
+    parser.add_argument('-o', '--saida', help="arquivo .jsonl (padrão: saída padrão)")
+    parser.add_argument('--html', metavar='DIRETORIO', help="também gera a visualização HTML de cada arquivo")
+    parser.add_argument('--resumo', action='store_true', help="omite cores, arestas e caminhos do resultado")
+    parser.add_argument('--ordenacao', choices=Q1.ESTRATEGIAS_ORDENACAO, default='natural')
+    parser.add_argument('--modo', choices=tuple(Q3.MODOS_BUSCA), default='bfs')
+    parser.add_argument('--origem', help="vértice inicial (padrão: o primeiro)")
+    parser.add_argument('--destino', help="vértice final (padrão: o último)")
+    parser.add_argument('--tarefas-por-processo', type=int, default=None,
+                        help="recria cada processo após este número de arquivos")
+    parser.add_argument('--profile', action='store_true', help="inclui contadores e tempos por fase")
+    args = parser.parse_args(argv)
+
+    arquivos = expandir_entradas(args.entradas)
+    if not arquivos:
+        parser.error("nenhum arquivo de grafo encontrado")
+    if args.html:
+        os.makedirs(args.html, exist_ok=True)
+
+    opcoes = {'algoritmo': args.algoritmo, 'ordenacao': args.ordenacao, 'modo': args.modo,
+              'origem': args.origem, 'destino': args.destino, 'html': args.html,
+              'resumo': args.resumo, 'profile': args.profile}
+
+    with open(args.saida, 'w', encoding='utf-8') if args.saida else contextlib.nullcontext() as saida:
+        erros = executar(arquivos, opcoes, args.trabalhadores, saida, args.tarefas_por_processo)
+    return 1 if erros else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+import html
+import json
+import random
+from collections import deque
+
+# Acima deste número de nós, os scripts trocam o pyvis pela exportação em streaming
+LIMITE_PYVIS = 2000
+# Quantidade de nós/arestas serializados por escrita no arquivo
+TAMANHO_BLOCO = 10_000
+
+VIS_NETWORK = "https://unpkg.com/vis-network@9.1.2/standalone/umd/vis-network.min.js"
+
+def selecionar_detalhe(grafo, destaques=(), k_saltos=1, max_nos=LIMITE_PYVIS, semente=0):
+    # Nível de detalhe: mantém os nós destacados, sua vizinhança de até
+    # k_saltos e completa com uma amostra aleatória do restante até max_nos.
+    # Devolve uma máscara (bytearray) indexada pelo ID do vértice
+    n = grafo.num_vertices
+    inicios, destinos = grafo.inicios, grafo.destinos
+    mascara = bytearray(n)
+    incluidos = 0
+
+    fila = deque()
+    for v in destaques:
+        if not mascara[v]:
+            mascara[v] = 1
+            incluidos += 1
+            fila.append((v, 0))
+
+    while fila and incluidos < max_nos:
+        v, saltos = fila.popleft()
+        if saltos == k_saltos:
+            continue
+        for k in range(inicios[v], inicios[v + 1]):
+            w = destinos[k]
+            if not mascara[w]:
+                mascara[w] = 1
+                incluidos += 1
+                fila.append((w, saltos + 1))
+                if incluidos >= max_nos:
+                    break
+
+    restantes = max_nos - incluidos
+    if restantes > 0:
+        rng = random.Random(semente)
+        candidatos = n - incluidos
+        # Amostragem sequencial: cada nó entra com probabilidade vagas/candidatos restantes
+        for v in range(n):
+            if restantes == 0:
+                break
+            if mascara[v]:
+                continue
+            if rng.random() * candidatos < restantes:
+                mascara[v] = 1
+                restantes -= 1
+            candidatos -= 1
+    return mascara
+
+# Escapes JSON válidos que impedem um rótulo como "</script>" de fechar o
+# bloco <script> da página (o mesmo que o filtro tojson do Jinja no pyvis)
+_ESCAPES_HTML = str.maketrans({'<': '\\u003c', '>': '\\u003e', '&': '\\u0026'})
+
+def _escrever_em_blocos(f, itens):
+    bloco = []
+    primeiro = True
+    for item in itens:
+        bloco.append(json.dumps(item, ensure_ascii=False))
+        if len(bloco) == TAMANHO_BLOCO:
+            f.write((('' if primeiro else ',\n') + ',\n'.join(bloco)).translate(_ESCAPES_HTML))
+            primeiro = False
+            bloco.clear()
+    if bloco:
+        f.write((('' if primeiro else ',\n') + ',\n'.join(bloco)).translate(_ESCAPES_HTML))
+
+def _nos(grafo, mascara, atributos_no):
+    rotulos = grafo.rotulos
+    for v in range(grafo.num_vertices):
+        if mascara is None or mascara[v]:
+            no = {'id': v, 'label': str(rotulos[v])}
+            if atributos_no:
+                no.update(atributos_no(v))
+            yield no
+
+def _arestas(grafo, mascara, atributos_aresta, arestas_destaque, max_arestas, semente):
+    # Arestas destacadas sempre entram; as demais (entre nós incluídos) são
+    # amostradas para não passar de max_arestas
+    proporcao = 1.0
+    if max_arestas is not None and grafo.num_arestas:
+        proporcao = min(1.0, 2 * max_arestas / grafo.num_arestas)
+    rng = random.Random(semente)
+
+    for u, v, peso in grafo.arestas():
+        if mascara is not None and not (mascara[u] and mascara[v]):
+            continue
+        if (u, v) not in arestas_destaque and proporcao < 1.0 and rng.random() >= proporcao:
+            continue
+        aresta = {'from': u, 'to': v}
+        if atributos_aresta:
+            aresta.update(atributos_aresta(u, v, peso))
+        yield aresta
+
+def exportar(grafo, arquivo, titulo="Grafo", atributos_no=None, atributos_aresta=None,
+             destaques=(), arestas_destaque=(), k_saltos=None, max_nos=None, max_arestas=None,
+             formato='html', semente=0):
+    # Escreve os nós e arestas do Grafo direto no arquivo, em blocos, sem
+    # montar a rede em memória. formato: 'html' (página com vis-network) ou
+    # 'json' ({"nodes": [...], "edges": [...]}).
+    # atributos_no(v) e atributos_aresta(u, v, peso) devolvem dicts com
+    # atributos extras (color, title, size...). Com k_saltos ou max_nos, só
+    # uma parte do grafo é exportada (ver selecionar_detalhe)
+    mascara = None
+    if k_saltos is not None or max_nos is not None:
+        destaques = set(destaques)
+        for u, v in arestas_destaque:
+            destaques.update((u, v))
+        mascara = selecionar_detalhe(grafo, destaques, k_saltos or 0,
+                                     max_nos if max_nos is not None else LIMITE_PYVIS, semente)
+    arestas_destaque = {(min(u, v), max(u, v)) for u, v in arestas_destaque}
+
+    nos = _nos(grafo, mascara, atributos_no)
+    arestas = _arestas(grafo, mascara, atributos_aresta, arestas_destaque, max_arestas, semente)
+
+    with open(arquivo, 'w', encoding='utf-8') as f:
+        if formato == 'json':
+            f.write('{"nodes": [\n')
+            _escrever_em_blocos(f, nos)
+            f.write('\n], "edges": [\n')
+            _escrever_em_blocos(f, arestas)
+            f.write('\n]}\n')
+            return
+
+        titulo = html.escape(titulo)
+        f.write(f'''<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{titulo}</title>
+<script src="{VIS_NETWORK}"></script>
+<style>#rede {{ width: 100%; height: 800px; border: 1px solid lightgray; }}</style>
+</head>
+<body>
+<h1>{titulo}</h1>
+<div id="rede"></div>
+<script>
+var nodes = new vis.DataSet([
+''')
+        _escrever_em_blocos(f, nos)
+        f.write('\n]);\nvar edges = new vis.DataSet([\n')
+        _escrever_em_blocos(f, arestas)
+        # Sem física: o layout inicial é calculado uma vez, sem simulação contínua
+        f.write('''
+]);
+new vis.Network(document.getElementById("rede"), {nodes: nodes, edges: edges},
+                {physics: false, layout: {improvedLayout: false}, edges: {smooth: false}});
+</script>
+</body>
+</html>
+''')
+
+def exportar_caminho(grafo, caminho, arquivo, titulo="Grafo", k_saltos=2, max_nos=LIMITE_PYVIS):
+    # Exporta um caminho (lista de rótulos) destacado com as cores usadas
+    # pelos scripts, junto da sua vizinhança de até k_saltos; sem caminho,
+    # exporta uma amostra de max_nos vértices
+    ids = [grafo.indice[rotulo] for rotulo in caminho or ()]
+    nos_caminho = set(ids)
+    arestas_caminho = {(min(a, b), max(a, b)) for a, b in zip(ids, ids[1:])}
+
+    def estilo_no(v):
+        rotulo = grafo.rotulos[v]
+        if ids and v == ids[0]:
+            return {'color': '#52b788', 'size': 30, 'title': f"INÍCIO: {rotulo}"}
+        if ids and v == ids[-1]:
+            return {'color': '#9b5de5', 'size': 30, 'title': f"FIM: {rotulo}"}
+        if v in nos_caminho:
+            return {'color': '#e63946', 'size': 25, 'title': str(rotulo)}
+        return {'color': '#cccccc', 'size': 15, 'title': str(rotulo)}
+
+    def estilo_aresta(u, v, peso):
+        estilo = {'color': '#e63946', 'width': 5} if (u, v) in arestas_caminho else {'color': '#cccccc', 'width': 2}
+        if peso is not None:
+            estilo['title'] = f"Peso: {peso}"
+        return estilo
+
+    exportar(grafo, arquivo, titulo, estilo_no, estilo_aresta, destaques=ids, arestas_destaque=arestas_caminho,
+             k_saltos=k_saltos, max_nos=max_nos)
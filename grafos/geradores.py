@@ -0,0 +1,105 @@
+import math
+import random
+from array import array
+
+from grafos.nucleo import Grafo
+
+# Grafos sintéticos não direcionados e ponderados, reprodutíveis pela semente.
+# Cada gerador recebe o número aproximado de arestas (não direcionadas) e
+# monta o Grafo direto das listas de arestas, sem passar por dicts
+
+def erdos_renyi(num_arestas, grau_medio=8, semente=0):
+    # Número fixo de arestas sorteadas uniformemente. Laços são descartados;
+    # arestas repetidas são raras nesse grau médio e ficam como paralelas
+    n = max(2, 2 * num_arestas // grau_medio)
+    rng = random.Random(semente)
+    origens, destinos, pesos = array('q'), array('q'), array('d')
+    while len(origens) < num_arestas:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            origens.append(u)
+            destinos.append(v)
+            pesos.append(rng.randint(1, 100))
+    return Grafo.de_arestas(range(n), origens, destinos, pesos)
+
+def grade(num_arestas, semente=0):
+    # Grade quadrada com conexões norte/sul/leste/oeste (cerca de 2 arestas por célula)
+    lado = max(2, math.isqrt(num_arestas // 2))
+    rng = random.Random(semente)
+    origens, destinos, pesos = array('q'), array('q'), array('d')
+    for linha in range(lado):
+        for coluna in range(lado):
+            v = linha * lado + coluna
+            if coluna + 1 < lado:
+                origens.append(v)
+                destinos.append(v + 1)
+                pesos.append(rng.randint(1, 100))
+            if linha + 1 < lado:
+                origens.append(v)
+                destinos.append(v + lado)
+                pesos.append(rng.randint(1, 100))
+    return Grafo.de_arestas(range(lado * lado), origens, destinos, pesos)
+
+def geometrico(num_arestas, grau_medio=8, semente=0):
+    # Pontos uniformes no quadrado unitário ligados quando a distância é menor
+    # que o raio; o peso é a distância. Os pontos são distribuídos em células
+    # do tamanho do raio para só comparar pares de células vizinhas
+    n = max(2, 2 * num_arestas // grau_medio)
+    raio = math.sqrt(grau_medio / (math.pi * n))
+    rng = random.Random(semente)
+    xs = array('d', (rng.random() for _ in range(n)))
+    ys = array('d', (rng.random() for _ in range(n)))
+
+    lado = max(1, int(1 / raio))
+    celulas = {}
+    for v in range(n):
+        celulas.setdefault((min(int(xs[v] * lado), lado - 1), min(int(ys[v] * lado), lado - 1)), []).append(v)
+
+    origens, destinos, pesos = array('q'), array('q'), array('d')
+    for (cx, cy), pontos in celulas.items():
+        # Metade das células vizinhas, para cada par de células ser visitado uma vez
+        for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+            outros = celulas.get((cx + dx, cy + dy))
+            if outros is None:
+                continue
+            mesma = dx == 0 and dy == 0
+            for i, u in enumerate(pontos):
+                for w in (outros[i + 1:] if mesma else outros):
+                    distancia = math.hypot(xs[u] - xs[w], ys[u] - ys[w])
+                    if distancia < raio:
+                        origens.append(u)
+                        destinos.append(w)
+                        pesos.append(distancia)
+    return Grafo.de_arestas(range(n), origens, destinos, pesos)
+
+def lei_potencia(num_arestas, arestas_por_no=4, semente=0):
+    # Barabási–Albert: cada novo vértice liga-se a arestas_por_no vértices
+    # escolhidos com probabilidade proporcional ao grau (sorteio na lista de
+    # extremidades de todas as arestas já criadas)
+    n = max(arestas_por_no + 1, num_arestas // arestas_por_no)
+    rng = random.Random(semente)
+    origens, destinos, pesos = array('q'), array('q'), array('d')
+    extremidades = array('q', range(arestas_por_no))
+    for v in range(arestas_por_no, n):
+        escolhidos = set()
+        while len(escolhidos) < arestas_por_no:
+            escolhidos.add(extremidades[rng.randrange(len(extremidades))])
+        for u in escolhidos:
+            origens.append(v)
+            destinos.append(u)
+            pesos.append(rng.randint(1, 100))
+            extremidades.append(u)
+            extremidades.append(v)
+    return Grafo.de_arestas(range(n), origens, destinos, pesos)
+
+GERADORES = {
+    'erdos_renyi': erdos_renyi,
+    'grade': grade,
+    'geometrico': geometrico,
+    'lei_potencia': lei_potencia,
+}
+
+def gerar_grafo(tipo, num_arestas, semente=0):
+    if tipo not in GERADORES:
+        raise ValueError(f"Gerador desconhecido: '{tipo}'")
+    return GERADORES[tipo](num_arestas, semente=semente)
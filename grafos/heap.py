@@ -0,0 +1,71 @@
+from array import array
+
+class HeapIndexado:
+    # Heap binário de mínimo indexado pelo vértice, com decrease-key real:
+    # cada vértice aparece no máximo uma vez, então não há entradas obsoletas
+    __slots__ = ('chaves', 'heap', 'posicao')
+
+    def __init__(self, n):
+        self.chaves = array('d', [float('infinity')]) * n
+        self.heap = array('q')
+        self.posicao = array('q', [-1]) * n
+
+    def __len__(self):
+        return len(self.heap)
+
+    def diminuir_chave(self, v, chave):
+        # Insere v ou reduz sua chave; devolve False se a chave atual já é menor ou igual
+        if chave >= self.chaves[v]:
+            return False
+        self.chaves[v] = chave
+        if self.posicao[v] == -1:
+            self.heap.append(v)
+            self.posicao[v] = len(self.heap) - 1
+        self._subir(self.posicao[v])
+        return True
+
+    def extrair_min(self):
+        heap, posicao = self.heap, self.posicao
+        v = heap[0]
+        ultimo = heap.pop()
+        posicao[v] = -1
+        if heap:
+            heap[0] = ultimo
+            posicao[ultimo] = 0
+            self._descer(0)
+        return v, self.chaves[v]
+
+    def _subir(self, i):
+        heap, posicao, chaves = self.heap, self.posicao, self.chaves
+        v = heap[i]
+        chave = chaves[v]
+        while i > 0:
+            pai = (i - 1) >> 1
+            w = heap[pai]
+            if chaves[w] <= chave:
+                break
+            heap[i] = w
+            posicao[w] = i
+            i = pai
+        heap[i] = v
+        posicao[v] = i
+
+    def _descer(self, i):
+        heap, posicao, chaves = self.heap, self.posicao, self.chaves
+        n = len(heap)
+        v = heap[i]
+        chave = chaves[v]
+        while True:
+            filho = 2 * i + 1
+            if filho >= n:
+                break
+            if filho + 1 < n and chaves[heap[filho + 1]] < chaves[heap[filho]]:
+                filho += 1
+            w = heap[filho]
+            if chaves[w] >= chave:
+                break
+            heap[i] = w
+            posicao[w] = i
+            i = filho
+        heap[i] = v
+        posicao[v] = i
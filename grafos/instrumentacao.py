@@ -0,0 +1,94 @@
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+# Perfil ativo; None significa instrumentação desligada. Os algoritmos
+# acumulam contadores em variáveis locais (só os que não dá para deduzir no
+# final) e os publicam uma vez por chamada, então desligada a instrumentação
+# custa uma verificação por chamada de algoritmo
+_perfil = None
+_SEM_FASE = nullcontext()
+
+class Perfil:
+    # Totais de contadores por algoritmo e tempo acumulado por fase. O
+    # callback opcional recebe cada evento: callback('contadores', algoritmo,
+    # dict) ao fim de um algoritmo e callback('fase', nome, segundos)
+    __slots__ = ('contadores', 'chamadas', 'tempos', 'callback')
+
+    def __init__(self, callback=None):
+        self.contadores = defaultdict(lambda: defaultdict(int))
+        self.chamadas = defaultdict(int)
+        self.tempos = {}
+        self.callback = callback
+
+    def registrar(self, algoritmo, contadores):
+        self.chamadas[algoritmo] += 1
+        totais = self.contadores[algoritmo]
+        for nome, valor in contadores.items():
+            totais[nome] += valor
+        if self.callback is not None:
+            self.callback('contadores', algoritmo, contadores)
+
+    @contextmanager
+    def fase(self, nome):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            duracao = time.perf_counter() - inicio
+            self.tempos[nome] = self.tempos.get(nome, 0.0) + duracao
+            if self.callback is not None:
+                self.callback('fase', nome, duracao)
+
+    def para_dict(self):
+        return {'fases': dict(self.tempos),
+                'contadores': {algoritmo: dict(totais, chamadas=self.chamadas[algoritmo])
+                               for algoritmo, totais in self.contadores.items()}}
+
+    def relatorio(self):
+        linhas = ["\n" + "=" * 60, "PERFIL DE EXECUÇÃO", "=" * 60]
+        if self.tempos:
+            linhas.append("Fases:")
+            linhas.extend(f"   {nome:<26} {segundos * 1e3:>12.3f} ms" for nome, segundos in self.tempos.items())
+        for algoritmo, totais in self.contadores.items():
+            linhas.append(f"{algoritmo} ({self.chamadas[algoritmo]} chamada(s)):")
+            linhas.extend(f"   {nome:<26} {valor:>15}" for nome, valor in totais.items())
+        return "\n".join(linhas)
+
+def ligada():
+    # Para proteger contadores caros de calcular no fim de um algoritmo
+    return _perfil is not None
+
+def registrar(algoritmo, **contadores):
+    if _perfil is not None:
+        _perfil.registrar(algoritmo, contadores)
+
+def fase(nome):
+    # with fase('carga'): ... — cronometra o bloco se houver um perfil ativo
+    if _perfil is None:
+        return _SEM_FASE
+    return _perfil.fase(nome)
+
+@contextmanager
+def perfilar(callback=None):
+    # Liga a instrumentação dentro do bloco e devolve o Perfil com os resultados
+    global _perfil
+    anterior = _perfil
+    _perfil = Perfil(callback)
+    try:
+        yield _perfil
+    finally:
+        _perfil = anterior
+
+@contextmanager
+def perfilar_se_pedido(argv=None):
+    # Para os scripts: com --profile na linha de comando, perfila o bloco e
+    # imprime o relatório no final
+    argv = sys.argv[1:] if argv is None else argv
+    if '--profile' not in argv:
+        yield None
+        return
+    with perfilar() as perfil:
+        yield perfil
+    print(perfil.relatorio())
@@ -0,0 +1,132 @@
+from array import array
+from collections.abc import Sequence
+
+class Grafo:
+    # Núcleo compacto comum aos quatro scripts. Os rótulos originais são
+    # internados uma única vez (rotulos: ID -> rótulo, indice: rótulo -> ID) e
+    # os algoritmos trabalham só com IDs inteiros densos. A adjacência fica em
+    # CSR: os vizinhos de i estão em destinos[inicios[i]:inicios[i + 1]], com o
+    # peso de cada aresta na mesma posição de pesos (None em grafos sem peso)
+    __slots__ = ('rotulos', '_indice', 'inicios', 'destinos', 'pesos')
+
+    def __init__(self, rotulos, inicios, destinos, pesos=None):
+        # inicios/destinos/pesos podem ser arrays ou memoryviews (ex.: de um
+        # arquivo mapeado em memória); rotulos pode ser qualquer sequência
+        self.rotulos = rotulos if isinstance(rotulos, Sequence) else list(rotulos)
+        self._indice = None
+        self.inicios = inicios
+        self.destinos = destinos
+        self.pesos = pesos
+
+    @property
+    def indice(self):
+        # Construído só na primeira consulta por rótulo
+        if self._indice is None:
+            self._indice = {rotulo: i for i, rotulo in enumerate(self.rotulos)}
+        return self._indice
+
+    @staticmethod
+    def _internar(grafo):
+        # Rótulos na ordem das chaves, seguidos dos vizinhos que não são chaves
+        rotulos = list(grafo)
+        indice = {rotulo: i for i, rotulo in enumerate(rotulos)}
+        for vizinhos in grafo.values():
+            for vizinho in vizinhos:
+                if vizinho not in indice:
+                    indice[vizinho] = len(rotulos)
+                    rotulos.append(vizinho)
+        return rotulos, indice
+
+    @classmethod
+    def de_listas(cls, grafo):
+        # Formato de Q1 e Q3: {vértice: [vizinhos]}
+        rotulos, indice = cls._internar(grafo)
+        inicios, destinos = array('q', [0]), array('q')
+        for rotulo in rotulos:
+            destinos.extend(indice[vizinho] for vizinho in grafo.get(rotulo, ()))
+            inicios.append(len(destinos))
+        return cls(rotulos, inicios, destinos)
+
+    @classmethod
+    def de_dicts(cls, grafo):
+        # Formato de Q4: {vértice: {vizinho: peso}}
+        rotulos, indice = cls._internar(grafo)
+        inicios, destinos, pesos = array('q', [0]), array('q'), array('d')
+        vazio = {}
+        for rotulo in rotulos:
+            for vizinho, peso in grafo.get(rotulo, vazio).items():
+                destinos.append(indice[vizinho])
+                pesos.append(peso)
+            inicios.append(len(destinos))
+        return cls(rotulos, inicios, destinos, pesos)
+
+    @classmethod
+    def de_matriz(cls, matriz, rotulos=None):
+        # Formato de Q2: matriz de adjacência, com 0 significando "sem aresta"
+        inicios, destinos, pesos = array('q', [0]), array('q'), array('d')
+        for linha in matriz:
+            for j, peso in enumerate(linha):
+                if peso > 0:
+                    destinos.append(j)
+                    pesos.append(peso)
+            inicios.append(len(destinos))
+        return cls(rotulos if rotulos is not None else range(len(inicios) - 1), inicios, destinos, pesos)
+
+    @classmethod
+    def de_arestas(cls, rotulos, origens, destinos, pesos):
+        # Arestas não direcionadas (IDs) em qualquer ordem: counting sort pela
+        # origem, inserindo cada aresta nos dois sentidos
+        n = len(rotulos)
+        grau = array('q', bytes(8 * (n + 1)))
+        for u, v in zip(origens, destinos):
+            grau[u + 1] += 1
+            grau[v + 1] += 1
+        for i in range(n):
+            grau[i + 1] += grau[i]
+
+        inicios = array('q', grau)
+        total = inicios[n]
+        destinos_csr = array('q', bytes(8 * total))
+        pesos_csr = array('d', bytes(8 * total))
+        proximo = grau
+        for u, v, peso in zip(origens, destinos, pesos):
+            destinos_csr[proximo[u]], pesos_csr[proximo[u]] = v, peso
+            proximo[u] += 1
+            destinos_csr[proximo[v]], pesos_csr[proximo[v]] = u, peso
+            proximo[v] += 1
+        return cls(rotulos, inicios, destinos_csr, pesos_csr)
+
+    @property
+    def num_vertices(self):
+        return len(self.inicios) - 1
+
+    @property
+    def num_arestas(self):
+        # Arestas direcionadas armazenadas (cada aresta não direcionada conta duas vezes)
+        return len(self.destinos)
+
+    def vizinhos(self, i):
+        # Visão sem cópia dos IDs vizinhos de i
+        return memoryview(self.destinos)[self.inicios[i]:self.inicios[i + 1]]
+
+    def pesos_vizinhos(self, i):
+        # Visão sem cópia dos pesos das arestas que saem de i
+        return memoryview(self.pesos)[self.inicios[i]:self.inicios[i + 1]]
+
+    def arestas(self):
+        # Cada aresta não direcionada é devolvida uma única vez (u < v)
+        inicios, destinos, pesos = self.inicios, self.destinos, self.pesos
+        for u in range(self.num_vertices):
+            for k in range(inicios[u], inicios[u + 1]):
+                v = destinos[k]
+                if u < v:
+                    yield u, v, pesos[k] if pesos is not None else None
+
+    def para_listas(self):
+        rotulos = self.rotulos
+        return {rotulos[i]: [rotulos[v] for v in self.vizinhos(i)] for i in range(self.num_vertices)}
+
+    def para_dicts(self):
+        rotulos = self.rotulos
+        return {rotulos[i]: {rotulos[v]: peso for v, peso in zip(self.vizinhos(i), self.pesos_vizinhos(i))}
+                for i in range(self.num_vertices)}
@@ -0,0 +1,207 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from grafos.cli import Q3, Q4, carregar_grafo
+
+# Protocolo: uma consulta JSON por linha, {"id": ..., "tipo": "rota" | "caminho",
+# "origem": ..., "destino": ...}, e uma resposta JSON por linha com o mesmo
+# id: {"id", "distancia", "caminho"} ou {"id", "erro"}. As respostas de uma
+# conexão podem sair fora de ordem
+
+TIPOS = ('rota', 'caminho')
+
+_trabalhador = {}
+
+def _iniciar_trabalhador(arquivo):
+    # Cada processo carrega o grafo uma vez (um .grf é mapeado em memória e
+    # as páginas são compartilhadas entre os processos)
+    grafo = carregar_grafo(arquivo)
+    _trabalhador.update(grafo=grafo, motor=Q3.MotorCaminhos(grafo))
+
+def _aquecer():
+    # Tarefa vazia: só garante que o processo existe e já carregou o grafo
+    return os.getpid()
+
+def _caminho_indices(predecessores, fim):
+    caminho = [fim]
+    while predecessores[caminho[-1]] != -1:
+        caminho.append(predecessores[caminho[-1]])
+    caminho.reverse()
+    return caminho
+
+def resolver_grupo(tipo, origem, destinos):
+    # Todas as consultas de um lote com a mesma origem: uma árvore de
+    # caminhos mínimos (Dijkstra) ou uma BFS completa serve a todos os
+    # destinos. Recebe e devolve IDs; devolve [(distância, caminho)]
+    if tipo == 'caminho':
+        caminhos = _trabalhador['motor'].caminhos_de(origem, destinos)
+        return [(len(caminho) - 1, caminho) if caminho else (None, None) for caminho in caminhos]
+
+    distancias, predecessores = Q4.dijkstra_indices(_trabalhador['grafo'], origem)
+    return [(distancias[t], _caminho_indices(predecessores, t)) if distancias[t] != float('infinity')
+            else (None, None) for t in destinos]
+
+class ServidorConsultas:
+    # Servidor asyncio de consultas sobre um grafo fixo. As consultas que
+    # chegam dentro de uma janela curta formam um lote; o lote é agrupado por
+    # (tipo, origem) e cada grupo vira uma única tarefa no pool de processos
+    __slots__ = ('arquivo', 'grafo', 'janela', 'tamanho_lote', 'trabalhadores', 'fila', 'executor',
+                 '_agrupador', '_tarefas', '_vagas', 'lotes', 'grupos', 'consultas')
+
+    def __init__(self, arquivo, janela=0.002, tamanho_lote=1024, trabalhadores=None):
+        self.arquivo = arquivo
+        self.grafo = carregar_grafo(arquivo)
+        self.janela = janela
+        self.tamanho_lote = tamanho_lote
+        self.trabalhadores = trabalhadores or os.cpu_count() or 1
+        self.fila = None
+        self.executor = None
+        self._agrupador = None
+        self._tarefas = set()
+        self._vagas = None
+        self.lotes = self.grupos = self.consultas = 0
+
+    async def iniciar(self, host='127.0.0.1', porta=8765):
+        self.fila = asyncio.Queue()
+        self._vagas = asyncio.Semaphore(2 * self.trabalhadores)
+        # Processos criados com 'spawn' e todos antes de abrir o socket: um
+        # processo criado por fork depois herdaria as conexões abertas (de um
+        # cliente no mesmo processo, como em grafos.carga), e o servidor nunca
+        # veria o fim delas
+        self.executor = ProcessPoolExecutor(self.trabalhadores, mp_context=multiprocessing.get_context('spawn'),
+                                            initializer=_iniciar_trabalhador, initargs=(self.arquivo,))
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.executor, _aquecer) for _ in range(self.trabalhadores)))
+        self._agrupador = asyncio.create_task(self._agrupar())
+        return await asyncio.start_server(self._atender, host, porta)
+
+    def fechar(self):
+        if self._agrupador is not None:
+            self._agrupador.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+
+    def _id(self, rotulo):
+        # Rótulos inteiros podem chegar como texto e vice-versa
+        indice = self.grafo.indice
+        for candidato in (rotulo, str(rotulo)):
+            if candidato in indice:
+                return indice[candidato]
+        if isinstance(rotulo, str) and rotulo.lstrip('-').isdigit() and int(rotulo) in indice:
+            return indice[int(rotulo)]
+        raise ValueError(f"Vértice '{rotulo}' não existe no grafo")
+
+    def _validar(self, consulta):
+        tipo = consulta.get('tipo')
+        if tipo not in TIPOS:
+            raise ValueError(f"Tipo de consulta desconhecido: '{tipo}'")
+        if tipo == 'rota' and self.grafo.pesos is None:
+            raise ValueError("O grafo não tem pesos nas arestas")
+        return tipo, self._id(consulta.get('origem')), self._id(consulta.get('destino'))
+
+    async def consultar(self, consulta):
+        # Entra no próximo lote e espera a resposta (dict sem o id)
+        try:
+            tipo, origem, destino = self._validar(consulta)
+        except ValueError as e:
+            return {'erro': str(e)}
+        futuro = asyncio.get_running_loop().create_future()
+        await self.fila.put((tipo, origem, destino, futuro))
+        return await futuro
+
+    async def _atender(self, leitor, escritor):
+        pendentes = set()
+
+        async def responder(linha):
+            try:
+                consulta = json.loads(linha)
+                resposta = await self.consultar(consulta)
+                resposta['id'] = consulta.get('id')
+            except (ValueError, TypeError, AttributeError) as e:
+                resposta = {'id': None, 'erro': f"Consulta inválida: {e}"}
+            escritor.write(json.dumps(resposta, ensure_ascii=False).encode('utf-8') + b'\n')
+            await escritor.drain()
+
+        try:
+            while linha := await leitor.readline():
+                if linha.strip():
+                    tarefa = asyncio.create_task(responder(linha))
+                    pendentes.add(tarefa)
+                    tarefa.add_done_callback(pendentes.discard)
+            if pendentes:
+                await asyncio.gather(*pendentes, return_exceptions=True)
+        finally:
+            escritor.close()
+
+    async def _agrupar(self):
+        # Espera a primeira consulta e junta as que chegarem durante a janela.
+        # Só há 2 grupos por processo em andamento: com o pool ocupado, as
+        # consultas novas acumulam na fila e formam lotes maiores
+        while True:
+            lote = [await self.fila.get()]
+            if self.janela > 0:
+                await asyncio.sleep(self.janela)
+            while len(lote) < self.tamanho_lote and not self.fila.empty():
+                lote.append(self.fila.get_nowait())
+
+            grupos = {}
+            for tipo, origem, destino, futuro in lote:
+                grupos.setdefault((tipo, origem), []).append((destino, futuro))
+            self.lotes += 1
+            self.grupos += len(grupos)
+            self.consultas += len(lote)
+            for (tipo, origem), pedidos in grupos.items():
+                await self._vagas.acquire()
+                # Referência mantida até o fim para a tarefa não ser coletada
+                tarefa = asyncio.create_task(self._resolver(tipo, origem, pedidos))
+                self._tarefas.add(tarefa)
+                tarefa.add_done_callback(self._tarefas.discard)
+
+    async def _resolver(self, tipo, origem, pedidos):
+        loop = asyncio.get_running_loop()
+        rotulos = self.grafo.rotulos
+        try:
+            resultados = await loop.run_in_executor(self.executor, resolver_grupo, tipo, origem,
+                                                    [destino for destino, _ in pedidos])
+        except Exception as e:
+            for _, futuro in pedidos:
+                if not futuro.done():
+                    futuro.set_result({'erro': f"{e.__class__.__name__}: {e}"})
+            return
+        finally:
+            self._vagas.release()
+        for (_, futuro), (distancia, caminho) in zip(pedidos, resultados):
+            if not futuro.done():
+                futuro.set_result({'distancia': distancia,
+                                   'caminho': [rotulos[v] for v in caminho] if caminho else None})
+
+async def servir(arquivo, host='127.0.0.1', porta=8765, janela=0.002, trabalhadores=None):
+    servidor = ServidorConsultas(arquivo, janela, trabalhadores=trabalhadores)
+    tcp = await servidor.iniciar(host, porta)
+    print(f"Servindo '{arquivo}' ({servidor.grafo.num_vertices} vértices) em {host}:{porta}")
+    try:
+        async with tcp:
+            await tcp.serve_forever()
+    finally:
+        servidor.fechar()
+
+def main():
+    # Uso: python -m grafos.servidor ARQUIVO [--porta 8765] [--janela-ms 2] [-j N]
+    parser = argparse.ArgumentParser(description="Servidor local de consultas de rota/caminho com micro-lotes")
+    parser.add_argument('arquivo', help="grafo .grf, .json ou .csv")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8765)
+    parser.add_argument('--janela-ms', type=float, default=2.0, help="tempo de espera para formar um lote")
+    parser.add_argument('-j', '--trabalhadores', type=int, default=None)
+    args = parser.parse_args()
+    try:
+        asyncio.run(servir(args.arquivo, args.host, args.porta, args.janela_ms / 1000, args.trabalhadores))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
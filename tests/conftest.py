@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Os scripts Q1–Q4 não são pacotes: cada pasta entra no caminho de importação
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for pasta in ('Q1', 'Q2', 'Q3', 'Q4', ''):
+    sys.path.insert(0, os.path.join(RAIZ, pasta))
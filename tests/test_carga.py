@@ -0,0 +1,19 @@
+import json
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_carga_ponta_a_ponta(tmp_path):
+    # Servidor com pool de processos e clientes TCP no mesmo processo: precisa
+    # terminar (as conexões não podem vazar para os processos do pool)
+    saida = tmp_path / 'carga.json'
+    resultado = subprocess.run([sys.executable, '-m', 'grafos.carga', '--arestas', '2000', '--consultas', '200',
+                                '--conexoes', '8', '-j', '2', '--saida', str(saida)],
+                               cwd=RAIZ, capture_output=True, text=True, timeout=120)
+    assert resultado.returncode == 0, resultado.stderr
+    assert 'Traceback' not in resultado.stderr
+    for medida in json.loads(saida.read_text(encoding='utf-8')).values():
+        assert medida['consultas'] == 200
+        assert medida['erros'] == 0
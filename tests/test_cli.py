@@ -0,0 +1,28 @@
+import json
+
+from grafos.cli import Q1, carregar_grafo
+
+GRAFO_Q1 = {
+    8: [10, 9, 0], 10: [8, 11, 3], 9: [8, 4, 11], 11: [10, 7, 9],
+    0: [8, 1, 3, 4], 3: [10, 2, 7, 0], 4: [9, 0, 5, 7], 7: [11, 4, 6, 3],
+    1: [0, 12, 2, 5], 2: [1, 3, 14, 6], 5: [1, 4, 13, 6], 6: [7, 5, 15, 2],
+    12: [1, 13, 14], 13: [12, 15, 5], 14: [12, 2, 15], 15: [14, 13, 6]
+}
+
+def test_json_com_rotulos_inteiros(tmp_path):
+    # json.dump transforma as chaves em texto, mas os vizinhos continuam inteiros
+    arquivo = tmp_path / 'q1.json'
+    arquivo.write_text(json.dumps(GRAFO_Q1), encoding='utf-8')
+    grafo = carregar_grafo(str(arquivo))
+    assert grafo.num_vertices == len(GRAFO_Q1)
+    assert grafo.para_listas() == GRAFO_Q1
+
+    cores = Q1.algoritmo_guloso_coloracao(grafo)
+    assert set(cores) == set(GRAFO_Q1)
+    assert Q1.coloracao_valida(GRAFO_Q1, cores)
+
+def test_json_com_rotulos_texto(tmp_path):
+    labirinto = {'A': ['1'], '1': ['A', '2'], '2': ['1']}
+    arquivo = tmp_path / 'q3.json'
+    arquivo.write_text(json.dumps(labirinto), encoding='utf-8')
+    assert carregar_grafo(str(arquivo)).para_listas() == labirinto
@@ -0,0 +1,117 @@
+import random
+
+import pytest
+
+from componentes import IndiceAlcance, articulacoes_e_pontes
+from labirinto_grade import LabirintoGrade, gerar_labirinto
+
+def _componentes(grafo, sem_vertice=None, sem_aresta=None):
+    # Contagem ingênua, removendo um vértice ou uma aresta (uma ocorrência)
+    vistos = set()
+    num = 0
+    for s in grafo:
+        if s == sem_vertice or s in vistos:
+            continue
+        num += 1
+        vistos.add(s)
+        pilha = [s]
+        while pilha:
+            v = pilha.pop()
+            vizinhos = list(grafo[v])
+            if sem_aresta and v in sem_aresta:
+                vizinhos.remove(sem_aresta[1] if v == sem_aresta[0] else sem_aresta[0])
+            for w in vizinhos:
+                if w != sem_vertice and w not in vistos:
+                    vistos.add(w)
+                    pilha.append(w)
+    return num
+
+def _alcancaveis(grafo, s):
+    vistos = {s}
+    pilha = [s]
+    while pilha:
+        for w in grafo[pilha.pop()]:
+            if w not in vistos:
+                vistos.add(w)
+                pilha.append(w)
+    return vistos
+
+def _grafo_aleatorio(n, arestas, semente):
+    rng = random.Random(semente)
+    grafo = {v: [] for v in range(n)}
+    for _ in range(arestas):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            grafo[u].append(v)
+            grafo[v].append(u)
+    return grafo
+
+def test_casos_conhecidos():
+    # Dois triângulos ligados pela ponte 2–3, mais a cauda 5–6
+    grafo = {0: [1, 2], 1: [0, 2], 2: [0, 1, 3], 3: [2, 4, 5], 4: [3, 5], 5: [3, 4, 6], 6: [5]}
+    vertices, pontes = articulacoes_e_pontes(grafo)
+    assert sorted(vertices) == [2, 3, 5]
+    assert sorted(tuple(sorted(p)) for p in pontes) == [(2, 3), (5, 6)]
+
+    # Caminho: todos os internos são articulações e todas as arestas são pontes
+    vertices, pontes = articulacoes_e_pontes({'a': ['b'], 'b': ['a', 'c'], 'c': ['b']})
+    assert vertices == ['b'] and len(pontes) == 2
+
+    # Ciclo: nenhum gargalo
+    assert articulacoes_e_pontes({0: [1, 3], 1: [0, 2], 2: [1, 3], 3: [2, 0]}) == ([], [])
+
+def test_arestas_paralelas_nao_sao_pontes():
+    vertices, pontes = articulacoes_e_pontes({0: [1, 1], 1: [0, 0, 2], 2: [1]})
+    assert vertices == [1]
+    assert [tuple(sorted(p)) for p in pontes] == [(1, 2)]
+
+@pytest.mark.parametrize('semente', range(6))
+def test_articulacoes_e_pontes_contra_forca_bruta(semente):
+    grafo = _grafo_aleatorio(25, 30, semente)
+    base = _componentes(grafo)
+    vertices, pontes = articulacoes_e_pontes(grafo)
+    # Remover um vértice isolado some com o componente dele; uma articulação aumenta a contagem
+    esperados = [v for v in grafo if _componentes(grafo, sem_vertice=v) > base - (not grafo[v])]
+    assert sorted(vertices) == esperados
+    arestas = {(u, v) for u in grafo for v in grafo[u] if u < v}
+    assert sorted(tuple(sorted(p)) for p in pontes) == sorted(a for a in arestas if _componentes(grafo, sem_aresta=a) > base)
+
+def test_pontes_do_labirinto_perfeito():
+    # Num labirinto perfeito toda passagem é uma ponte
+    lab = gerar_labirinto(8, 6, semente=2)
+    _, pontes = articulacoes_e_pontes(lab)
+    assert len(pontes) == lab.num_celulas - 1
+
+def test_alcance_e_unioes_no_labirinto():
+    # Grade 4 × 1 sem passagens: quatro componentes isolados
+    lab = LabirintoGrade(4, 1)
+    alcance = IndiceAlcance(lab)
+    assert alcance.num_componentes == 4
+    assert not alcance.alcanca(0, 3)
+
+    assert alcance.abrir(0, 1)
+    assert alcance.abrir(2, 3)
+    assert alcance.num_componentes == 2
+    assert alcance.alcanca(1, 0) and alcance.alcanca(3, 2) and not alcance.alcanca(0, 3)
+    assert lab.aberta(0, 1) and lab.aberta(2, 3)
+
+    assert alcance.abrir(1, 2)
+    assert not alcance.abrir(0, 1)
+    assert alcance.num_componentes == 1
+    assert alcance.alcanca(0, 3) and alcance.tamanho_componente(3) == 4
+    assert not alcance.alcanca(0, 99)
+
+@pytest.mark.parametrize('semente', range(4))
+def test_alcance_contra_forca_bruta(semente):
+    rng = random.Random(semente)
+    grafo = _grafo_aleatorio(40, 25, semente)
+    alcance = IndiceAlcance(grafo)
+    assert alcance.num_componentes == _componentes(grafo)
+    for _ in range(15):
+        u, v = rng.randrange(40), rng.randrange(40)
+        alcance.abrir(u, v)
+        grafo[u].append(v)
+        grafo[v].append(u)
+        assert alcance.num_componentes == _componentes(grafo)
+        alcancaveis = _alcancaveis(grafo, 0)
+        assert [alcance.alcanca(0, a) for a in range(40)] == [a in alcancaveis for a in range(40)]
@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from dinamico import RedeDinamica
+from Q4 import dijkstra
+
+def _rede_aleatoria(n, arestas, rng):
+    grafo = {v: {} for v in range(n)}
+    for _ in range(arestas):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            grafo[u][v] = rng.uniform(1.0, 10.0)
+    return grafo
+
+def _conferir(rede, origens, pais=True):
+    for origem in origens:
+        distancias, predecessores = rede.arvore(origem)
+        esperadas, esperados = dijkstra(rede.grafo, origem)
+        assert distancias == esperadas
+        if pais:
+            # Pesos float sorteados: sem empates, a árvore é única
+            assert predecessores == esperados
+        else:
+            for no, pai in predecessores.items():
+                if pai is not None:
+                    assert distancias[pai] + rede.grafo[pai][no] == distancias[no]
+
+def _atualizar(rede, rng, inteiro):
+    n = len(rede.grafo)
+    arestas = [(u, v) for u, vizinhos in rede.grafo.items() for v in vizinhos]
+    sorteio = rng.random()
+    if sorteio < 0.3 and arestas:
+        rede.remover_aresta(*rng.choice(arestas))
+    elif sorteio < 0.7 and arestas:
+        # Aumentos e reduções de peso
+        u, v = rng.choice(arestas)
+        fator = rng.choice((0.3, 0.8, 1.5, 4.0))
+        peso = max(1, round(rede.grafo[u][v] * fator)) if inteiro else rede.grafo[u][v] * fator
+        rede.alterar_peso(u, v, peso)
+    else:
+        # Às vezes a aresta leva a um nó novo
+        u, v = rng.randrange(n), rng.randrange(n + 1)
+        if u != v:
+            rede.inserir_aresta(u, v, rng.randint(1, 10) if inteiro else rng.uniform(1.0, 10.0))
+
+@pytest.mark.parametrize('semente', range(5))
+def test_arvores_iguais_ao_dijkstra(semente):
+    rng = random.Random(semente)
+    rede = RedeDinamica(_rede_aleatoria(60, 150, rng))
+    origens = rng.sample(range(60), 4)
+    for origem in origens:
+        rede.arvore(origem)
+    for _ in range(150):
+        _atualizar(rede, rng, inteiro=False)
+        _conferir(rede, origens)
+
+@pytest.mark.parametrize('semente', range(3))
+def test_arvores_com_pesos_inteiros(semente):
+    # Com empates só as distâncias são únicas; cada pai tem de fechar a distância
+    rng = random.Random(semente)
+    grafo = {v: {w: float(rng.randint(1, 5)) for w in vizinhos} for v, vizinhos in _rede_aleatoria(50, 150, rng).items()}
+    rede = RedeDinamica(grafo)
+    origens = rng.sample(range(50), 3)
+    for origem in origens:
+        rede.arvore(origem)
+    for _ in range(150):
+        _atualizar(rede, rng, inteiro=True)
+        _conferir(rede, origens, pais=False)
+
+def test_remocao_desconecta_subarvore():
+    rede = RedeDinamica({0: {1: 1}, 1: {2: 1, 3: 1}, 2: {}, 3: {4: 1}, 4: {}})
+    rede.arvore(0)
+    rede.remover_aresta(0, 1)
+    distancias, predecessores = rede.arvore(0)
+    assert distancias == {0: 0, 1: float('infinity'), 2: float('infinity'),
+                          3: float('infinity'), 4: float('infinity')}
+    assert all(pai is None for pai in predecessores.values())
+    assert rede.rota(0, 4) == (float('infinity'), None)
+
+    # Reconectada por outro caminho, mais caro
+    rede.inserir_aresta(0, 3, 5)
+    assert rede.rota(0, 4) == (6, [0, 3, 4])
+    _conferir(rede, [0])
@@ -0,0 +1,26 @@
+import json
+
+from grafos import Grafo
+from grafos.exportacao import exportar
+
+HOSTIL = '</script><script>alert(1)</script>'
+
+def test_rotulo_hostil_nao_fecha_o_script(tmp_path):
+    grafo = Grafo.de_listas({HOSTIL: ['b & c'], 'b & c': [HOSTIL, '<x>'], '<x>': ['b & c']})
+    arquivo = tmp_path / 'grafo.html'
+    exportar(grafo, str(arquivo))
+    html = arquivo.read_text(encoding='utf-8')
+    inicio = html.index('var nodes = new vis.DataSet([')
+    fim = html.index(']);\nvar edges', inicio)
+    dados = html[inicio:fim]
+    assert '</script>' not in dados
+    assert '<' not in dados and '>' not in dados
+    assert '\\u003c/script\\u003e' in dados
+
+def test_json_continua_valido(tmp_path):
+    grafo = Grafo.de_listas({HOSTIL: ['b & c'], 'b & c': [HOSTIL]})
+    arquivo = tmp_path / 'grafo.json'
+    exportar(grafo, str(arquivo), formato='json')
+    with open(arquivo, encoding='utf-8') as f:
+        dados = json.load(f)
+    assert {no['label'] for no in dados['nodes']} == {HOSTIL, 'b & c'}
@@ -0,0 +1,44 @@
+import math
+import random
+
+import pytest
+
+from hierarquia import HierarquiaContracao, construir_hierarquia, gerar_rede, verificar_hierarquia
+from Q4 import dijkstra
+
+def _grafo_aleatorio(n, arestas, direcionado, inteiro, semente):
+    rng = random.Random(semente)
+    grafo = {v: {} for v in range(n)}
+    for _ in range(arestas):
+        u, w = rng.randrange(n), rng.randrange(n)
+        if u == w:
+            continue
+        peso = rng.randint(1, 20) if inteiro else rng.uniform(0.1, 10.0)
+        grafo[u][w] = peso
+        if not direcionado:
+            grafo[w][u] = peso
+    return grafo
+
+@pytest.mark.parametrize('direcionado', (False, True))
+@pytest.mark.parametrize('inteiro', (True, False))
+@pytest.mark.parametrize('semente', range(3))
+def test_hierarquia_igual_ao_dijkstra(direcionado, inteiro, semente):
+    grafo = _grafo_aleatorio(120, 300, direcionado, inteiro, semente)
+    hierarquia = construir_hierarquia(grafo)
+    for origem in random.Random(semente).sample(list(grafo), 10):
+        esperadas = dijkstra(grafo, origem)[0]
+        for destino, esperado in esperadas.items():
+            distancia, caminho = hierarquia.rota(origem, destino)
+            assert math.isclose(distancia, esperado, rel_tol=1e-9)
+            if math.isinf(esperado):
+                assert caminho is None
+                continue
+            assert caminho[0] == origem and caminho[-1] == destino
+            custo = sum(grafo[a][b] for a, b in zip(caminho, caminho[1:]))
+            assert math.isclose(custo, esperado, rel_tol=1e-9)
+
+def test_indice_salvo_e_carregado(tmp_path):
+    grafo = gerar_rede(500)
+    arquivo = str(tmp_path / 'indice.chq4')
+    construir_hierarquia(grafo).salvar(arquivo)
+    assert verificar_hierarquia(grafo, HierarquiaContracao.carregar(arquivo))
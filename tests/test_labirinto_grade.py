@@ -0,0 +1,51 @@
+import pytest
+
+from labirinto_grade import GERADORES, LabirintoGrade, de_dict, gerar_labirinto, para_dict, resolver_labirinto
+
+DIMENSOES = [(1, 1), (1, 7), (7, 1), (2, 2), (10, 6), (31, 17)]
+
+def _passagens(lab):
+    return sum(1 for c in range(lab.num_celulas) for _ in lab.vizinhos(c)) // 2
+
+def _alcancaveis(lab):
+    vistos = {0}
+    pilha = [0]
+    while pilha:
+        for _, v in lab.vizinhos(pilha.pop()):
+            if v not in vistos:
+                vistos.add(v)
+                pilha.append(v)
+    return len(vistos)
+
+@pytest.mark.parametrize('algoritmo', GERADORES)
+@pytest.mark.parametrize('largura, altura', DIMENSOES)
+@pytest.mark.parametrize('semente', range(3))
+def test_labirinto_perfeito(algoritmo, largura, altura, semente):
+    # Conexo e com exatamente largura · altura − 1 passagens: uma árvore
+    lab = gerar_labirinto(largura, altura, algoritmo, semente=semente)
+    assert _passagens(lab) == largura * altura - 1
+    assert _alcancaveis(lab) == largura * altura
+    caminho = resolver_labirinto(lab)
+    assert caminho[0] == 0 and caminho[-1] == lab.num_celulas - 1
+
+@pytest.mark.parametrize('algoritmo', GERADORES)
+def test_para_dict_e_de_dict(algoritmo):
+    lab = gerar_labirinto(9, 5, algoritmo, fracao_extra=0.2, semente=4)
+    copia = de_dict(para_dict(lab), 9, 5)
+    assert copia.bits == lab.bits
+    assert para_dict(copia) == para_dict(lab)
+
+@pytest.mark.parametrize('a, b', [(0, 2), (0, 4), (2, 3), (3, 2), (5, 6), (0, 0), (2, 8)])
+def test_abrir_rejeita_celulas_nao_adjacentes(a, b):
+    # Grade 3 × 3: 2 e 3 (ou 5 e 6) têm índices consecutivos, mas estão em linhas diferentes
+    lab = LabirintoGrade(3, 3)
+    with pytest.raises(ValueError, match="não são adjacentes"):
+        lab.abrir(a, b)
+    assert not any(lab.bits)
+
+def test_abrir_vale_nos_dois_sentidos():
+    lab = LabirintoGrade(3, 3)
+    lab.abrir(4, 3)
+    lab.abrir(1, 4)
+    assert lab.aberta(3, 4) and lab.aberta(4, 1)
+    assert sorted(v for _, v in lab.vizinhos(4)) == [1, 3]
@@ -0,0 +1,53 @@
+import pytest
+from benchmark_coloracao import gerar_grafo
+
+import Q1
+from grafos import Grafo
+
+def _arestas_paralelas():
+    # Multigrafo: 0–1 aparece três vezes, então remover 0 derruba o grau de 1 em 3
+    return {0: [1, 1, 1, 2], 1: [0, 0, 0, 2], 2: [0, 1, 3], 3: [2]}
+
+@pytest.mark.parametrize('estrategia', Q1.ESTRATEGIAS_ORDENACAO)
+def test_arestas_paralelas(estrategia):
+    grafo = _arestas_paralelas()
+    cores = Q1.algoritmo_guloso_coloracao(grafo, estrategia)
+    assert set(cores) == set(grafo)
+    assert Q1.coloracao_valida(grafo, cores)
+
+@pytest.mark.parametrize('semente', range(5))
+def test_menor_ultimo_em_multigrafos(semente):
+    # gerar_grafo sorteia pares com repetição, então há arestas paralelas
+    nucleo = Grafo.de_listas(gerar_grafo(300, grau_medio=12, semente=semente))
+    ordem = Q1.ordem_menor_ultimo(nucleo.inicios, nucleo.destinos)
+    assert sorted(ordem) == list(range(nucleo.num_vertices))
+    cores = Q1.algoritmo_guloso_coloracao(nucleo, 'menor_ultimo')
+    assert Q1.coloracao_valida(nucleo, cores)
+
+@pytest.mark.parametrize('semente', range(3))
+def test_dsatur(semente):
+    grafo = gerar_grafo(500, semente=semente)
+    cores = Q1.algoritmo_guloso_coloracao(grafo, 'dsatur')
+    assert Q1.coloracao_valida(grafo, cores)
+    grau_maximo = max(len(vizinhos) for vizinhos in grafo.values())
+    assert max(cores.values()) <= grau_maximo + 1
+
+def test_arestas_num_so_sentido():
+    # 1 -> 0 e 2 -> 1 só aparecem na linha do vértice maior
+    grafo = {0: [], 1: [0], 2: [1]}
+    invalida = {0: 1, 1: 1, 2: 2}
+    assert not Q1.coloracao_valida(grafo, invalida)
+    assert not Q1.coloracao_valida(Grafo.de_listas(grafo), invalida)
+    assert Q1.coloracao_valida(Grafo.de_listas(grafo), {0: 1, 1: 2, 2: 1})
+
+    # A visualização desenha as duas arestas
+    nucleo = Grafo.de_listas(Q1._simetrizar(grafo))
+    assert sorted((u, v) for u, v, _ in nucleo.arestas()) == [(0, 1), (1, 2)]
+
+def test_coloracao_paralela_com_arestas_num_so_sentido():
+    from coloracao_paralela import colorir_paralelo
+
+    grafo = {0: [1, 2], 1: [2], 2: [], 3: [0]}
+    cores, _ = colorir_paralelo(grafo, trabalhadores=2)
+    assert Q1.coloracao_valida(grafo, cores)
+    assert len({cores[0], cores[1], cores[2]}) == 3
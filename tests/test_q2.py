@@ -0,0 +1,69 @@
+import csv
+
+import pytest
+
+import Q2
+from grafos import Grafo
+from grafos.binario import carregar_binario, salvar_binario
+
+def _csv(tmp_path, texto, nome='grafo.csv'):
+    arquivo = tmp_path / nome
+    arquivo.write_text(texto, encoding='utf-8')
+    return str(arquivo)
+
+def test_lista_de_arestas_sem_cabecalho(tmp_path):
+    # 3 colunas e 4 linhas: não pode ser uma matriz de adjacência
+    arquivo = _csv(tmp_path, "a,b,1\nb,c,2\nc,d,3\na,d,10\n")
+    grafo, nomes = Q2.ler_grafo_csv(arquivo)
+    assert nomes == ['a', 'b', 'c', 'd']
+    mst = Q2.arvore_geradora_minima(grafo)
+    assert sum(peso for _, _, peso in mst) == 6
+
+def test_lista_de_arestas_nomeada_com_3_linhas(tmp_path):
+    # 3 linhas de 3 colunas, mas os rótulos não são números: não é matriz
+    arquivo = _csv(tmp_path, "A,B,5\nB,C,3\nA,C,4\n")
+    grafo, nomes = Q2.ler_grafo_csv(arquivo)
+    assert nomes == ['A', 'B', 'C']
+    assert sum(peso for _, _, peso in Q2.arvore_geradora_minima(grafo)) == 7
+
+def test_lista_de_arestas_numerica_sem_cabecalho(tmp_path):
+    # Antes lida como matriz 5 × 3, com destinos fora do intervalo de vértices
+    arquivo = _csv(tmp_path, "0,1,4\n1,2,1\n2,3,2\n3,4,7\n0,4,3\n")
+    grafo, _ = Q2.ler_grafo_csv(arquivo)
+    assert grafo.num_vertices == 5
+    for algoritmo in ('prim', 'kruskal'):
+        assert sum(peso for _, _, peso in Q2.arvore_geradora_minima(grafo, algoritmo)) == 10
+
+def test_matriz_3x3_sem_cabecalho_continua_matriz(tmp_path):
+    arquivo = _csv(tmp_path, "0,1,4\n1,0,2\n4,2,0\n")
+    grafo, _ = Q2.ler_grafo_csv(arquivo)
+    assert grafo.num_vertices == 3
+    assert sum(peso for _, _, peso in Q2.arvore_geradora_minima(grafo)) == 3
+
+    # O mesmo arquivo como lista de arestas, pedida explicitamente
+    grafo, nomes = Q2.ler_grafo_csv(arquivo, formato='arestas')
+    assert nomes == ['0', '1', '4', '2']
+
+@pytest.mark.parametrize('texto', ["0,1,2\n1,0\n2,1,0\n", "0,1\n1,0\n1,1\n", ",a,b\na,0,1\nb,1,0,5\n"])
+def test_matriz_nao_quadrada(tmp_path, texto):
+    arquivo = _csv(tmp_path, texto)
+    with open(arquivo, encoding='utf-8') as f:
+        leitor = csv.reader(f)
+        with pytest.raises(ValueError, match="não é quadrada"):
+            Q2._ler_linhas_matriz(leitor, next(leitor))
+    # ler_grafo_csv informa o erro e não devolve grafo
+    assert Q2.ler_grafo_csv(arquivo) == (None, None)
+
+def test_floresta_com_rotulos_inteiros(tmp_path, capsys):
+    # Rótulos inteiros, como os de um .grf salvo a partir de uma matriz
+    grafo = Grafo.de_matriz([[0, 2, 0, 0], [2, 0, 0, 0], [0, 0, 0, 5], [0, 0, 5, 0]])
+    arquivo = str(tmp_path / 'floresta.grf')
+    salvar_binario(grafo, arquivo)
+    carregado = carregar_binario(arquivo)
+
+    mst = Q2.arvore_geradora_minima(carregado)
+    Q2.exibir_mst_console(mst, carregado.rotulos)
+    saida = capsys.readouterr().out
+    assert "floresta geradora mínima com 2 componentes" in saida
+    assert "Componente {0, 1} | Custo: 2" in saida
+    assert "Componente {2, 3} | Custo: 5" in saida
@@ -0,0 +1,91 @@
+import random
+from collections import deque
+
+import pytest
+
+import Q3
+from grafos import Grafo
+from labirinto_grade import gerar_labirinto, para_dict
+
+def _dfs_original(grafo, inicio, fim):
+    # dfs_path antes dos ponteiros de pai: copia o caminho a cada empilhamento
+    stack = [(inicio, [inicio])]
+    visitado = set()
+    while stack:
+        vertice, caminho = stack.pop()
+        if vertice not in visitado:
+            if vertice == fim:
+                return caminho
+            visitado.add(vertice)
+            for vizinho in grafo.get(vertice, []):
+                if vizinho not in visitado:
+                    stack.append((vizinho, caminho + [vizinho]))
+    return None
+
+def _distancias(grafo, inicio):
+    distancias = {inicio: 0}
+    fila = deque([inicio])
+    while fila:
+        v = fila.popleft()
+        for w in grafo.get(v, []):
+            if w not in distancias:
+                distancias[w] = distancias[v] + 1
+                fila.append(w)
+    return distancias
+
+def _labirintos():
+    # Perfeitos e com ciclos, com partes desconexas
+    grafos = [para_dict(gerar_labirinto(12, 9, algoritmo, fracao_extra, semente=1))
+              for algoritmo in ('backtracker', 'kruskal', 'wilson') for fracao_extra in (0.0, 0.3)]
+    grafos.append({'a': ['b', 'c'], 'b': ['a', 'c'], 'c': ['a', 'b', 'd'], 'd': ['c'], 'x': ['y'], 'y': ['x']})
+    return grafos
+
+def _pares(grafo, quantidade, semente=0):
+    rng = random.Random(semente)
+    nos = list(grafo)
+    return [(rng.choice(nos), rng.choice(nos)) for _ in range(quantidade)]
+
+def _valido(grafo, caminho, inicio, fim):
+    return (caminho[0] == inicio and caminho[-1] == fim
+            and all(b in grafo[a] for a, b in zip(caminho, caminho[1:])))
+
+@pytest.mark.parametrize('grafo', _labirintos())
+def test_dfs_igual_ao_original(grafo):
+    for inicio, fim in _pares(grafo, 40):
+        esperado = _dfs_original(grafo, inicio, fim)
+        assert Q3.dfs_path(grafo, inicio, fim) == esperado
+        assert Q3.dfs_path(Grafo.de_listas(grafo), inicio, fim) == esperado
+
+@pytest.mark.parametrize('grafo', _labirintos())
+@pytest.mark.parametrize('busca', (Q3.bfs_path, Q3.bidirectional_bfs_path))
+def test_bfs_da_o_menor_caminho(grafo, busca):
+    nucleo = Grafo.de_listas(grafo)
+    for inicio, fim in _pares(grafo, 40):
+        distancia = _distancias(grafo, inicio).get(fim)
+        for entrada in (grafo, nucleo):
+            caminho = busca(entrada, inicio, fim)
+            if distancia is None:
+                assert caminho is None
+            else:
+                assert _valido(grafo, caminho, inicio, fim)
+                assert len(caminho) - 1 == distancia
+
+@pytest.mark.parametrize('grafo', _labirintos())
+def test_buffers_reaproveitados_nao_vazam(grafo):
+    # O mesmo motor responde consultas de todos os modos intercaladas; cada
+    # resposta tem de ser a de um motor novo
+    pares = _pares(grafo, 60, semente=1)
+    motor = Q3.MotorCaminhos(grafo)
+    indice = motor.grafo.indice
+    modos = ('dfs', 'bfs', 'bidirecional')
+    for k, (inicio, fim) in enumerate(pares):
+        modo = modos[k % 3]
+        s, t = indice[inicio], indice[fim]
+        assert getattr(motor, modo)(s, t) == getattr(Q3.MotorCaminhos(grafo), modo)(s, t)
+        if k % 7 == 0:
+            destinos = [indice[fim] for _, fim in pares[:10]]
+            assert motor.caminhos_de(s, destinos) == Q3.MotorCaminhos(grafo).caminhos_de(s, destinos)
+
+    for modo in modos:
+        esperados = [Q3.MODOS_BUSCA[modo](grafo, inicio, fim) for inicio, fim in pares]
+        assert Q3.many_paths(grafo, pares, modo) == esperados
@@ -0,0 +1,87 @@
+import math
+import random
+
+import pytest
+
+import Q4
+from grafos import Grafo
+from grafos.geradores import GERADORES, gerar_grafo
+
+def _dicts_menor_peso(grafo):
+    # Como para_dicts, mas com arestas paralelas reduzidas à de menor peso
+    dicts = {v: {} for v in range(grafo.num_vertices)}
+    for u in range(grafo.num_vertices):
+        for v, peso in zip(grafo.vizinhos(u), grafo.pesos_vizinhos(u)):
+            dicts[u][v] = min(peso, dicts[u].get(v, peso))
+    return dicts
+
+@pytest.mark.parametrize('tipo', GERADORES)
+def test_dijkstra_csr_igual_ao_dict(tipo):
+    grafo = gerar_grafo(tipo, 5000, semente=3)
+    dicts = _dicts_menor_peso(grafo)
+    for origem in random.Random(0).sample(range(grafo.num_vertices), 5):
+        esperadas, _ = Q4.dijkstra(dicts, origem)
+        distancias, predecessores = Q4.dijkstra_indices(grafo, origem)
+        assert [esperadas[v] for v in range(grafo.num_vertices)] == list(distancias)
+        # Cada predecessor fecha a distância pela aresta mais curta até v
+        for v, p in enumerate(predecessores):
+            if p != -1:
+                assert distancias[p] + dicts[p][v] == distancias[v]
+
+def test_dijkstra_inalcancavel():
+    grafo = Grafo.de_dicts({'a': {'b': 2}, 'b': {'a': 2}, 'c': {}})
+    distancias, predecessores = Q4.dijkstra(grafo, 'a')
+    assert distancias == {'a': 0, 'b': 2, 'c': float('infinity')}
+    assert predecessores == {'a': None, 'b': 'a', 'c': None}
+
+def _matriz_aleatoria(n, inteira, zeros, semente):
+    # Assimétrica; zero fora da diagonal significa "sem estrada"
+    rng = random.Random(semente)
+    matriz = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(n):
+            if i != j and rng.random() >= zeros:
+                matriz[i][j] = rng.randint(1, 30) if inteira else rng.uniform(0.5, 30.0)
+    return matriz
+
+@pytest.mark.parametrize('inteira', (True, False))
+@pytest.mark.parametrize('zeros', (0.0, 0.3, 0.8))
+@pytest.mark.parametrize('semente', range(3))
+def test_poda_preserva_distancias(inteira, zeros, semente):
+    n = 40
+    matriz = _matriz_aleatoria(n, inteira, zeros, semente)
+    cidades = [f"C{i}" for i in range(n)]
+    completo = Q4.construir_grafo(cidades, matriz)
+    podados = [Q4.construir_grafo(cidades, matriz, podar=True),
+               Q4.podar_matriz(cidades, matriz, candidatos=None).para_dicts(),
+               Q4.podar_matriz(cidades, matriz, candidatos=3).para_dicts()]
+    assert sum(map(len, podados[1].values())) <= sum(map(len, completo.values()))
+    for origem in cidades:
+        esperadas = Q4.dijkstra(completo, origem)[0]
+        for podado in podados:
+            distancias = Q4.dijkstra(podado, origem)[0]
+            for cidade in cidades:
+                assert math.isclose(distancias[cidade], esperadas[cidade], rel_tol=1e-9)
+
+@pytest.mark.parametrize('semente', range(4))
+def test_metodos_de_rota_iguais_ao_dijkstra(semente):
+    # Estradas nunca mais curtas que a linha reta: a heurística é admissível
+    rng = random.Random(semente)
+    coordenadas = {i: (rng.uniform(37, 42), rng.uniform(-9.5, -6.5)) for i in range(60)}
+    linha_reta = Q4.heuristica_grande_circulo(coordenadas)
+    grafo = {i: {} for i in coordenadas}
+    for _ in range(200):
+        a, b = rng.sample(range(60), 2)
+        grafo[a][b] = grafo[b][a] = linha_reta(a, b) * rng.uniform(1.0, 1.5)
+
+    for origem, destino in ((rng.randrange(60), rng.randrange(60)) for _ in range(30)):
+        esperado = Q4.dijkstra(grafo, origem)[0][destino]
+        for metodo in ('dijkstra', 'bidirecional', 'astar'):
+            distancia, caminho, _ = Q4.rota_mais_curta(grafo, origem, destino, metodo, linha_reta)
+            assert math.isclose(distancia, esperado, rel_tol=1e-9)
+            if caminho is None:
+                assert math.isinf(esperado)
+            else:
+                custo = sum(grafo[a][b] for a, b in zip(caminho, caminho[1:]))
+                assert caminho[0] == origem and caminho[-1] == destino
+                assert math.isclose(custo, esperado, rel_tol=1e-9)